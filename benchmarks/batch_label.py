@@ -0,0 +1,240 @@
+"""Label recorded videos offline with the full detection stack on a process pool.
+
+Usage (from the repository root):
+
+    python -m benchmarks.batch_label VIDEO [VIDEO ...] --output labels.npz
+                                     [--workers N] [--chunk-frames 1800]
+                                     [--hands 1]
+
+Every video is split into chunks of --chunk-frames frames and the chunks
+are spread over a pool of worker processes, each with one MediaPipe Hands
+graph that is reset between chunks. Frames get the same preprocessing as
+HandTracker's mirror mode and go through hand association, skeleton
+smoothing, the gesture detector and the click handler. Tracking, gesture
+and click state restart at every chunk boundary.
+
+The output is one columnar .npz with a row per frame:
+
+    video, frame, timestamps            source video index, frame number, seconds
+    landmarks (rows, hands, 21, 3)      mirrored landmarks, NaN where no hand
+    handedness, scores, hand_ids        per hand slot; -1 where no hand
+    gestures                            index into gesture_names, -1 for NONE
+    touch_distance                      thumb tip to middle tip (click threshold)
+    finger_angle                        index/middle angle in radians (MODE_2)
+    click_rows, click_hands             row and hand slot of every click
+    videos, gesture_names, frame_size
+
+The timestamps/landmarks/handedness/scores/frame_size columns follow the
+LandmarkRecorder layout, so the output of a single video replays with
+benchmarks.replay_benchmark. Throughput is reported per core, from the
+time workers actually spent labelling.
+"""
+import argparse
+import math
+import multiprocessing as mp
+import os
+import sys
+import time
+
+import cv2
+import numpy as np
+
+from src.actuator import NullActuator
+from src.gesture_detector import GestureDetector
+from src.hand_landmarks import (
+    HANDEDNESS_CODES, INDEX_MCP, INDEX_TIP, MIDDLE_MCP, MIDDLE_TIP, NUM_LANDMARKS,
+    THUMB_TIP, hands_from_results, mirror_hands, pair_distances, segment_angles
+)
+from src.hand_registry import HandRegistry, HandState
+from src.skeleton_filter import SkeletonFilter
+
+_TOUCH_FIRST = np.array([THUMB_TIP])
+_TOUCH_SECOND = np.array([MIDDLE_TIP])
+_ANGLE_STARTS = np.array([INDEX_MCP, MIDDLE_MCP])
+_ANGLE_ENDS = np.array([INDEX_TIP, MIDDLE_TIP])
+
+# MediaPipe graph of this worker process
+_hands = None
+
+
+def _init_worker(max_hands):
+    global _hands
+    import mediapipe as mp_solutions
+    _hands = mp_solutions.solutions.hands.Hands(
+        static_image_mode=False,
+        max_num_hands=max_hands,
+        min_detection_confidence=0.7,
+        min_tracking_confidence=0.5
+    )
+
+
+def _finger_angle(points):
+    index_angle, middle_angle = segment_angles(points, _ANGLE_STARTS, _ANGLE_ENDS).tolist()
+    diff = abs(index_angle - middle_angle)
+    return 2 * math.pi - diff if diff > math.pi else diff
+
+
+def label_chunk(job):
+    """Label frames [start, stop) of one video; runs in a worker process"""
+    video, path, start, stop, max_hands = job
+    began = time.perf_counter()
+    _hands.reset()
+
+    cap = cv2.VideoCapture(path)
+    cap.set(cv2.CAP_PROP_POS_FRAMES, start)
+    fps = cap.get(cv2.CAP_PROP_FPS) or 30.0
+
+    rows = stop - start
+    landmarks = np.full((rows, max_hands, NUM_LANDMARKS, 3), np.nan, dtype=np.float32)
+    handedness = np.full((rows, max_hands), -1, dtype=np.int8)
+    scores = np.zeros((rows, max_hands), dtype=np.float32)
+    hand_ids = np.full((rows, max_hands), -1, dtype=np.int32)
+    gestures = np.full((rows, max_hands), -1, dtype=np.int8)
+    touch_distance = np.full((rows, max_hands), np.nan, dtype=np.float32)
+    finger_angle = np.full((rows, max_hands), np.nan, dtype=np.float32)
+    clicks = []
+
+    actuator = NullActuator()
+    skeleton_filter = SkeletonFilter(max_hands=max_hands)
+
+    registry = HandRegistry(lambda hand_id, slot: HandState.create(hand_id, slot, actuator),
+                            max_hands, skeleton_filter=skeleton_filter)
+    rgb = None
+    frames = 0
+
+    for row in range(rows):
+        ret, frame = cap.read()
+        if not ret:
+            break
+        frames += 1
+        timestamp = (start + row) / fps
+
+        # Same preprocessing as HandTracker's mirror mode
+        if rgb is None:
+            rgb = np.empty_like(frame)
+        cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=rgb)
+        hands = mirror_hands(hands_from_results(_hands.process(rgb)))
+
+        for state in registry.assign(hands, timestamp):
+            hand, slot = state.hand, state.slot
+            hand.smoothed = skeleton_filter.update(slot, hand.points)
+            mode = state.gesture_detector.detect_gesture_mode(hand.smoothed, timestamp)
+            if state.click_handler.handle_click_detection(hand.smoothed, mode, None) == "SINGLE_CLICK":
+                clicks.append((row, slot))
+
+            landmarks[row, slot] = hand.points
+            handedness[row, slot] = HANDEDNESS_CODES.get(hand.handedness, -1)
+            scores[row, slot] = hand.score
+            hand_ids[row, slot] = state.hand_id
+            gestures[row, slot] = state.gesture_detector.rules.index(mode)
+            touch_distance[row, slot] = pair_distances(hand.smoothed, _TOUCH_FIRST, _TOUCH_SECOND)[0]
+            finger_angle[row, slot] = _finger_angle(hand.smoothed)
+        for state in registry.states:
+            if state.hand is None:
+                skeleton_filter.reset(state.slot)
+
+    cap.release()
+    columns = {
+        'video': np.full(frames, video, dtype=np.int16),
+        'frame': np.arange(start, start + frames, dtype=np.int32),
+        'timestamps': np.arange(start, start + frames, dtype=np.float64) / fps,
+        'landmarks': landmarks[:frames],
+        'handedness': handedness[:frames],
+        'scores': scores[:frames],
+        'hand_ids': hand_ids[:frames],
+        'gestures': gestures[:frames],
+        'touch_distance': touch_distance[:frames],
+        'finger_angle': finger_angle[:frames],
+    }
+    clicks = np.array(clicks, dtype=np.int32).reshape(-1, 2)
+    return video, start, columns, clicks, time.perf_counter() - began
+
+
+def plan_chunks(paths, chunk_frames, max_hands):
+    """Split every readable video into (video, path, start, stop, max_hands) jobs"""
+    jobs = []
+    frame_size = (0, 0)
+    for video, path in enumerate(paths):
+        cap = cv2.VideoCapture(path)
+        if not cap.isOpened():
+            print(f"Error: Could not open video file {path}")
+            continue
+        count = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+        if frame_size == (0, 0):
+            frame_size = (int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)), int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT)))
+        cap.release()
+        for start in range(0, count, chunk_frames):
+            jobs.append((video, path, start, min(start + chunk_frames, count), max_hands))
+    return jobs, frame_size
+
+
+def label_videos(paths, workers=None, chunk_frames=1800, max_hands=1):
+    """Label videos on a process pool; returns (columns dict, stats dict)"""
+    workers = workers or os.cpu_count() or 1
+    jobs, frame_size = plan_chunks(paths, chunk_frames, max_hands)
+    # Longest chunks first keeps the pool busy until the end
+    jobs.sort(key=lambda job: job[3] - job[2], reverse=True)
+
+    started = time.perf_counter()
+    ctx = mp.get_context("spawn")
+    with ctx.Pool(workers, initializer=_init_worker, initargs=(max_hands,)) as pool:
+        results = pool.map(label_chunk, jobs, chunksize=1)
+    wall = time.perf_counter() - started
+
+    results.sort(key=lambda result: (result[0], result[1]))
+    names = GestureDetector().rules.names
+    columns = {key: np.concatenate([r[2][key] for r in results])
+               for key in (results[0][2] if results else ())}
+    offsets = np.cumsum([0] + [len(r[2]['frame']) for r in results])
+    clicks = np.concatenate([r[3] + (offset, 0) for r, offset in zip(results, offsets)]
+                            or [np.zeros((0, 2), dtype=np.int32)])
+    columns.update({
+        'click_rows': clicks[:, 0],
+        'click_hands': clicks[:, 1],
+        'videos': np.array(paths),
+        'gesture_names': np.array(names),
+        'frame_size': np.array(frame_size, dtype=np.int32),
+    })
+
+    frames = int(offsets[-1])
+    busy = sum(r[4] for r in results)
+    stats = {
+        'frames': frames,
+        'chunks': len(results),
+        'workers': workers,
+        'wall_s': wall,
+        'fps': frames / wall if wall else 0.0,
+        'fps_per_core': frames / busy if busy else 0.0,
+    }
+    return columns, stats
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("videos", nargs="+")
+    parser.add_argument("--output", "-o", required=True, help="columnar .npz to write")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument("--chunk-frames", type=int, default=1800)
+    parser.add_argument("--hands", type=int, default=1)
+    args = parser.parse_args(argv)
+
+    columns, stats = label_videos(args.videos, args.workers, args.chunk_frames, args.hands)
+    if not stats['frames']:
+        print("No frames labelled")
+        return 1
+    np.savez_compressed(args.output, **columns)
+
+    names = list(columns['gesture_names'])
+    labels = columns['gestures'][:, 0]
+    counts = ", ".join(f"{name} {int((labels == i).sum())}" for i, name in enumerate(names))
+    print(f"Labelled {stats['frames']} frames of {len(args.videos)} video(s) in {stats['chunks']} chunks "
+          f"on {stats['workers']} workers: {stats['wall_s']:.1f} s")
+    print(f"Throughput: {stats['fps']:.1f} fps total, {stats['fps_per_core']:.1f} fps per core")
+    print(f"Gestures (hand slot 0): {counts}, NONE {int((labels == -1).sum())}; "
+          f"{len(columns['click_rows'])} clicks")
+    print(f"Saved to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
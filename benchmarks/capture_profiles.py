@@ -0,0 +1,66 @@
+"""Find the best capture profile for a camera and cache it for startup.
+
+Usage (from the repository root):
+
+    python -m benchmarks.capture_profiles [SOURCE] [--frames 60]
+                                          [--formats MJPG,YUYV]
+                                          [--sizes 640x480,1280x720]
+                                          [--rates 60,30] [--exposure E]
+                                          [--cache PATH] [--no-save]
+
+SOURCE is a camera index (default 0), e.g. a v4l2loopback device, or a
+video file. Every pixel format, resolution and frame rate combination is
+applied in turn and the frames actually delivered are timed: delivered fps
+and, where the backend stamps frames with the monotonic clock as V4L2 does,
+the capture-to-read latency. The fastest profile (lowest latency, then
+fewest pixels, among those within 10% of the best rate) is stored per
+device and applied by CameraSource whenever that camera is opened.
+"""
+import argparse
+import sys
+
+from src.capture_profile import (
+    CANDIDATE_FORMATS, CANDIDATE_RATES, CANDIDATE_SIZES, ProfileCache, candidate_profiles,
+    device_key, negotiate_profile
+)
+
+
+def _sizes(text):
+    return tuple(tuple(int(v) for v in item.lower().split("x")) for item in text.split(","))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("source", nargs="?", default="0")
+    parser.add_argument("--frames", type=int, default=60, help="frames timed per profile")
+    parser.add_argument("--formats", default=",".join(CANDIDATE_FORMATS))
+    parser.add_argument("--sizes", type=_sizes, default=CANDIDATE_SIZES)
+    parser.add_argument("--rates", default=",".join(str(r) for r in CANDIDATE_RATES))
+    parser.add_argument("--exposure", type=float, default=None, help="manual exposure (default: auto)")
+    parser.add_argument("--cache", default=None, help="profile cache file")
+    parser.add_argument("--no-save", action="store_true")
+    args = parser.parse_args(argv)
+
+    candidates = candidate_profiles(args.formats.split(","), args.sizes,
+                                    [float(r) for r in args.rates.split(",")])
+    for profile in candidates:
+        profile.exposure = args.exposure
+    cache = None if args.no_save else ProfileCache(args.cache)
+
+    best, results = negotiate_profile(args.source, candidates, args.frames, cache)
+    if best is None:
+        print("No profile delivered frames")
+        return 1
+
+    print(f"{'requested':<28}{'delivered':<30}{'fps':>7}{'lat ms':>8}{'max ms':>8}")
+    for r in results:
+        latency = f"{r['latency_ms']:8.1f}{r['max_latency_ms']:8.1f}" if r['latency_ms'] is not None else f"{'-':>8}{'-':>8}"
+        print(f"{r['requested']!r:<28}{r['profile']!r:<30}{r['fps']:7.1f}{latency}")
+    print(f"Best: {best['profile']!r}")
+    if cache is not None:
+        print(f"Saved for {device_key(args.source)} in {cache.path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
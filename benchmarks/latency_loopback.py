@@ -0,0 +1,195 @@
+"""Motion-to-cursor latency loopback over a landmark stream with known onsets.
+
+Usage (from the repository root):
+
+    python -m benchmarks.latency_loopback [RECORDING.npz] [--frames N]
+                                          [--filter one_euro] [--backend null]
+                                          [--sync] [--output FILE]
+
+Plays a recording (or a synthetic stream when none is given) in real time
+through the skeleton filter, gesture detector, pointer filter and
+controllers, with input injected through the chosen backend. Each frame is
+stamped at "capture" and the AsyncActuator reports when every resulting
+event is actually issued. For every motion onset the latency is the time
+from the onset frame's capture to the first event answering its gesture (a
+cursor move for MODE_1 and MODE_3, a scroll for MODE_2) caused by that
+frame or a later one, so the number includes filter lag, controller
+thresholds and cooldowns as well as queueing and injection. The pointer
+filter is reset and the scroll anchor dropped whenever the gesture changes,
+so the controllers do not settle onto a new pose's fingertip during the
+hold. Onsets whose hold already produced such events are reported as
+unsettled and left out of the statistics, since their first event would
+not answer the motion itself.
+
+Synthetic streams carry scripted onsets. Recordings without them use
+onsets detected from fingertip motion, which trail the true start of motion
+by about a frame. Real backends move the actual pointer.
+"""
+import argparse
+import time
+
+import numpy as np
+
+from src.actuator import INPUT_BACKENDS, create_actuator
+from src.click_handler import ClickHandler
+from src.cursor_controller import CursorController
+from src.gesture_detector import GestureDetector
+from src.input_queue import AsyncActuator, HSCROLL, MOVE, SCROLL
+from src.landmark_recorder import load_recording, motion_onsets, recorded_hands, synthesize_recording
+from src.latency_monitor import GESTURE_MODES, LatencyMonitor
+from src.pointer_filter import POINTER_FILTERS, create_pointer_filter
+from src.scroll_controller import ScrollController
+from src.skeleton_filter import SkeletonFilter
+from src.stage_timer import dump_summary
+
+# Events that answer each gesture's motion; momentum scroll coasting on after
+# MODE_2 is left is not a response to a MODE_3 onset
+RESPONSES = {"MODE_1": (MOVE,), "MODE_2": (SCROLL, HSCROLL), "MODE_3": (MOVE,)}
+
+
+def run_loopback(recording, filter_name="one_euro", backend="null", threaded=True, hold=0.3):
+    """Play a recording in real time and return per-onset latencies.
+
+    Returns (results, monitor) where results is a list of
+    (onset frame, gesture mode, latency in seconds or None when the onset
+    produced no response before the next one, settled). settled is False
+    when the events that answer the onset's gesture were already issued
+    during the hold seconds before it.
+    """
+    onsets = recording.get('onsets')
+    if onsets is None or not len(onsets):
+        onsets = motion_onsets(recording)
+
+    width, height = (int(v) for v in recording['frame_size'])
+    frame_shape = (height or 480, width or 640, 3)
+
+    actuator = AsyncActuator(create_actuator(backend, 1920, 1080))
+    monitor = LatencyMonitor(enabled=True, log_events=True)
+    actuator.latency_monitor = monitor
+
+    skeleton_filter = SkeletonFilter(max_hands=1)
+    pointer_filter = create_pointer_filter(filter_name)
+    gesture_detector = GestureDetector()
+    click_handler = ClickHandler(actuator)
+    cursor_controller = CursorController(1920, 1080, actuator)
+    scroll_controller = ScrollController(actuator)
+
+    timestamps = recording['timestamps'] - recording['timestamps'][0]
+    captured = np.zeros(len(timestamps))
+    modes = ["NONE"] * len(timestamps)
+    previous_mode = None
+
+    if threaded:
+        actuator.start()
+    start = time.perf_counter()
+    try:
+        for index, offset in enumerate(timestamps):
+            delay = start + offset - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            captured[index] = time.perf_counter()
+
+            hands = recorded_hands(recording, index)
+            if not hands:
+                skeleton_filter.reset()
+                pointer_filter.reset()
+                scroll_controller.release()
+                previous_mode = None
+                continue
+            hand = hands[0]
+            points = skeleton_filter.update(0, hand.points)
+            mode = gesture_detector.detect_gesture_mode(points)
+            modes[index] = mode
+            if mode != previous_mode:
+                # A new pose has its fingertip elsewhere; start the filter
+                # there instead of letting it settle into a cursor move
+                pointer_filter.reset()
+                previous_mode = mode
+
+            position = gesture_detector.get_finger_tip_position(hand.points, frame_shape, mode)
+            if position[0] is None:
+                continue
+            actuator.set_origin(captured[index], mode)
+            position = pointer_filter.filter(position, captured[index], time.perf_counter())
+            if mode != "MODE_2":
+                # As in HandTracker, leaving the scroll gesture drops its anchor
+                scroll_controller.release()
+            if mode in ("MODE_1", "MODE_3"):
+                click_handler.handle_click_detection(points, mode, position)
+                cursor_controller.calculate_relative_position(position, mode)
+            elif mode == "MODE_2":
+                scroll_controller.handle_scroll_control(position, mode, captured[index])
+            actuator.set_origin(None)
+    finally:
+        actuator.stop()
+        actuator.actuator.close()
+
+    results = []
+    for i, onset in enumerate(onsets):
+        onset_time = captured[onset]
+        end = captured[onsets[i + 1]] if i + 1 < len(onsets) else np.inf
+        hold_start = captured[np.searchsorted(timestamps, timestamps[onset] - hold)]
+        responses = [(injected, origin) for injected, origin, kind, _ in monitor.events
+                     if kind in RESPONSES.get(modes[onset], ())]
+        settled = not any(hold_start <= origin < onset_time for _, origin in responses)
+        latency = next((injected - onset_time for injected, origin in responses
+                        if onset_time <= origin < end), None)
+        results.append((int(onset), modes[onset], latency, settled))
+    return results, monitor
+
+
+def print_report(results, monitor):
+    print(f"{'onset':>6}  {'mode':<8}{'latency ms':>12}")
+    for onset, mode, latency, settled in results:
+        if not settled:
+            text = f"{'unsettled':>12}"
+        elif latency is None:
+            text = f"{'no event':>12}"
+        else:
+            text = f"{latency * 1000.0:12.1f}"
+        print(f"{onset:>6}  {mode:<8}{text}")
+
+    print()
+    print("Onset to first response, by mode")
+    for mode in GESTURE_MODES:
+        values = np.array([latency for _, m, latency, settled in results
+                           if m == mode and settled and latency is not None])
+        missed = sum(1 for _, m, latency, settled in results if m == mode and settled and latency is None)
+        unsettled = sum(1 for _, m, _, settled in results if m == mode and not settled)
+        if not len(values) and not missed and not unsettled:
+            continue
+        if len(values):
+            print(f"  {mode:<8}p50 {np.percentile(values, 50) * 1000.0:6.1f} ms  "
+                  f"max {values.max() * 1000.0:6.1f} ms  n={len(values)}  missed={missed}  "
+                  f"unsettled={unsettled}")
+        else:
+            print(f"  {mode:<8}no events  missed={missed}  unsettled={unsettled}")
+
+    print("Capture to injection, all events")
+    for name, values in monitor.percentiles().items():
+        print(f"  {name:<12}p50 {values['p50_ms']:6.2f}  p95 {values['p95_ms']:6.2f}  "
+              f"p99 {values['p99_ms']:6.2f} ms  n={values['count']}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("recording", nargs="?", help="landmark .npz; synthetic stream if omitted")
+    parser.add_argument("--frames", type=int, default=540, help="synthetic stream length")
+    parser.add_argument("--filter", default="one_euro", choices=sorted(POINTER_FILTERS))
+    parser.add_argument("--backend", default="null", choices=[b for b in INPUT_BACKENDS if b != "auto"])
+    parser.add_argument("--sync", action="store_true", help="inject on the loop thread")
+    parser.add_argument("--output", help="write the capture-to-injection summary (.json or .csv)")
+    args = parser.parse_args(argv)
+
+    recording = load_recording(args.recording) if args.recording else synthesize_recording(args.frames)
+    results, monitor = run_loopback(recording, args.filter, args.backend, not args.sync)
+
+    print(f"Loopback over {len(recording['timestamps'])} frames, filter={args.filter}, "
+          f"backend={args.backend}, {'sync' if args.sync else 'async'} injection")
+    print_report(results, monitor)
+    if args.output:
+        dump_summary(monitor.percentiles(), args.output)
+
+
+if __name__ == "__main__":
+    main()
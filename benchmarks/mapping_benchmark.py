@@ -0,0 +1,73 @@
+"""Camera-to-desktop mapping cost, per point versus batched, on a multi-monitor layout.
+
+Usage (from the repository root):
+
+    python -m benchmarks.mapping_benchmark [session.npz] [--points N] [--repeat N]
+
+Maps index fingertip positions, from a recorded landmark stream or a
+synthetic one, onto a dual-monitor desktop (a 1920x1080 and a taller
+2560x1440 at 1.5x DPI, offset so part of the bounding box has no screen)
+with CoordinateMapper.map_to_screen point by point and with map_points in
+one call, checks that both agree and reports the time per point.
+"""
+import argparse
+import sys
+import time
+
+import numpy as np
+
+from src.coordinate_mapper import CoordinateMapper
+from src.hand_landmarks import INDEX_TIP
+from src.landmark_recorder import load_recording, synthesize_recording
+from src.monitor_layout import Monitor, MonitorLayout
+
+LAYOUT = MonitorLayout([
+    Monitor(0, 180, 1920, 1080, 1.0, "left", primary=True),
+    Monitor(1920, 0, 2560, 1440, 1.5, "right"),
+])
+
+
+def fingertips(recording, count):
+    """Camera-pixel index fingertips of the first hand, tiled to count points"""
+    width, height = (int(v) for v in recording['frame_size'])
+    tips = recording['landmarks'][:, 0, INDEX_TIP, :2]
+    tips = tips[~np.isnan(tips).any(axis=1)] * (width, height)
+    return np.resize(tips, (count, 2)), (width, height)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("recording", nargs="?")
+    parser.add_argument("--points", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    recording = load_recording(args.recording) if args.recording else synthesize_recording(900)
+    points, (width, height) = fingertips(recording, args.points)
+    margin = 25
+    mapper = CoordinateMapper({'left': margin, 'right': width - margin,
+                               'top': margin, 'bottom': height - margin}, LAYOUT)
+
+    scalar_times, batch_times = [], []
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        scalar = [mapper.map_to_screen(x, y) for x, y in points.tolist()]
+        scalar_times.append(time.perf_counter() - start)
+        start = time.perf_counter()
+        batch = mapper.map_points(points)
+        batch_times.append(time.perf_counter() - start)
+
+    mismatches = int((np.array(scalar) != batch).any(axis=1).sum())
+    per_monitor = np.bincount([LAYOUT.monitor_index(x, y) for x, y in batch.tolist()],
+                              minlength=len(LAYOUT.monitors))
+    print(f"Layout: {LAYOUT}")
+    for monitor, hits in zip(LAYOUT.monitors, per_monitor):
+        print(f"  {monitor}: {hits} points")
+    print(f"map_to_screen: {min(scalar_times) / len(points) * 1e6:.2f} us/point")
+    print(f"map_points:    {min(batch_times) / len(points) * 1e6:.3f} us/point")
+    print(f"Mismatches: {mismatches}")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,122 @@
+"""Per-frame cost of the control path with one versus two tracked hands.
+
+Usage (from the repository root):
+
+    python -m benchmarks.multi_hand_benchmark [--frames N] [--repeat N]
+                                              [--roles right=cursor,left=scroll]
+
+Replays synthetic one- and two-hand landmark streams through the same
+per-hand stack as HandTracker: HandRegistry association, skeleton smoothing,
+gesture detection, pointer filter and the hand's click, cursor and scroll
+controllers, with a NullActuator. Detections are shuffled every frame, as
+MediaPipe does not keep hand order, and the synthetic hands cross paths, so
+the identity switch count shows whether association keeps each hand's
+state. Inference cost is not included.
+"""
+import argparse
+import time
+
+import numpy as np
+
+from src.actuator import NullActuator
+from src.hand_registry import HAND_ROLES, HandRegistry, HandState
+from src.landmark_recorder import ReplayClock, recorded_hands, synthesize_recording
+from src.skeleton_filter import SkeletonFilter
+
+
+def replay(recording, roles, seed=0):
+    """Replay once; returns (per-frame ns, identity switches, actuator)"""
+    num_hands = recording['landmarks'].shape[1]
+    width, height = (int(v) for v in recording['frame_size'])
+    frame_shape = (height, width, 3)
+    rng = np.random.default_rng(seed)
+
+    clock = ReplayClock()
+    actuator = NullActuator(position=(960, 540))
+    skeleton_filter = SkeletonFilter(max_hands=num_hands)
+
+    registry = HandRegistry(lambda hand_id, slot: HandState.create(hand_id, slot, actuator, clock=clock),
+                            num_hands, roles, skeleton_filter=skeleton_filter)
+    samples = np.zeros(len(recording['timestamps']), dtype=np.int64)
+    identities = {}
+    switches = 0
+
+    for index, timestamp in enumerate(recording['timestamps']):
+        clock.now = float(timestamp)
+        hands = recorded_hands(recording, index)
+        truth = {id(hand): i for i, hand in enumerate(hands)}
+        order = rng.permutation(len(hands))
+        hands = [hands[i] for i in order]
+
+        start = time.perf_counter_ns()
+        states = registry.assign(hands, float(timestamp))
+        for state in states:
+            state.hand.smoothed = skeleton_filter.update(state.slot, state.hand.points)
+        for state in registry.states:
+            if state.hand is None:
+                skeleton_filter.reset(state.slot)
+                state.pointer_filter.reset()
+        for state in states:
+            points = state.hand.smoothed
+            mode = state.gesture_detector.detect_gesture_mode(points, float(timestamp))
+            position = state.gesture_detector.get_finger_tip_position(state.hand.points, frame_shape, mode)
+            if position[0] is None:
+                continue
+            position = state.pointer_filter.filter(position, float(timestamp))
+            mode = mode if state.allows(mode) else "NONE"
+            if mode in ("MODE_1", "MODE_3"):
+                state.click_handler.handle_click_detection(points, mode, position)
+                state.cursor_controller.calculate_relative_position(position, mode)
+            elif mode == "MODE_2":
+                state.scroll_controller.handle_scroll_control(position, mode)
+        samples[index] = time.perf_counter_ns() - start
+
+        for state in states:
+            true_hand = truth[id(state.hand)]
+            if identities.get(true_hand, state.hand_id) != state.hand_id:
+                switches += 1
+            identities[true_hand] = state.hand_id
+        if not hands:
+            identities.clear()
+
+    present = recording['handedness'][:, 0] >= 0
+    return samples[present], switches, actuator
+
+
+def parse_roles(text):
+    roles = {}
+    for item in filter(None, text.split(",")):
+        label, role = item.split("=")
+        if role not in HAND_ROLES:
+            raise argparse.ArgumentTypeError(f"unknown role {role!r}")
+        roles[label.strip().capitalize()] = role
+    return roles
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--frames", type=int, default=900)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--roles", type=parse_roles, default=parse_roles("right=cursor,left=scroll"))
+    args = parser.parse_args(argv)
+
+    print(f"{'hands':>5}{'us/frame':>10}{'p50 us':>9}{'p99 us':>9}{'x1 hand':>9}{'id switches':>13}"
+          f"{'moves':>7}{'clicks':>7}{'scrolls':>8}")
+    base = None
+    for num_hands in (1, 2):
+        recording = synthesize_recording(args.frames, num_hands=num_hands)
+        runs = []
+        total_switches = 0
+        for seed in range(args.repeat):
+            samples, switches, actuator = replay(recording, args.roles, seed)
+            runs.append(samples)
+            total_switches += switches
+        values = np.concatenate(runs) / 1000.0
+        mean = values.mean()
+        base = base or mean
+        print(f"{num_hands:>5}{mean:>10.1f}{np.percentile(values, 50):>9.1f}{np.percentile(values, 99):>9.1f}"
+              f"{mean / base:>9.2f}{total_switches:>13}{actuator.moves:>7}{actuator.clicks:>7}{actuator.scrolls:>8}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""Time the per-frame preprocessing that runs before hand inference.
+
+Usage (from the repository root):
+
+    python -m benchmarks.preprocess_benchmark [--width 640] [--height 480]
+                                              [--frames 2000] [--fps 30]
+
+Compares the flip-then-convert path (cv2.flip followed by cv2.cvtColor, two
+new full-frame images per frame) with the mirror path that converts the
+unflipped frame into a reused buffer and mirrors the landmark array instead.
+The mirror path is reported with and without the preview, which shrinks,
+mirrors and publishes a 320-pixel copy only on the frames PreviewFeed keeps
+at its own rate; that cost is averaged over every camera frame at --fps.
+"""
+import argparse
+import time
+
+import cv2
+import numpy as np
+
+from src.hand_landmarks import Hand, mirror_hands
+from src.preview_feed import PreviewFeed
+
+
+def _time(fn, frames, count):
+    start = time.perf_counter_ns()
+    for i in range(count):
+        fn(frames[i % len(frames)])
+    return (time.perf_counter_ns() - start) / count
+
+
+def run_benchmark(width=640, height=480, count=2000, fps=30.0):
+    """Return mean microseconds per frame for each preprocessing path"""
+    rng = np.random.default_rng(0)
+    frames = [rng.integers(0, 256, (height, width, 3), dtype=np.uint8) for _ in range(4)]
+    points = rng.random((21, 3), dtype=np.float32)
+    rgb_buffer = np.empty_like(frames[0])
+    feed = PreviewFeed()
+    # Camera time of the frame being processed, so the feed rate-limits as live
+    clock = [0.0]
+
+    def flip_then_convert(frame):
+        flipped = cv2.flip(frame, 1)
+        return cv2.cvtColor(flipped, cv2.COLOR_BGR2RGB)
+
+    def mirror(frame):
+        cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=rgb_buffer)
+        mirror_hands([Hand(points)])
+
+    def mirror_with_preview(frame):
+        mirror(frame)
+        clock[0] += 1.0 / fps
+        if feed.due(clock[0]):
+            feed.publish(feed.shrink(frame, mirror=True), clock[0])
+
+    results = {}
+    for name, fn in (("flip+convert", flip_then_convert),
+                     ("mirror", mirror),
+                     ("mirror+preview", mirror_with_preview)):
+        _time(fn, frames, count // 10)
+        results[name] = _time(fn, frames, count) / 1000.0
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--width", type=int, default=640)
+    parser.add_argument("--height", type=int, default=480)
+    parser.add_argument("--frames", type=int, default=2000)
+    parser.add_argument("--fps", type=float, default=30.0, help="camera rate the preview is paced against")
+    args = parser.parse_args(argv)
+
+    results = run_benchmark(args.width, args.height, args.frames, args.fps)
+    print(f"Preprocessing at {args.width}x{args.height}, {args.fps:g} fps camera")
+    for name, micros in results.items():
+        print(f"  {name:<16}{micros:8.1f} us/frame")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,223 @@
+"""Replay recorded landmark streams through the gesture/click/cursor/scroll stack.
+
+Usage (from the repository root):
+
+    python -m benchmarks.replay_benchmark record SOURCE OUT.npz [--frames N]
+    python -m benchmarks.replay_benchmark synth OUT.npz [--frames N] [--hands N]
+    python -m benchmarks.replay_benchmark run RECORDING.npz [--baseline FILE]
+                                          [--save-baseline] [--tolerance 0.25]
+
+`record` runs MediaPipe once over any frame source (camera index, video file,
+image directory). `synth` writes a scripted stream that needs no camera or
+model. `run` replays a stream through the hot-path classes with a
+NullActuator in place of pyautogui and a virtual clock driven by the recorded
+timestamps, then reports per-stage ns/frame, p50/p99 latency and peak
+allocated bytes per frame. With --baseline the results are compared against a
+stored JSON baseline and the process exits non-zero on regression. The gate
+uses the lowest per-repeat p50 and the allocations, which are stable from run
+to run; mean and p99 follow scheduler noise and are reported only.
+"""
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+from src.actuator import NullActuator
+from src.click_handler import ClickHandler
+from src.cursor_controller import CursorController
+from src.gesture_detector import GestureDetector
+from src.pointer_filter import create_pointer_filter
+from src.landmark_recorder import ReplayClock, load_recording, record_source, synthesize_recording
+from src.scroll_controller import ScrollController
+from src.skeleton_filter import SkeletonFilter
+
+STAGES = ("skeleton", "gesture", "filter", "click", "cursor", "scroll")
+# Metrics that fail the baseline comparison; the rest are informational
+GATED_METRICS = ('best_p50_ns', 'alloc_bytes_per_frame')
+
+
+def _build_frames(recording, hand_index=0):
+    """Split the recording into per-frame (timestamp, landmark array) pairs"""
+    frames = []
+    for timestamp, hands in zip(recording['timestamps'], recording['landmarks']):
+        points = hands[hand_index]
+        hand = None if np.isnan(points[0, 0]) else np.ascontiguousarray(points)
+        frames.append((float(timestamp), hand))
+    return frames
+
+
+def replay(recording, measure_allocations=False):
+    """Replay a recording once and return per-stage samples.
+
+    Returns a dict mapping stage name to an array of per-frame nanoseconds
+    (or peak allocated bytes when measure_allocations is True).
+    """
+    width, height = (int(v) for v in recording['frame_size'])
+    frame_shape = (height or 480, width or 640, 3)
+    frames = _build_frames(recording)
+
+    clock = ReplayClock()
+    actuator = NullActuator(position=(960, 540))
+    gesture_detector = GestureDetector()
+    click_handler = ClickHandler(actuator)
+    cursor_controller = CursorController(1920, 1080, actuator, clock=clock)
+    scroll_controller = ScrollController(actuator, clock=clock)
+    pointer_filter = create_pointer_filter()
+    skeleton_filter = SkeletonFilter(max_hands=1)
+
+    samples = {stage: np.zeros(len(frames), dtype=np.int64) for stage in STAGES}
+    counter = time.perf_counter_ns
+
+    def measure(stage, index, func, *args):
+        if measure_allocations:
+            tracemalloc.reset_peak()
+            base = tracemalloc.get_traced_memory()[0]
+            result = func(*args)
+            samples[stage][index] = tracemalloc.get_traced_memory()[1] - base
+        else:
+            start = counter()
+            result = func(*args)
+            samples[stage][index] = counter() - start
+        return result
+
+    for index, (timestamp, hand) in enumerate(frames):
+        clock.now = timestamp
+        if hand is None:
+            skeleton_filter.reset()
+            continue
+
+        smoothed = measure("skeleton", index, skeleton_filter.update, 0, hand)
+        mode = measure("gesture", index, gesture_detector.detect_gesture_mode, smoothed)
+        position = gesture_detector.get_finger_tip_position(hand, frame_shape, mode)
+        if position[0] is None:
+            continue
+        position = measure("filter", index, pointer_filter.filter, position, timestamp)
+
+        measure("click", index, click_handler.handle_click_detection, smoothed, mode, position)
+        measure("cursor", index, cursor_controller.calculate_relative_position, position, mode)
+        measure("scroll", index, scroll_controller.handle_scroll_control, position, mode)
+
+    present = np.array([hand is not None for _, hand in frames])
+    return {stage: values[present] for stage, values in samples.items()}, actuator
+
+
+def run_benchmark(recording, repeat=5):
+    """Replay repeatedly and summarise timing and allocation per stage"""
+    timings = {stage: [] for stage in STAGES}
+    for _ in range(repeat):
+        samples, actuator = replay(recording)
+        for stage in STAGES:
+            timings[stage].append(samples[stage])
+
+    tracemalloc.start()
+    try:
+        allocations, _ = replay(recording, measure_allocations=True)
+    finally:
+        tracemalloc.stop()
+
+    report = {}
+    for stage in STAGES:
+        values = np.concatenate(timings[stage])
+        medians = [np.percentile(run, 50) for run in timings[stage] if len(run)]
+        report[stage] = {
+            'ns_per_frame': float(values.mean()) if len(values) else 0.0,
+            'p50_ns': float(np.percentile(values, 50)) if len(values) else 0.0,
+            'best_p50_ns': float(min(medians)) if medians else 0.0,
+            'p99_ns': float(np.percentile(values, 99)) if len(values) else 0.0,
+            'alloc_bytes_per_frame': float(allocations[stage].mean()) if len(allocations[stage]) else 0.0,
+        }
+    report['_events'] = {'moves': actuator.moves, 'clicks': actuator.clicks, 'scrolls': actuator.scrolls,
+                         'hscrolls': actuator.hscrolls}
+    return report
+
+
+def compare_to_baseline(report, baseline, tolerance):
+    """Return a list of human readable regressions in the gated metrics"""
+    regressions = []
+    for stage in STAGES:
+        if stage not in baseline:
+            continue
+        for metric in GATED_METRICS:
+            old = baseline[stage].get(metric)
+            new = report[stage][metric]
+            if old and new > old * (1.0 + tolerance):
+                regressions.append(
+                    f"{stage}.{metric}: {new:.0f} vs baseline {old:.0f} (+{(new / old - 1) * 100:.0f}%)"
+                )
+    return regressions
+
+
+def print_report(report, frames):
+    print(f"Replayed {frames} frames")
+    print(f"{'stage':<10}{'ns/frame':>12}{'p50 ns':>12}{'best p50':>12}{'p99 ns':>12}{'alloc B/frame':>16}")
+    for stage in STAGES:
+        r = report[stage]
+        print(f"{stage:<10}{r['ns_per_frame']:>12.0f}{r['p50_ns']:>12.0f}{r['best_p50_ns']:>12.0f}"
+              f"{r['p99_ns']:>12.0f}{r['alloc_bytes_per_frame']:>16.1f}")
+    events = report['_events']
+    print(f"Actuator events: {events['moves']} moves, {events['clicks']} clicks, {events['scrolls']} scrolls, "
+          f"{events.get('hscrolls', 0)} horizontal scrolls")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    record_cmd = commands.add_parser("record", help="record landmarks from a frame source")
+    record_cmd.add_argument("source")
+    record_cmd.add_argument("output")
+    record_cmd.add_argument("--frames", type=int, default=None)
+    record_cmd.add_argument("--hands", type=int, default=1)
+
+    synth_cmd = commands.add_parser("synth", help="write a scripted landmark stream")
+    synth_cmd.add_argument("output")
+    synth_cmd.add_argument("--frames", type=int, default=900)
+    synth_cmd.add_argument("--hands", type=int, default=1)
+    synth_cmd.add_argument("--seed", type=int, default=0)
+
+    run_cmd = commands.add_parser("run", help="replay a recording and report timings")
+    run_cmd.add_argument("recording")
+    run_cmd.add_argument("--repeat", type=int, default=5)
+    run_cmd.add_argument("--baseline", default=None)
+    run_cmd.add_argument("--save-baseline", action="store_true")
+    run_cmd.add_argument("--tolerance", type=float, default=0.25)
+
+    args = parser.parse_args(argv)
+
+    if args.command == "record":
+        from src.frame_source import source_from_spec
+        source = source_from_spec(args.source, realtime=False)
+        return 0 if record_source(source, args.output, args.hands, args.frames) else 1
+
+    if args.command == "synth":
+        recording = synthesize_recording(args.frames, seed=args.seed, num_hands=args.hands)
+        np.savez_compressed(args.output, **recording)
+        print(f"Saved {args.frames} synthetic frames to {args.output}")
+        return 0
+
+    recording = load_recording(args.recording)
+    report = run_benchmark(recording, args.repeat)
+    print_report(report, len(recording['timestamps']))
+
+    if args.baseline and args.save_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump({stage: report[stage] for stage in STAGES}, f, indent=2)
+        print(f"Baseline saved to {args.baseline}")
+    elif args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare_to_baseline(report, baseline, args.tolerance)
+        if regressions:
+            print("PERFORMANCE REGRESSION against baseline:")
+            for line in regressions:
+                print(f"  {line}")
+            return 1
+        print("No regressions against baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,10 +1,16 @@
+import time
+
+# Launch time, before the heavy imports, for the time-to-first-frame report
+_launched_at = time.perf_counter()
+
 from src.hand_tracker import HandTracker
 from src.gui_interface import HandTrackerGUI
 
 if __name__ == "__main__":
-    # Initialize tracker without wake word detection
-    tracker = HandTracker()
+    # Initialize tracker without wake word detection. Construction is cheap;
+    # the model and camera load in the background once the GUI is up
+    tracker = HandTracker(started_at=_launched_at)
     
     # Initialize GUI with the tracker
     gui = HandTrackerGUI(tracker)
-    gui.run()
\ No newline at end of file
+    gui.run()
@@ -0,0 +1,317 @@
+import time
+
+
+class Actuator:
+    """Interface for everything that injects cursor moves, clicks and scrolls.
+
+    Backends may buffer events until flush(). position() can be an OS round
+    trip; cached_position() returns the last injected target instead when
+    one is known and is meant for display purposes.
+    """
+
+    name = "base"
+
+    def __init__(self):
+        self._last_target = None
+
+    def move_to(self, x, y):
+        raise NotImplementedError
+
+    def click(self):
+        raise NotImplementedError
+
+    def scroll(self, amount):
+        raise NotImplementedError
+
+    def hscroll(self, amount):
+        """Horizontal scroll, positive to the right"""
+        raise NotImplementedError
+
+    def position(self):
+        raise NotImplementedError
+
+    def null_event(self):
+        """Inject an event that changes nothing, for timing the backend.
+
+        Moves onto the last known cursor position, read from the OS when
+        nothing has been injected yet.
+        """
+        self.move_to(*self.cached_position())
+
+    def cached_position(self):
+        if self._last_target is not None:
+            return self._last_target
+        return self.position()
+
+    def flush(self):
+        """Push any buffered events to the OS"""
+
+    def close(self):
+        """Release backend resources"""
+
+
+class PyAutoGUIActuator(Actuator):
+    """Injects cursor moves, clicks and scrolls through pyautogui"""
+
+    name = "pyautogui"
+
+    def __init__(self, pause=0.01):
+        super().__init__()
+        import pyautogui
+        self._pyautogui = pyautogui
+
+        pyautogui.FAILSAFE = True
+        pyautogui.PAUSE = pause
+
+        try:
+            import pyautogui._pyautogui_win as pag_win
+            pag_win.MINIMUM_DURATION = 0
+            pag_win.MINIMUM_SLEEP = 0
+        except ImportError:
+            pass
+
+    def move_to(self, x, y):
+        self._pyautogui.moveTo(x, y)
+        self._last_target = (x, y)
+
+    def click(self):
+        self._pyautogui.click()
+
+    def scroll(self, amount):
+        self._pyautogui.scroll(amount)
+
+    def hscroll(self, amount):
+        self._pyautogui.hscroll(amount)
+
+    def position(self):
+        return tuple(self._pyautogui.position())
+
+
+class XTestActuator(Actuator):
+    """Injects events through the X11 XTest extension via python-xlib.
+
+    Events are queued on the X connection and sent together on flush(), so
+    a burst of moves costs one round trip and no sleeps.
+    """
+
+    name = "xtest"
+
+    def __init__(self, display_name=None):
+        super().__init__()
+        from Xlib import X, display
+        from Xlib.ext import xtest
+
+        self._X = X
+        self._xtest = xtest
+        self._display = display.Display(display_name)
+        if not self._display.has_extension('XTEST'):
+            self._display.close()
+            raise RuntimeError("X server does not support the XTEST extension")
+        self._root = self._display.screen().root
+
+    def move_to(self, x, y):
+        self._xtest.fake_input(self._display, self._X.MotionNotify, x=int(x), y=int(y))
+        self._last_target = (x, y)
+
+    def _button(self, button):
+        self._xtest.fake_input(self._display, self._X.ButtonPress, button)
+        self._xtest.fake_input(self._display, self._X.ButtonRelease, button)
+
+    def click(self):
+        self._button(1)
+
+    def scroll(self, amount):
+        # Same convention as pyautogui on X11: button 4 scrolls up, 5 down
+        button = 4 if amount > 0 else 5
+        for _ in range(abs(int(amount))):
+            self._button(button)
+
+    def hscroll(self, amount):
+        # Buttons 6 and 7 scroll left and right
+        button = 7 if amount > 0 else 6
+        for _ in range(abs(int(amount))):
+            self._button(button)
+
+    def position(self):
+        pointer = self._root.query_pointer()
+        return pointer.root_x, pointer.root_y
+
+    def flush(self):
+        self._display.flush()
+
+    def close(self):
+        self._display.close()
+
+
+class UInputActuator(Actuator):
+    """Injects events through a Linux uinput virtual device via python-evdev.
+
+    Works on X11 and Wayland but needs write access to /dev/uinput. The
+    device reports absolute coordinates scaled to the screen size; left and
+    top are the desktop position of its (0, 0), for desktops that extend
+    left of or above the primary monitor. uinput cannot read the pointer
+    back, so position() returns the last target.
+    """
+
+    name = "uinput"
+
+    def __init__(self, screen_width, screen_height, left=0, top=0):
+        super().__init__()
+        from evdev import AbsInfo, UInput, ecodes
+
+        self._ecodes = ecodes
+        capabilities = {
+            ecodes.EV_KEY: [ecodes.BTN_LEFT, ecodes.BTN_RIGHT],
+            ecodes.EV_REL: [ecodes.REL_WHEEL, ecodes.REL_HWHEEL],
+            ecodes.EV_ABS: [
+                (ecodes.ABS_X, AbsInfo(0, 0, screen_width - 1, 0, 0, 0)),
+                (ecodes.ABS_Y, AbsInfo(0, 0, screen_height - 1, 0, 0, 0)),
+            ],
+        }
+        self._device = UInput(capabilities, name="hand-tracker-pointer")
+        self._left = left
+        self._top = top
+        self._last_target = (left + screen_width // 2, top + screen_height // 2)
+        self._dirty = False
+
+    def move_to(self, x, y):
+        self._device.write(self._ecodes.EV_ABS, self._ecodes.ABS_X, int(x - self._left))
+        self._device.write(self._ecodes.EV_ABS, self._ecodes.ABS_Y, int(y - self._top))
+        self._last_target = (x, y)
+        self._dirty = True
+
+    def click(self):
+        # Press and release need separate reports to register as a click
+        self._device.write(self._ecodes.EV_KEY, self._ecodes.BTN_LEFT, 1)
+        self._device.syn()
+        self._device.write(self._ecodes.EV_KEY, self._ecodes.BTN_LEFT, 0)
+        self._dirty = True
+
+    def scroll(self, amount):
+        self._device.write(self._ecodes.EV_REL, self._ecodes.REL_WHEEL, int(amount))
+        self._dirty = True
+
+    def hscroll(self, amount):
+        self._device.write(self._ecodes.EV_REL, self._ecodes.REL_HWHEEL, int(amount))
+        self._dirty = True
+
+    def position(self):
+        return self._last_target
+
+    def null_event(self):
+        # position() is only the last target, so moving onto it could jump
+        # the real pointer; a zero wheel delta goes through the same path
+        self._device.write(self._ecodes.EV_REL, self._ecodes.REL_WHEEL, 0)
+        self._dirty = True
+
+    def flush(self):
+        if self._dirty:
+            self._device.syn()
+            self._dirty = False
+
+    def close(self):
+        self._device.close()
+
+
+class NullActuator(Actuator):
+    """Stands in for pyautogui without touching the OS.
+
+    Keeps a virtual cursor position and counts the events it receives so
+    the gesture, click, cursor and scroll stack can run headless.
+    """
+
+    name = "null"
+
+    def __init__(self, position=(0, 0)):
+        super().__init__()
+        self._position = tuple(position)
+        self.moves = 0
+        self.clicks = 0
+        self.scrolls = 0
+        self.hscrolls = 0
+
+    def move_to(self, x, y):
+        self._position = (x, y)
+        self.moves += 1
+
+    def click(self):
+        self.clicks += 1
+
+    def scroll(self, amount):
+        self.scrolls += 1
+
+    def hscroll(self, amount):
+        self.hscrolls += 1
+
+    def position(self):
+        return self._position
+
+
+class RecordingActuator(NullActuator):
+    """NullActuator that also keeps a timestamped log of every event"""
+
+    name = "recording"
+
+    def __init__(self, position=(0, 0)):
+        super().__init__(position)
+        self.events = []
+
+    def move_to(self, x, y):
+        super().move_to(x, y)
+        self.events.append((time.perf_counter(), "move", (x, y)))
+
+    def click(self):
+        super().click()
+        self.events.append((time.perf_counter(), "click", None))
+
+    def scroll(self, amount):
+        super().scroll(amount)
+        self.events.append((time.perf_counter(), "scroll", amount))
+
+    def hscroll(self, amount):
+        super().hscroll(amount)
+        self.events.append((time.perf_counter(), "hscroll", amount))
+
+
+INPUT_BACKENDS = ("auto", "pyautogui", "xtest", "uinput", "null", "recording")
+
+
+def create_actuator(backend="auto", screen_width=1920, screen_height=1080, screen_left=0, screen_top=0):
+    """Build an actuator by name; "auto" prefers XTest, then uinput, then pyautogui.
+
+    The screen rectangle is the whole virtual desktop, whose top-left corner
+    is (screen_left, screen_top).
+    """
+    center = (screen_left + screen_width // 2, screen_top + screen_height // 2)
+    if backend == "auto":
+        for candidate in ("xtest", "uinput"):
+            try:
+                return create_actuator(candidate, screen_width, screen_height, screen_left, screen_top)
+            except Exception as e:
+                print(f"Input backend {candidate} unavailable: {e}")
+        return PyAutoGUIActuator()
+
+    if backend == "pyautogui":
+        return PyAutoGUIActuator()
+    if backend == "xtest":
+        return XTestActuator()
+    if backend == "uinput":
+        return UInputActuator(screen_width, screen_height, screen_left, screen_top)
+    if backend == "null":
+        return NullActuator(center)
+    if backend == "recording":
+        return RecordingActuator(center)
+    raise ValueError(f"Unknown input backend: {backend}")
+
+
+def measure_event_cost(actuator, count=10):
+    """Average seconds per injected move event, including flush.
+
+    Injects the backend's null_event() so the measurement does not visibly
+    disturb the user.
+    """
+    start = time.perf_counter()
+    for _ in range(count):
+        actuator.null_event()
+        actuator.flush()
+    return (time.perf_counter() - start) / count
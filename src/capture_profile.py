@@ -0,0 +1,228 @@
+import json
+import math
+import os
+import time
+
+import cv2
+
+# Candidates tried by negotiate_profile unless told otherwise
+CANDIDATE_FORMATS = ("MJPG", "YUYV")
+CANDIDATE_SIZES = ((640, 480), (1280, 720))
+CANDIDATE_RATES = (60, 30)
+# A frame older than this when read means its stamp is not on our clock
+MAX_CAPTURE_LATENCY_MS = 500.0
+
+
+def _fourcc_name(code):
+    code = int(code)
+    if code <= 0:
+        return None
+    name = "".join(chr((code >> (8 * i)) & 0xFF) for i in range(4))
+    return name if name.isprintable() else None
+
+
+class CaptureProfile:
+    """Pixel format, resolution, frame rate and buffering for a camera.
+
+    fourcc None keeps the device's current pixel format; exposure None
+    leaves auto exposure on, otherwise it is a manual exposure value in the
+    backend's units (auto exposure often halves the frame rate in dim
+    light). buffer_size 1 keeps the driver from queueing stale frames.
+    """
+
+    def __init__(self, fourcc=None, width=640, height=480, fps=30.0, buffer_size=1, exposure=None):
+        self.fourcc = fourcc
+        self.width = width
+        self.height = height
+        self.fps = fps
+        self.buffer_size = buffer_size
+        self.exposure = exposure
+
+    def __repr__(self):
+        text = f"{self.fourcc or 'default'} {self.width}x{self.height} @ {self.fps:g} fps"
+        if self.exposure is not None:
+            text += f", exposure {self.exposure:g}"
+        return text
+
+    def key(self):
+        return (self.fourcc, self.width, self.height, round(self.fps), self.exposure)
+
+    def to_dict(self):
+        return {
+            'fourcc': self.fourcc,
+            'width': self.width,
+            'height': self.height,
+            'fps': self.fps,
+            'buffer_size': self.buffer_size,
+            'exposure': self.exposure,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data.get('fourcc'), int(data['width']), int(data['height']), float(data['fps']),
+                   int(data.get('buffer_size', 1)), data.get('exposure'))
+
+    def apply(self, cap):
+        """Configure an open VideoCapture; returns the profile it actually delivers.
+
+        The pixel format goes first, as it limits which sizes and rates the
+        driver accepts, and the rate after the size it depends on.
+        """
+        if self.fourcc:
+            cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*self.fourcc))
+        cap.set(cv2.CAP_PROP_FRAME_WIDTH, self.width)
+        cap.set(cv2.CAP_PROP_FRAME_HEIGHT, self.height)
+        if self.fps:
+            cap.set(cv2.CAP_PROP_FPS, self.fps)
+        if self.buffer_size:
+            cap.set(cv2.CAP_PROP_BUFFERSIZE, self.buffer_size)
+        if self.exposure is not None:
+            # V4L2 manual exposure mode
+            cap.set(cv2.CAP_PROP_AUTO_EXPOSURE, 1)
+            cap.set(cv2.CAP_PROP_EXPOSURE, self.exposure)
+        return self.read_back(cap, self.buffer_size, self.exposure)
+
+    @classmethod
+    def read_back(cls, cap, buffer_size=1, exposure=None):
+        """The profile an open VideoCapture is currently set to"""
+        return cls(_fourcc_name(cap.get(cv2.CAP_PROP_FOURCC)),
+                   int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)), int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT)),
+                   cap.get(cv2.CAP_PROP_FPS) or 0.0, buffer_size, exposure)
+
+
+def device_key(spec):
+    """Cache key of a camera index or video path.
+
+    V4L2 cameras are keyed by their device name, so the profile follows the
+    camera model rather than the /dev/videoN number it got this boot.
+    """
+    if isinstance(spec, int) or str(spec).isdigit():
+        try:
+            with open(f"/sys/class/video4linux/video{int(spec)}/name") as f:
+                return f"v4l2:{f.read().strip()}"
+        except OSError:
+            return f"camera:{int(spec)}"
+    return os.path.abspath(str(spec))
+
+
+class ProfileCache:
+    """Best capture profile per device, kept in a small JSON file"""
+
+    def __init__(self, path=None):
+        if path is None:
+            base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+            path = os.path.join(base, "hand_tracker", "capture_profiles.json")
+        self.path = path
+
+    def _load(self):
+        try:
+            with open(self.path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def get(self, key):
+        """Cached CaptureProfile for a device key, or None"""
+        entry = self._load().get(key)
+        if not entry:
+            return None
+        try:
+            return CaptureProfile.from_dict(entry['profile'])
+        except (KeyError, TypeError, ValueError):
+            return None
+
+    def put(self, key, profile, measurement=None):
+        entries = self._load()
+        entries[key] = {'profile': profile.to_dict(), 'measured': measurement or {}, 'saved_at': time.time()}
+        try:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            with open(self.path, "w") as f:
+                json.dump(entries, f, indent=2)
+        except OSError as e:
+            print(f"Could not save capture profile: {e}")
+
+
+def candidate_profiles(formats=CANDIDATE_FORMATS, sizes=CANDIDATE_SIZES, rates=CANDIDATE_RATES):
+    return [CaptureProfile(fourcc, width, height, fps)
+            for fourcc in formats for width, height in sizes for fps in rates]
+
+
+def measure_profile(cap, profile, frames=60, warmup=10):
+    """Apply a profile and time frame delivery.
+
+    Returns a dict with the profile actually delivered, the delivered fps
+    and, when the backend stamps frames with the monotonic clock (V4L2
+    does), the mean and worst capture-to-read latency in ms; None if no
+    frames arrive. The latencies are None when any frame's age is negative
+    or above MAX_CAPTURE_LATENCY_MS, which means the stamps come from some
+    other clock and would only skew the ranking.
+    """
+    actual = profile.apply(cap)
+    for _ in range(warmup):
+        if not cap.read()[0]:
+            return None
+
+    reads = []
+    ages = []
+    for _ in range(frames):
+        if not cap.read()[0]:
+            break
+        now = time.perf_counter()
+        reads.append(now)
+        # Buffer timestamp in ms, checked for plausibility below
+        ages.append(time.monotonic() * 1000.0 - cap.get(cv2.CAP_PROP_POS_MSEC))
+    if len(reads) < 2:
+        return None
+
+    fps = (len(reads) - 1) / (reads[-1] - reads[0])
+    valid = all(0.0 <= age <= MAX_CAPTURE_LATENCY_MS for age in ages)
+    return {
+        'profile': actual,
+        'fps': fps,
+        'latency_ms': sum(ages) / len(ages) if valid else None,
+        'max_latency_ms': max(ages) if valid else None,
+    }
+
+
+def best_measurement(results, fps_tolerance=0.9):
+    """Highest delivered rate first; among the profiles within fps_tolerance
+    of it, the lowest latency, then the fewest pixels to convert"""
+    if not results:
+        return None
+    top = max(r['fps'] for r in results)
+    fast = [r for r in results if r['fps'] >= fps_tolerance * top]
+    return min(fast, key=lambda r: (r['latency_ms'] if r['latency_ms'] is not None else math.inf,
+                                    r['profile'].width * r['profile'].height))
+
+
+def negotiate_profile(spec, candidates=None, frames=60, cache=None):
+    """Benchmark candidate profiles on a camera index or video path.
+
+    Profiles the device does not accept come back as whatever it falls
+    back to, so measurements are deduplicated on the delivered profile.
+    The best one is stored in cache (when given) under device_key(spec).
+    Returns (best measurement or None, all measurements).
+    """
+    cap = cv2.VideoCapture(int(spec) if str(spec).isdigit() else spec)
+    if not cap.isOpened():
+        print(f"Error: Could not open {spec}")
+        return None, []
+
+    results = []
+    seen = set()
+    try:
+        for profile in candidates or candidate_profiles():
+            result = measure_profile(cap, profile, frames)
+            if result is None or result['profile'].key() in seen:
+                continue
+            seen.add(result['profile'].key())
+            result['requested'] = profile
+            results.append(result)
+    finally:
+        cap.release()
+
+    best = best_measurement(results)
+    if best is not None and cache is not None:
+        cache.put(device_key(spec), best['profile'],
+                  {'fps': best['fps'], 'latency_ms': best['latency_ms']})
+    return best, results
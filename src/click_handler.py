@@ -1,45 +1,39 @@
 # File: /hand-tracker-project/hand-tracker-project/src/click_handler.py
 
-import pyautogui
-import time
+import numpy as np
+from .actuator import PyAutoGUIActuator
+from .hand_landmarks import THUMB_TIP, THUMB_IP, MIDDLE_TIP, MIDDLE_PIP
+
+# Thumb tip/middle tip and thumb IP/middle PIP pairs with their squared
+# touch thresholds (slightly larger threshold for the joints)
+_TOUCH_POINTS = np.array([THUMB_TIP, THUMB_IP, MIDDLE_TIP, MIDDLE_PIP])
+_TOUCH_THRESHOLDS_SQ = np.array([0.03, 0.03 * 1.2], dtype=np.float32) ** 2
 
 class ClickHandler:
-    def __init__(self):
+    def __init__(self, actuator=None):
+        self.actuator = actuator if actuator is not None else PyAutoGUIActuator()
         self.is_clicking = False
         self.click_debounce = 0
 
-    def detect_finger_touch(self, landmarks):
+    def detect_finger_touch(self, points):
         """Detect if middle finger and thumb tips are touching or very close"""
-        if not landmarks:
+        if points is None:
             return False
 
-        # Get thumb tip (landmark 4) and middle finger tip (landmark 12)
-        thumb_tip = landmarks.landmark[4]
-        middle_tip = landmarks.landmark[12]
-
-        # Also check intermediate joints for better detection
-        thumb_ip = landmarks.landmark[3]   # Thumb IP joint
-        middle_pip = landmarks.landmark[10]  # Middle finger PIP joint
-
-        # Calculate distance between thumb and middle finger tips
-        tip_distance = ((thumb_tip.x - middle_tip.x)**2 + (thumb_tip.y - middle_tip.y)**2)**0.5
-
-        # Also calculate distance between joints for more reliable detection
-        joint_distance = ((thumb_ip.x - middle_pip.x)**2 + (thumb_ip.y - middle_pip.y)**2)**0.5
-
-        # Check if either tips are close OR if the fingers are generally close together
-        tips_close = tip_distance < 0.03
-        joints_close = joint_distance < (0.03 * 1.2)  # Slightly larger threshold for joints
+        # Compare tips and intermediate joints in one go; either pair being
+        # close counts as a touch
+        touch_points = points[_TOUCH_POINTS, :2]
+        diff = touch_points[:2] - touch_points[2:]
 
-        return tips_close or joints_close
+        return bool(((diff * diff).sum(axis=1) < _TOUCH_THRESHOLDS_SQ).any())
 
-    def handle_click_detection(self, landmarks, mode, current_pos):
+    def handle_click_detection(self, points, mode, current_pos):
         """Handle simple single left click detection"""
         if mode != "MODE_1":
             return "NONE"
 
         # Check if fingers are touching
-        fingers_touching = self.detect_finger_touch(landmarks)
+        fingers_touching = self.detect_finger_touch(points)
 
         # Handle finger touch start
         if fingers_touching and not self.is_clicking and self.click_debounce <= 0:
@@ -50,7 +44,7 @@ class ClickHandler:
         # Handle finger touch release (perform single click)
         elif not fingers_touching and self.is_clicking:
             try:
-                pyautogui.click()
+                self.actuator.click()
             except Exception as e:
                 print(f"Single click error: {e}")
             self.is_clicking = False
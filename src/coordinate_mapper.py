@@ -1,29 +1,79 @@
-# File: /hand-tracker-project/hand-tracker-project/src/coordinate_mapper.py
+import numpy as np
+
 
 class CoordinateMapper:
-    def __init__(self, screen_width, screen_height, cam_width, cam_height, tracking_area):
-        self.screen_width = screen_width
-        self.screen_height = screen_height
-        self.cam_width = cam_width
-        self.cam_height = cam_height
-        self.tracking_area = tracking_area
-    
+    """Maps camera positions in the tracking area onto the virtual desktop.
+
+    The tracking area (camera pixels) is stretched over the bounding box of
+    the monitor layout, or of one monitor when target is its index. The
+    scale and offset of that affine transform are computed once, whenever
+    the layout, target or tracking area changes, not per point. Results
+    falling in a gap between monitors are moved onto the nearest monitor.
+    Mapping needs a layout; without one (set_layout() not called yet) it
+    raises ValueError.
+    """
+
+    def __init__(self, tracking_area, layout=None, target=None):
+        self.tracking_area = dict(tracking_area)
+        self.layout = layout
+        self.target = target
+        self._update()
+
+    def set_layout(self, layout, target=None):
+        self.layout = layout
+        self.target = target
+        self._update()
+
+    def set_tracking_area(self, tracking_area):
+        self.tracking_area = dict(tracking_area)
+        self._update()
+
+    def _update(self):
+        """Recompute the camera-to-desktop transform"""
+        area = self.tracking_area
+        self._area = (area['left'], area['top'], area['right'], area['bottom'])
+        if self.layout is None:
+            self.matrix = None
+            self._scalars = None
+            return
+        if self.target is None:
+            left, top, right, bottom = (self.layout.left, self.layout.top,
+                                        self.layout.right, self.layout.bottom)
+        else:
+            monitor = self.layout.monitors[self.target]
+            left, top = monitor.x, monitor.y
+            right, bottom = monitor.x + monitor.width - 1, monitor.y + monitor.height - 1
+
+        width = max(area['right'] - area['left'], 1)
+        height = max(area['bottom'] - area['top'], 1)
+        scale_x = (right - left) / width
+        scale_y = (bottom - top) / height
+        # desktop = matrix @ (cam_x, cam_y, 1)
+        self.matrix = np.array([[scale_x, 0.0, left - area['left'] * scale_x],
+                                [0.0, scale_y, top - area['top'] * scale_y]])
+        self._scalars = (scale_x, self.matrix[0, 2], scale_y, self.matrix[1, 2])
+
     def map_to_screen(self, cam_x, cam_y):
-        """Map camera coordinates to screen coordinates"""
-        # Constrain to tracking area
-        constrained_x = max(self.tracking_area['left'], 
-                           min(self.tracking_area['right'], cam_x))
-        constrained_y = max(self.tracking_area['top'], 
-                           min(self.tracking_area['bottom'], cam_y))
-        
-        # Convert to relative position within tracking area
-        rel_x = (constrained_x - self.tracking_area['left']) / (
-            self.tracking_area['right'] - self.tracking_area['left'])
-        rel_y = (constrained_y - self.tracking_area['top']) / (
-            self.tracking_area['bottom'] - self.tracking_area['top'])
-        
-        # Map to screen coordinates
-        screen_x = int(rel_x * self.screen_width)
-        screen_y = int(rel_y * self.screen_height)
-        
-        return screen_x, screen_y
\ No newline at end of file
+        """Map camera coordinates to desktop coordinates"""
+        self._require_layout()
+        area_left, area_top, area_right, area_bottom = self._area
+        cam_x = max(area_left, min(area_right, cam_x))
+        cam_y = max(area_top, min(area_bottom, cam_y))
+
+        scale_x, offset_x, scale_y, offset_y = self._scalars
+        x, y = self.layout.clamp(cam_x * scale_x + offset_x, cam_y * scale_y + offset_y)
+        return round(x), round(y)
+
+    def map_points(self, points):
+        """map_to_screen() for an (N, 2) array of camera positions; returns int32 (N, 2)"""
+        self._require_layout()
+        area_left, area_top, area_right, area_bottom = self._area
+        points = np.asarray(points, dtype=np.float64)
+        clipped = np.stack((np.clip(points[:, 0], area_left, area_right),
+                            np.clip(points[:, 1], area_top, area_bottom)), axis=-1)
+        desktop = clipped @ self.matrix[:, :2].T + self.matrix[:, 2]
+        return np.rint(self.layout.clamp_points(desktop)).astype(np.int32)
+
+    def _require_layout(self):
+        if self.layout is None:
+            raise ValueError("CoordinateMapper has no monitor layout; call set_layout() first")
@@ -1,14 +1,34 @@
 # filepath: /hand-tracker-project/hand-tracker-project/src/cursor_controller.py
-import pyautogui
+import math
 import time
-import numpy as np
-from .coordinate_mapper import CoordinateMapper
-from .stability_filter import StabilityFilter
+from .actuator import PyAutoGUIActuator
+from .monitor_layout import MonitorLayout
+from .transfer_function import POINTER_CURVES, TransferFunction
+
+# Gain curve of each cursor mode: MODE_1 is the precise 1:1 pointer, MODE_3
+# accelerates with hand speed (MODE_2 scrolls, its curve is only reported)
+DEFAULT_CURVES = {
+    'MODE_1': TransferFunction("linear", 1.0),
+    'MODE_2': TransferFunction("linear", 2.0),
+    'MODE_3': POINTER_CURVES['exponential'],
+}
 
 class CursorController:
-    def __init__(self, screen_width, screen_height):
+    def __init__(self, screen_width, screen_height, actuator=None, clock=time.time, layout=None,
+                 curves=None):
         self.screen_width = screen_width
         self.screen_height = screen_height
+        # Monitors the cursor may reach; a single screen unless given
+        self.layout = layout if layout is not None else MonitorLayout.single(screen_width, screen_height)
+        self.actuator = actuator if actuator is not None else PyAutoGUIActuator()
+        self.clock = clock
+        # Transfer function per mode, and the same tables multiplied by the
+        # user sensitivity (the GUI slider), rebuilt when either changes
+        self.curves = dict(DEFAULT_CURVES)
+        self.curves.update(curves or {})
+        self._sensitivity = 1.0
+        self._scaled_curves = {}
+        self._rebuild_curves()
         
         # Initialize missing attributes
         self.previous_mode = None
@@ -17,6 +37,30 @@ class CursorController:
         self.last_move_time = 0
         self.drag_active = False
         self.last_cursor_pos = None
+        # Motion is applied incrementally to a float cursor position, so
+        # the fractions of a pixel left after each move carry over
+        self._last_cam_pos = None
+        self._cursor = None
+        self._moving = False
+
+    @property
+    def sensitivity(self):
+        return self._sensitivity
+
+    @sensitivity.setter
+    def sensitivity(self, value):
+        if value != self._sensitivity:
+            self._sensitivity = value
+            self._rebuild_curves()
+
+    def set_curve(self, mode, curve):
+        """Use a TransferFunction for one mode"""
+        if self.curves.get(mode) is not curve:
+            self.curves[mode] = curve
+            self._rebuild_curves()
+
+    def _rebuild_curves(self):
+        self._scaled_curves = {mode: curve.scaled(self._sensitivity) for mode, curve in self.curves.items()}
 
     def calculate_relative_position(self, current_cam_pos, mode):
         if current_cam_pos is None:
@@ -31,86 +75,54 @@ class CursorController:
         # If mode changed or we don't have initial positions
         if mode != self.previous_mode or self.initial_position is None:
             self.initial_position = current_cam_pos
-            self.initial_cursor_pos = pyautogui.position()
+            self.initial_cursor_pos = self.actuator.position()
             self.previous_mode = mode
+            self._last_cam_pos = current_cam_pos
+            self._cursor = [float(self.initial_cursor_pos[0]), float(self.initial_cursor_pos[1])]
+            self._moving = False
 
             # Set a short cooldown to ignore movement
-            self.last_move_time = time.time()
+            self.last_move_time = self.clock()
             return None, None
 
         # Optional: Ignore small time intervals to prevent jitter
-        if time.time() - self.last_move_time < 0.05:
+        now = self.clock()
+        if now - self.last_move_time < 0.05:
             return None, None
 
-        delta_x = current_cam_pos[0] - self.initial_position[0]
-        delta_y = current_cam_pos[1] - self.initial_position[1]
-
-        # Ignore small movements
-        movement_threshold = 5
-        if abs(delta_x) < movement_threshold and abs(delta_y) < movement_threshold:
-            return None, None
-
-        # Remove this problematic line that resets positions every frame:
-        # self.initial_position = current_cam_pos
-        # self.initial_cursor_pos = pyautogui.position()
-
-        if mode == "MODE_1":
-            sensitivity = 1.0
-            scaled_delta_x = int(delta_x * sensitivity)
-            scaled_delta_y = int(delta_y * sensitivity)
-
-        elif mode == "MODE_3":
-            def exponential_scale(delta):
-                base_sensitivity = 1.0
-                exp_factor = 0.015
-                max_multiplier = 15.0
-
-                magnitude = abs(delta)
-                exp_component = 1 - np.exp(-exp_factor * magnitude)
-                multiplier = base_sensitivity + (max_multiplier - base_sensitivity) * exp_component
-
-                return int(delta * multiplier) if delta != 0 else 0
-
-            scaled_delta_x = exponential_scale(delta_x)
-            scaled_delta_y = exponential_scale(delta_y)
-
-        else:  # MODE_2
-            sensitivity = 2.0
-            scaled_delta_x = int(delta_x * sensitivity)
-            scaled_delta_y = int(delta_y * sensitivity)
-
-        new_cursor_x = self.initial_cursor_pos[0] + scaled_delta_x
-        new_cursor_y = self.initial_cursor_pos[1] + scaled_delta_y
-
-        new_cursor_x = max(0, min(self.screen_width - 1, new_cursor_x))
-        new_cursor_y = max(0, min(self.screen_height - 1, new_cursor_y))
+        # Ignore small movements until the finger first leaves the start
+        if not self._moving:
+            movement_threshold = 5
+            if (abs(current_cam_pos[0] - self.initial_position[0]) < movement_threshold and
+                    abs(current_cam_pos[1] - self.initial_position[1]) < movement_threshold):
+                return None, None
+            self._moving = True
+
+        delta_x = current_cam_pos[0] - self._last_cam_pos[0]
+        delta_y = current_cam_pos[1] - self._last_cam_pos[1]
+        curve = self._scaled_curves[mode]
+        if curve.input == "speed":
+            magnitude = math.hypot(delta_x, delta_y) / (now - self.last_move_time)
+        else:
+            magnitude = math.hypot(current_cam_pos[0] - self.initial_position[0],
+                                   current_cam_pos[1] - self.initial_position[1])
+        # Same physical distance on monitors of any DPI
+        gain = curve.gain(magnitude) * self.layout.gain_at(*self._cursor)
+
+        cursor_x, cursor_y = self.layout.clamp(self._cursor[0] + delta_x * gain,
+                                               self._cursor[1] + delta_y * gain)
+        self._cursor = [cursor_x, cursor_y]
+        self._last_cam_pos = current_cam_pos
+        new_cursor_x, new_cursor_y = round(cursor_x), round(cursor_y)
 
         # Update last move time
-        self.last_move_time = time.time()
+        self.last_move_time = now
 
-        if mode in ["MODE_1", "MODE_3"]:
+        if mode in ["MODE_1", "MODE_3"] and (new_cursor_x, new_cursor_y) != self.last_cursor_pos:
+            self.last_cursor_pos = (new_cursor_x, new_cursor_y)
             try:
-                pyautogui.moveTo(new_cursor_x, new_cursor_y)
+                self.actuator.move_to(new_cursor_x, new_cursor_y)
             except Exception as e:
                 print(f"Cursor movement error: {e}")
 
         return new_cursor_x, new_cursor_y
-
-
-    def map_to_screen_coordinates(self, cam_x, cam_y, tracking_area):
-        cam_x = max(tracking_area['left'], min(tracking_area['right'], cam_x))
-        cam_y = max(tracking_area['top'], min(tracking_area['bottom'], cam_y))
-        
-        tracking_width = tracking_area['right'] - tracking_area['left']
-        tracking_height = tracking_area['bottom'] - tracking_area['top']
-        
-        if tracking_width <= 0 or tracking_height <= 0:
-            return 0, 0
-        
-        rel_x = (cam_x - tracking_area['left']) / tracking_width
-        rel_y = (cam_y - tracking_area['top']) / tracking_height
-        
-        screen_x = int(rel_x * self.screen_width)
-        screen_y = int(rel_y * self.screen_height)
-        
-        return screen_x, screen_y
\ No newline at end of file
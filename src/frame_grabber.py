@@ -0,0 +1,106 @@
+import threading
+import time
+
+
+class FrameGrabber:
+    """Reads frames on a dedicated thread and keeps only the newest one.
+
+    The consumer always receives the most recent frame together with the
+    time it was captured; frames that were overwritten before being picked
+    up are counted as dropped instead of being queued. With drop_frames
+    False the grabber waits for each frame to be consumed instead, which
+    is what offline sources running as fast as possible need.
+    """
+
+    def __init__(self, cap, drop_frames=True):
+        self.cap = cap
+        self.drop_frames = drop_frames
+        # Minimum seconds between reads, raised while the tracker is idle
+        self.min_interval = 0.0
+        self._condition = threading.Condition()
+        self._frame = None
+        self._timestamp = None
+        self._seq = 0
+        self._consumed_seq = 0
+        self._thread = None
+
+        self.running = False
+        self.failed = False
+        self.frames_captured = 0
+        self.frames_dropped = 0
+
+    def start(self):
+        """Start the capture thread"""
+        if self._thread is not None:
+            return
+        self.running = True
+        self.failed = False
+        self._thread = threading.Thread(target=self._capture_loop, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop the capture thread and wake up any waiting consumer"""
+        self.running = False
+        with self._condition:
+            self._condition.notify_all()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout=1.0)
+        self._thread = None
+
+    def _capture_loop(self):
+        """Read frames as fast as the device delivers them"""
+        while self.running:
+            if not self.drop_frames:
+                with self._condition:
+                    self._condition.wait_for(
+                        lambda: self._seq == self._consumed_seq or not self.running
+                    )
+                if not self.running:
+                    break
+
+            if self.min_interval > 0:
+                time.sleep(self.min_interval)
+
+            ret, frame = self.cap.read()
+            timestamp = time.perf_counter()
+
+            if not ret:
+                print("Error: Could not read frame")
+                with self._condition:
+                    self.failed = True
+                    self._condition.notify_all()
+                break
+
+            with self._condition:
+                if self._seq > self._consumed_seq:
+                    self.frames_dropped += 1
+                self._frame = frame
+                self._timestamp = timestamp
+                self._seq += 1
+                self.frames_captured += 1
+                self._condition.notify_all()
+
+    def read_latest(self, timeout=1.0):
+        """Wait for a frame newer than the last one returned.
+
+        Returns (frame, capture_timestamp). The timestamp comes from
+        time.perf_counter(). Returns (None, None) on timeout, failure or stop.
+        """
+        with self._condition:
+            self._condition.wait_for(
+                lambda: self._seq > self._consumed_seq or self.failed or not self.running,
+                timeout
+            )
+            if self._seq == self._consumed_seq:
+                return None, None
+
+            self._consumed_seq = self._seq
+            frame, timestamp = self._frame, self._timestamp
+            self._frame = None
+            if not self.drop_frames:
+                self._condition.notify_all()
+            return frame, timestamp
+
+    def frame_age(self, timestamp):
+        """Seconds elapsed since the given capture timestamp"""
+        return time.perf_counter() - timestamp
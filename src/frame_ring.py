@@ -0,0 +1,65 @@
+from multiprocessing import shared_memory
+
+import numpy as np
+
+
+class FrameRing:
+    """Fixed ring of equally sized BGR frames in one shared memory block.
+
+    Any process that attaches by name gets NumPy views onto the same pages,
+    so frames written by one process are read by others without copies. A
+    header holds the sequence number last written to each slot, which lets
+    readers tell whether a slot has been overwritten since they were told
+    about it. The creating process owns the block and unlinks it.
+    """
+
+    def __init__(self, shm, shape, slots, owner):
+        self.shm = shm
+        self.shape = tuple(shape)
+        self.slots = slots
+        self.owner = owner
+
+        header_bytes = 8 * slots
+        frame_bytes = int(np.prod(self.shape))
+        self._seqs = np.ndarray((slots,), dtype=np.int64, buffer=shm.buf[:header_bytes])
+        self._frames = np.ndarray((slots,) + self.shape, dtype=np.uint8,
+                                  buffer=shm.buf[header_bytes:header_bytes + slots * frame_bytes])
+
+    @classmethod
+    def create(cls, shape, slots):
+        size = 8 * slots + slots * int(np.prod(shape))
+        ring = cls(shared_memory.SharedMemory(create=True, size=size), shape, slots, owner=True)
+        ring._seqs[:] = 0
+        return ring
+
+    @classmethod
+    def attach(cls, name, shape, slots):
+        # Workers are started from the creating process and share its
+        # resource tracker, so the block stays registered exactly once
+        return cls(shared_memory.SharedMemory(name=name), shape, slots, owner=False)
+
+    @property
+    def name(self):
+        return self.shm.name
+
+    def frame(self, slot):
+        """Writable view of one slot"""
+        return self._frames[slot]
+
+    def seq(self, slot):
+        return int(self._seqs[slot])
+
+    def set_seq(self, slot, seq):
+        self._seqs[slot] = seq
+
+    def close(self):
+        """Drop the views and detach; the owner also frees the block"""
+        self._seqs = None
+        self._frames = None
+        try:
+            self.shm.close()
+        except BufferError:
+            # A caller still holds a frame view; the mapping goes with the process
+            pass
+        if self.owner:
+            self.shm.unlink()
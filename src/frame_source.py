@@ -0,0 +1,362 @@
+import os
+import time
+
+import cv2
+import numpy as np
+
+from .capture_profile import CaptureProfile, ProfileCache, device_key
+
+
+class FrameSource:
+    """Base class for anything HandTracker can pull frames from.
+
+    Sources follow the cv2.VideoCapture calling convention: read() returns
+    (ret, frame) with a BGR frame. Recorded and generated sources are paced
+    to their nominal fps when realtime is True and run as fast as possible
+    otherwise. Live sources are paced by the device itself.
+    """
+
+    live = False
+
+    def __init__(self, fps=30.0, realtime=True):
+        self.fps = fps
+        self.realtime = realtime
+        self.width = 0
+        self.height = 0
+        self.frame_index = 0
+        self._start_time = None
+
+    def open(self):
+        """Open the source, returns True on success"""
+        raise NotImplementedError
+
+    def read(self):
+        """Return (ret, frame) for the next frame"""
+        raise NotImplementedError
+
+    def read_into(self, out):
+        """Read the next frame into a preallocated array, returns success"""
+        ret, frame = self.read()
+        if ret:
+            out[...] = frame
+        return ret
+
+    def release(self):
+        """Release any resources held by the source"""
+        self._start_time = None
+
+    def is_opened(self):
+        return self._start_time is not None
+
+    def _pace(self):
+        """Sleep until the current frame is due when running in real time"""
+        if self._start_time is None:
+            self._start_time = time.perf_counter()
+        if self.realtime and self.fps > 0:
+            due = self._start_time + self.frame_index / self.fps
+            delay = due - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+        self.frame_index += 1
+
+
+class CameraSource(FrameSource):
+    """Live camera through cv2.VideoCapture.
+
+    The capture profile (pixel format, size, rate, buffering) is, in order
+    of preference, the one passed in, the one cached for this device by
+    benchmarks.capture_profiles, or width x height at 30 fps with a
+    one-frame driver buffer.
+    """
+
+    live = True
+
+    def __init__(self, index=0, width=640, height=480, profile=None, profile_cache=None):
+        super().__init__(fps=0.0, realtime=True)
+        self.index = index
+        self.requested_width = width
+        self.requested_height = height
+        self.profile = profile
+        self.profile_cache = profile_cache if profile_cache is not None else ProfileCache()
+        self.cap = None
+
+    def open(self):
+        if self.cap is not None:
+            return True
+
+        self.cap = cv2.VideoCapture(self.index)
+        if not self.cap.isOpened():
+            print("Error: Could not open camera")
+            self.cap = None
+            return False
+
+        profile, origin = self.profile, "requested"
+        if profile is None:
+            profile, origin = self.profile_cache.get(device_key(self.index)), "cached"
+        if profile is None:
+            profile = CaptureProfile(None, self.requested_width, self.requested_height)
+            origin = "default"
+        actual = profile.apply(self.cap)
+        print(f"Capture profile ({origin}): {actual}")
+
+        self.width = actual.width
+        self.height = actual.height
+        self.fps = actual.fps
+
+        if self.width == 0 or self.height == 0:
+            print("Error: Could not get camera resolution")
+            self.release()
+            return False
+
+        return True
+
+    def read(self):
+        if self.cap is None:
+            return False, None
+        return self.cap.read()
+
+    def read_into(self, out):
+        if self.cap is None:
+            return False
+        # VideoCapture decodes straight into out when shape and type match
+        ret, frame = self.cap.read(out)
+        if ret and frame is not out:
+            out[...] = frame
+        return ret
+
+    def release(self):
+        if self.cap is not None:
+            self.cap.release()
+            self.cap = None
+
+    def is_opened(self):
+        return self.cap is not None
+
+
+class VideoFileSource(FrameSource):
+    """Recorded video file, optionally looping"""
+
+    def __init__(self, path, realtime=True, loop=False):
+        super().__init__(realtime=realtime)
+        self.path = path
+        self.loop = loop
+        self.cap = None
+
+    def open(self):
+        if self.cap is not None:
+            return True
+
+        self.cap = cv2.VideoCapture(self.path)
+        if not self.cap.isOpened():
+            print(f"Error: Could not open video file {self.path}")
+            self.cap = None
+            return False
+
+        self.width = int(self.cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+        self.height = int(self.cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+        self.fps = self.cap.get(cv2.CAP_PROP_FPS) or 30.0
+        self.frame_index = 0
+        self._start_time = None
+        return True
+
+    def read(self):
+        if self.cap is None:
+            return False, None
+
+        ret, frame = self.cap.read()
+        if not ret and self.loop:
+            self.cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+            ret, frame = self.cap.read()
+        if ret:
+            self._pace()
+        return ret, frame
+
+    def release(self):
+        super().release()
+        if self.cap is not None:
+            self.cap.release()
+            self.cap = None
+
+    def is_opened(self):
+        return self.cap is not None
+
+
+class ImageSequenceSource(FrameSource):
+    """Directory of still images played back in name order"""
+
+    extensions = ('.png', '.jpg', '.jpeg', '.bmp')
+
+    def __init__(self, directory, fps=30.0, realtime=True, loop=False):
+        super().__init__(fps=fps, realtime=realtime)
+        self.directory = directory
+        self.loop = loop
+        self.files = []
+        self._position = 0
+
+    def open(self):
+        if not os.path.isdir(self.directory):
+            print(f"Error: Image directory not found: {self.directory}")
+            return False
+
+        self.files = sorted(
+            os.path.join(self.directory, name)
+            for name in os.listdir(self.directory)
+            if name.lower().endswith(self.extensions)
+        )
+        if not self.files:
+            print(f"Error: No images found in {self.directory}")
+            return False
+
+        first = cv2.imread(self.files[0])
+        if first is None:
+            print(f"Error: Could not read image {self.files[0]}")
+            return False
+
+        self.height, self.width = first.shape[:2]
+        self._position = 0
+        self.frame_index = 0
+        self._start_time = time.perf_counter()
+        return True
+
+    def read(self):
+        if not self.files:
+            return False, None
+
+        if self._position >= len(self.files):
+            if not self.loop:
+                return False, None
+            self._position = 0
+
+        frame = cv2.imread(self.files[self._position])
+        self._position += 1
+        if frame is None:
+            return False, None
+
+        self._pace()
+        return True, frame
+
+    def release(self):
+        super().release()
+        self.files = []
+
+
+class SyntheticHandSource(FrameSource):
+    """Generator of rendered hands moving over a plain background.
+
+    The hand cycles through the MODE_1, MODE_2 and MODE_3 finger poses while
+    following a smooth path, so the whole pipeline can be exercised and
+    timed deterministically without a camera. The drawing is stylised: it
+    reproduces the capture, conversion and inference load, but the palm
+    detector is not guaranteed to lock onto it.
+    """
+
+    # Finger poses as (thumb, index, middle, ring, pinky) extension flags
+    poses = [
+        (False, True, False, False, False),
+        (False, True, True, False, False),
+        (False, False, False, False, True),
+        (False, False, False, False, False),
+    ]
+
+    def __init__(self, width=640, height=480, fps=30.0, num_frames=None,
+                 realtime=True, pose_duration=2.0, seed=0):
+        super().__init__(fps=fps, realtime=realtime)
+        self.width = width
+        self.height = height
+        self.num_frames = num_frames
+        self.pose_duration = pose_duration
+        self.seed = seed
+        self._background = None
+        self._opened = False
+
+    def open(self):
+        rng = np.random.default_rng(self.seed)
+        noise = rng.integers(0, 12, size=(self.height, self.width, 1), dtype=np.uint8)
+        self._background = np.broadcast_to(
+            noise + np.array([40, 45, 50], dtype=np.uint8), (self.height, self.width, 3)
+        ).copy()
+        self.frame_index = 0
+        self._start_time = time.perf_counter()
+        self._opened = True
+        return True
+
+    def read(self):
+        if not self._opened:
+            return False, None
+        if self.num_frames is not None and self.frame_index >= self.num_frames:
+            return False, None
+
+        t = self.frame_index / self.fps if self.fps > 0 else float(self.frame_index)
+        frame = self._background.copy()
+        self.render_hand(frame, t)
+
+        self._pace()
+        return True, frame
+
+    def release(self):
+        super().release()
+        self._opened = False
+
+    def is_opened(self):
+        return self._opened
+
+    def hand_center(self, t):
+        """Palm centre in pixels at time t"""
+        cx = self.width * (0.5 + 0.22 * np.sin(2 * np.pi * 0.11 * t))
+        cy = self.height * (0.6 + 0.12 * np.sin(2 * np.pi * 0.07 * t + 1.0))
+        return int(cx), int(cy)
+
+    def pose_at(self, t):
+        """Finger extension flags at time t"""
+        return self.poses[int(t / self.pose_duration) % len(self.poses)]
+
+    def render_hand(self, frame, t):
+        """Draw a simple upright right hand onto the frame"""
+        skin = (140, 170, 220)
+        cx, cy = self.hand_center(t)
+        scale = self.height / 480.0
+        palm_w = int(50 * scale)
+        palm_h = int(60 * scale)
+
+        cv2.ellipse(frame, (cx, cy), (palm_w, palm_h), 0, 0, 360, skin, -1)
+
+        # Finger base offsets along the top of the palm and full lengths
+        bases = [(-palm_w - 5, 10), (-30, -palm_h + 5), (-8, -palm_h), (14, -palm_h + 3), (34, -palm_h + 12)]
+        lengths = [55, 80, 88, 80, 62]
+        widths = [22, 18, 19, 18, 15]
+        angles = [-2.2, -1.72, -1.57, -1.42, -1.25]
+
+        for extended, (bx, by), length, width, angle in zip(self.pose_at(t), bases, lengths, widths, angles):
+            base = (cx + int(bx * scale), cy + int(by * scale))
+            reach = length if extended else length * 0.35
+            tip = (
+                base[0] + int(np.cos(angle) * reach * scale),
+                base[1] + int(np.sin(angle) * reach * scale),
+            )
+            cv2.line(frame, base, tip, skin, max(1, int(width * scale)))
+            cv2.circle(frame, tip, max(1, int(width * scale / 2)), skin, -1)
+
+
+def source_from_spec(spec, realtime=True, loop=False):
+    """Build a frame source from a short description.
+
+    Accepts an integer camera index (or "camera:N"), "synthetic", a path to
+    a directory of images or a path to a video file.
+    """
+    if isinstance(spec, FrameSource):
+        return spec
+    if spec is None:
+        return CameraSource(0)
+    if isinstance(spec, int):
+        return CameraSource(spec)
+
+    spec = str(spec)
+    if spec.isdigit():
+        return CameraSource(int(spec))
+    if spec.startswith("camera:"):
+        return CameraSource(int(spec.split(":", 1)[1]))
+    if spec == "synthetic":
+        return SyntheticHandSource(realtime=realtime)
+    if os.path.isdir(spec):
+        return ImageSequenceSource(spec, realtime=realtime, loop=loop)
+    return VideoFileSource(spec, realtime=realtime, loop=loop)
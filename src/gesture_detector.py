@@ -1,82 +1,79 @@
 # File: /hand-tracker-project/hand-tracker-project/src/gesture_detector.py
 
-import math
-import mediapipe as mp
+from .hand_landmarks import FINGER_TIPS, FINGER_PIPS
+from .gesture_rules import GestureRuleSet
+
+# Compiled once and shared by every detector using the built-in gestures
+_DEFAULT_RULES = GestureRuleSet()
 
 class GestureDetector:
-    def __init__(self):
-        pass
+    """Gesture mode of one hand, debounced over time.
     
-    def detect_gesture_mode(self, hand_landmarks):
-        """Detect gesture mode based on extended fingers"""
-        if not hand_landmarks:
-            return None
-            
-        index_tip = hand_landmarks.landmark[8]
-        index_pip = hand_landmarks.landmark[6]
-        index_extended = index_tip.y < index_pip.y
-        
-        middle_tip = hand_landmarks.landmark[12]
-        middle_pip = hand_landmarks.landmark[10]
-        middle_extended = middle_tip.y < middle_pip.y
+    Each frame is matched against a GestureRuleSet; a different gesture
+    (or NONE) only replaces the current one after it has been seen for its
+    rule's dwell, so a single noisy frame never switches modes. Keep one
+    detector per tracked hand.
+    """
+    
+    def __init__(self, rules=None):
+        self.rules = rules if rules is not None else _DEFAULT_RULES
+        self.reset()
+    
+    def reset(self):
+        """Forget the current gesture"""
+        self._active = -1
+        self._pending = None
+        self._pending_frames = 0
+        self._pending_since = None
+    
+    @property
+    def mode(self):
+        return self.rules.names[self._active] if self._active >= 0 else "NONE"
+    
+    def detect_gesture_mode(self, points, timestamp=None):
+        """Debounced gesture mode of a (21, 3) landmark array.
         
-        pinky_tip = hand_landmarks.landmark[20]
-        pinky_pip = hand_landmarks.landmark[18]
-        pinky_extended = pinky_tip.y < pinky_pip.y
+        timestamp (seconds) enables the rules' dwell_ms; without it only
+        dwell_frames applies.
+        """
+        if points is None:
+            return None
         
-        if index_extended and not middle_extended and not pinky_extended:
-            return "MODE_1"
-            
-        if index_extended and middle_extended and not pinky_extended:
-            index_mcp = hand_landmarks.landmark[5]
-            middle_mcp = hand_landmarks.landmark[9]
-            
-            index_vector_x = index_tip.x - index_mcp.x
-            index_vector_y = index_tip.y - index_mcp.y
-            
-            middle_vector_x = middle_tip.x - middle_mcp.x
-            middle_vector_y = middle_tip.y - middle_mcp.y
-            
-            index_angle = math.atan2(index_vector_y, index_vector_x)
-            middle_angle = math.atan2(middle_vector_y, middle_vector_x)
-            
-            angle_diff = abs(index_angle - middle_angle)
-            if angle_diff > math.pi:
-                angle_diff = 2 * math.pi - angle_diff
-            
-            if angle_diff < 0.52:
-                return "MODE_2"
+        candidate = self.rules.match(points, self._active)
+        if candidate == self._active:
+            self._pending = None
+            return self.mode
         
-        if pinky_extended and not index_extended and not middle_extended:
-            return "MODE_3"
+        if candidate != self._pending:
+            self._pending = candidate
+            self._pending_frames = 0
+            self._pending_since = timestamp
+        self._pending_frames += 1
         
-        return "NONE"
+        dwell_frames, dwell_ms = self.rules.dwell[candidate] if candidate >= 0 else self.rules.none_dwell
+        held_ms = ((timestamp - self._pending_since) * 1000.0
+                   if timestamp is not None and self._pending_since is not None else dwell_ms)
+        if self._pending_frames >= dwell_frames and held_ms >= dwell_ms:
+            self._active = candidate
+            self._pending = None
+        return self.mode
     
-    def get_finger_tip_position(self, hand_landmarks, frame_shape, mode):
-        """Get finger tip position based on mode"""
-        if hand_landmarks:
-            h, w, _ = frame_shape
-            
-            if mode == "MODE_1" or mode == "MODE_2":
-                finger_tip = hand_landmarks.landmark[8]
-            elif mode == "MODE_3":
-                finger_tip = hand_landmarks.landmark[20]
-            else:
-                return None, None
-            
-            x = int(finger_tip.x * w)
-            y = int(finger_tip.y * h)
-            
-            return x, y
-        return None, None
+    def get_finger_tip_position(self, points, frame_shape, mode):
+        """Pixel position of the landmark that drives the pointer in a mode.
+
+        Coordinates stay fractional so the pointer filter and cursor gain
+        work below one camera pixel; callers round where they draw or inject.
+        """
+        index = self.rules.index(mode)
+        if points is None or index < 0:
+            return None, None
+        
+        h, w, _ = frame_shape
+        finger_tip = points[self.rules.pointers[index]]
+        return float(finger_tip[0]) * w, float(finger_tip[1]) * h
     
-    def is_finger_extended(self, landmarks, finger_tips, finger_pips):
-        """Check if finger is extended"""
-        extended = []
-        for tip, pip in zip(finger_tips, finger_pips):
-            tip_y = landmarks.landmark[tip].y
-            pip_y = landmarks.landmark[pip].y
-            extended.append(tip_y < pip_y)
-        return extended
+    def is_finger_extended(self, points, finger_tips=FINGER_TIPS, finger_pips=FINGER_PIPS):
+        """Check which fingers are extended"""
+        return (points[finger_tips, 1] < points[finger_pips, 1]).tolist()
 
-    # Add any other methods with proper self parameter
\ No newline at end of file
+    # Add any other methods with proper self parameter
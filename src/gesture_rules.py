@@ -0,0 +1,167 @@
+import math
+
+import numpy as np
+
+from .hand_landmarks import (
+    FINGER_PIPS, FINGER_TIPS, INDEX_MCP, INDEX_TIP, MIDDLE_MCP, MIDDLE_TIP, NUM_LANDMARKS, PINKY_TIP
+)
+
+# Bit of each finger (thumb..pinky) in an extension code
+_FINGER_BITS = (1, 2, 4, 8, 16)
+# Flat indices of the tip then PIP y coordinates in a (21, 3) array; a
+# finger is extended when its tip is above its PIP joint
+_TIP_PIP_Y = np.concatenate((FINGER_TIPS, FINGER_PIPS)) * 3 + 1
+
+
+class GestureRule:
+    """One gesture described as data.
+
+    fingers gives the required extension of thumb..pinky: True extended,
+    False curled, None either. angles holds (segment_a, segment_b,
+    max_angle, release_angle) entries, segments being (start, end) landmark
+    indices: the angle between them must be at most max_angle (radians) to
+    enter the gesture and at most release_angle to stay in it. distances
+    holds (first, second, low, high, margin) entries bounding the 2D
+    distance between two landmarks (None for an open bound); margin widens
+    the bounds while the gesture is active. pointer is the landmark that
+    drives the cursor, and the gesture is only adopted after it has been
+    matched for dwell_frames consecutive frames and dwell_ms milliseconds.
+    """
+
+    def __init__(self, name, fingers, pointer=INDEX_TIP, angles=(), distances=(),
+                 dwell_frames=2, dwell_ms=0.0):
+        self.name = name
+        self.fingers = tuple(fingers)
+        self.pointer = pointer
+        self.angles = tuple(angles)
+        self.distances = tuple(distances)
+        self.dwell_frames = dwell_frames
+        self.dwell_ms = dwell_ms
+
+    def matches_code(self, code):
+        """Whether an extension bit code satisfies the finger pattern"""
+        return all(want is None or bool(code & bit) == want
+                   for want, bit in zip(self.fingers, _FINGER_BITS))
+
+
+# The built-in modes: index pointer, index + middle parallel for scrolling,
+# pinky pointer for accelerated cursor movement
+DEFAULT_GESTURES = (
+    GestureRule("MODE_1", (None, True, False, None, False)),
+    GestureRule("MODE_2", (None, True, True, None, False),
+                angles=(((INDEX_MCP, INDEX_TIP), (MIDDLE_MCP, MIDDLE_TIP), 0.52, 0.6),)),
+    GestureRule("MODE_3", (None, False, False, None, True), pointer=PINKY_TIP),
+)
+
+
+class GestureRuleSet:
+    """GestureRules compiled for one evaluation per frame.
+
+    Finger patterns are folded into a 32-entry table from extension bit
+    code to the rules that pattern allows, so a frame only checks the few
+    rules whose fingers match. All angle and distance predicates of the set
+    are then evaluated in one vectorized pass, a single matrix product plus
+    a few elementwise operations: angles as cosines between segment
+    vectors (no atan2) and distances squared, compared against per-rule
+    bound rows. Rules earlier in the list win.
+    """
+
+    def __init__(self, rules=DEFAULT_GESTURES, none_dwell_frames=2, none_dwell_ms=0.0):
+        self.rules = tuple(rules)
+        self.names = tuple(rule.name for rule in self.rules)
+        self.pointers = tuple(rule.pointer for rule in self.rules)
+        self.dwell = tuple((rule.dwell_frames, rule.dwell_ms) for rule in self.rules)
+        self.none_dwell = (none_dwell_frames, none_dwell_ms)
+        self._by_name = {rule.name: i for i, rule in enumerate(self.rules)}
+
+        self._by_code = tuple(tuple(i for i, rule in enumerate(self.rules) if rule.matches_code(code))
+                              for code in range(32))
+
+        # Every predicate is a dot product of two landmark difference
+        # vectors: for angles the segment pair and each segment with itself
+        # (for the cosine), for distances the difference with itself. One
+        # matrix maps the flattened landmarks to all operand components
+        left, right = [], []
+        for rule in self.rules:
+            for segment_a, segment_b, _, _ in rule.angles:
+                left.append(segment_a)
+                right.append(segment_b)
+        count = len(left)
+        left, right = left + left + right, right + left + right
+        for rule in self.rules:
+            for first, second, _, _, _ in rule.distances:
+                left.append((second, first))
+                right.append((second, first))
+        self._angle_count = count
+        self._products = len(left)
+
+        # Rows: left x, left y, right x, right y of every product
+        self._operands = np.zeros((4 * self._products, NUM_LANDMARKS * 3), dtype=np.float32)
+        for block, segments in enumerate((left, left, right, right)):
+            axis = block % 2
+            for k, (start, end) in enumerate(segments):
+                row = (block // 2) * 2 * self._products + axis * self._products + k
+                self._operands[row, end * 3 + axis] += 1.0
+                self._operands[row, start * 3 + axis] -= 1.0
+
+        # Bounds per rule over the feature columns (cosines, squared norms,
+        # squared distances): entry and (wider) hold bounds, open where unused
+        self._needs_features = [bool(rule.angles or rule.distances) for rule in self.rules]
+        self._enter = np.empty((len(self.rules), 2, self._products), dtype=np.float32)
+        self._enter[:, 0] = -np.inf
+        self._enter[:, 1] = np.inf
+        self._hold = self._enter.copy()
+        column = 0
+        for r, rule in enumerate(self.rules):
+            for _, _, max_angle, release_angle in rule.angles:
+                # angle <= limit  <=>  cos(angle) >= cos(limit)
+                self._enter[r, 0, column] = math.cos(max_angle)
+                self._hold[r, 0, column] = math.cos(max(max_angle, release_angle))
+                column += 1
+        column = 3 * count
+        for r, rule in enumerate(self.rules):
+            for _, _, low, high, margin in rule.distances:
+                if low is not None:
+                    self._enter[r, 0, column] = low * low
+                    self._hold[r, 0, column] = max(low - margin, 0.0) ** 2
+                if high is not None:
+                    self._enter[r, 1, column] = high * high
+                    self._hold[r, 1, column] = (high + margin) ** 2
+                column += 1
+
+    def index(self, name):
+        """Rule index of a gesture name, -1 for unknown names and NONE"""
+        return self._by_name.get(name, -1)
+
+    def features(self, points):
+        """Cosines of the angle predicates, the squared segment lengths
+        behind them, then the squared distances of the distance predicates"""
+        operands = self._operands @ points.reshape(-1)
+        half = 2 * self._products
+        products = operands[:half] * operands[half:]
+        features = products[:self._products] + products[self._products:]
+        count = self._angle_count
+        if count:
+            norms = features[count:2 * count] * features[2 * count:3 * count]
+            features[:count] /= np.sqrt(np.maximum(norms, 1e-12))
+        return features
+
+    def match(self, points, active=-1):
+        """Index of the first rule matching a (21, 3) landmark array, or -1.
+
+        The active rule is checked against its hold bounds, so it is kept
+        through small excursions past its entry thresholds.
+        """
+        y = points.take(_TIP_PIP_Y).tolist()
+        code = ((y[0] < y[5]) + 2 * (y[1] < y[6]) + 4 * (y[2] < y[7])
+                + 8 * (y[3] < y[8]) + 16 * (y[4] < y[9]))
+        features = None
+        for r in self._by_code[code]:
+            if not self._needs_features[r]:
+                return r
+            if features is None:
+                features = self.features(np.ascontiguousarray(points))
+            low, high = self._hold[r] if r == active else self._enter[r]
+            if not ((features < low) | (features > high)).any():
+                return r
+        return -1
@@ -1,7 +1,12 @@
 import tkinter as tk
-from tkinter import ttk
+from tkinter import ttk, filedialog
+import queue
 import threading
-import time
+
+from .preview_feed import ppm_bytes
+from .transfer_function import POINTER_CURVES
+
+from .stage_timer import dump_summary
 
 class HandTrackerGUI:
     def __init__(self, hand_tracker):
@@ -10,24 +15,42 @@ class HandTrackerGUI:
         
         self.root = tk.Tk()
         self.root.title("Hand Tracker Control Panel")
-        self.root.geometry("400x600")
+        # No fixed geometry: Tk sizes the window to the two columns
+        
+        # The tracker reads the screen size from this root instead of
+        # creating its own
+        if getattr(self.tracker, 'screen_size', False) is None:
+            self.tracker.screen_size = (self.root.winfo_screenwidth(), self.root.winfo_screenheight())
         
         # Initialize all GUI variables first
         self.is_active = tk.BooleanVar(value=True)  # Always active now
         self.current_mode = tk.StringVar(value="NONE")
         self.gesture_detected = tk.StringVar(value="None")
         self.fps = tk.StringVar(value="0.0")
+        self.power_state = tk.StringVar(value="ACTIVE")
+        self.input_status = tk.StringVar(value="-")
+        self.roi_status = tk.StringVar(value="off")
+        self.startup_status = tk.StringVar(value="Starting...")
+        self.timing_enabled = tk.BooleanVar(value=False)
+        self.stage_timings = tk.StringVar(value="Timing disabled")
         self.show_camera_feed = tk.BooleanVar(value=True)
         self.show_overlay = tk.BooleanVar(value=True)
         self.mode_1_enabled = tk.BooleanVar(value=True)
         self.mode_2_enabled = tk.BooleanVar(value=True)
         self.mode_3_enabled = tk.BooleanVar(value=True)
+        self.pointer_curve = tk.StringVar(value="exponential")
         
         self.setup_ui()
         
-        # Start status update thread
-        self.update_thread = threading.Thread(target=self.update_status_loop, daemon=True)
-        self.update_thread.start()
+        # Status arrives on the tracker's queue and is applied on the Tk
+        # thread; Tk variables are never touched from another thread
+        self.status_interval_ms = 100
+        self.root.after(self.status_interval_ms, self.poll_status)
+        
+        # Camera preview, redrawn at the feed's rate into one PhotoImage
+        self.preview_image = None
+        self._preview_sequence = 0
+        self.root.after(0, self.poll_preview)
         
         # Start tracker in background
         self.tracker_thread = threading.Thread(target=self.tracker.run, daemon=True)
@@ -39,8 +62,25 @@ class HandTrackerGUI:
                               font=("Arial", 16, "bold"), fg="blue")
         title_label.pack(pady=10)
         
+        # Preview and status on the right, controls on the left, so the
+        # panel stays short enough for a 1080p screen
+        body = ttk.Frame(self.root)
+        body.pack(fill="both", expand=True)
+        controls = ttk.Frame(body)
+        controls.pack(side="left", fill="both", expand=True, anchor="n")
+        monitor = ttk.Frame(body)
+        monitor.pack(side="left", fill="both", anchor="n")
+        
+        # Camera preview
+        preview_frame = ttk.LabelFrame(monitor, text="Camera Preview", padding=5)
+        preview_frame.pack(fill="x", padx=10, pady=5)
+        
+        self.preview_label = tk.Label(preview_frame, text="Waiting for camera...",
+                                      font=("Arial", 9), fg="gray", height=12)
+        self.preview_label.pack()
+        
         # Status Frame
-        status_frame = ttk.LabelFrame(self.root, text="Tracking Status", padding=10)
+        status_frame = ttk.LabelFrame(monitor, text="Tracking Status", padding=10)
         status_frame.pack(fill="x", padx=10, pady=5)
         
         # Current mode
@@ -67,8 +107,57 @@ class HandTrackerGUI:
                                   font=("Arial", 10), fg="purple")
         fps_value_label.grid(row=2, column=1, padx=5, pady=2)
         
+        # Power state (idle mode)
+        power_label = tk.Label(status_frame, text="Power:")
+        power_label.grid(row=3, column=0, sticky="w", padx=5, pady=2)
+        
+        power_value_label = tk.Label(status_frame, textvariable=self.power_state,
+                                    font=("Arial", 10), fg="gray")
+        power_value_label.grid(row=3, column=1, padx=5, pady=2)
+        
+        # Input queue depth and injection latency
+        input_label = tk.Label(status_frame, text="Input Queue:")
+        input_label.grid(row=4, column=0, sticky="w", padx=5, pady=2)
+        
+        input_value_label = tk.Label(status_frame, textvariable=self.input_status,
+                                    font=("Arial", 10), fg="gray")
+        input_value_label.grid(row=4, column=1, padx=5, pady=2)
+        
+        # ROI tracking hit rate and full-frame fallbacks
+        roi_label = tk.Label(status_frame, text="ROI Tracking:")
+        roi_label.grid(row=5, column=0, sticky="w", padx=5, pady=2)
+        
+        roi_value_label = tk.Label(status_frame, textvariable=self.roi_status,
+                                  font=("Arial", 10), fg="gray")
+        roi_value_label.grid(row=5, column=1, padx=5, pady=2)
+        
+        # Startup progress while the model and camera load in the background
+        startup_label = tk.Label(status_frame, text="Startup:")
+        startup_label.grid(row=6, column=0, sticky="w", padx=5, pady=2)
+        
+        startup_value_label = tk.Label(status_frame, textvariable=self.startup_status,
+                                      font=("Arial", 10), fg="gray")
+        startup_value_label.grid(row=6, column=1, padx=5, pady=2)
+        
+        # Per-stage latency percentiles
+        timing_frame = ttk.LabelFrame(monitor, text="Stage Timings (p50 / p95 / p99 ms)", padding=10)
+        timing_frame.pack(fill="x", padx=10, pady=5)
+        
+        timing_controls = ttk.Frame(timing_frame)
+        timing_controls.pack(fill="x")
+        
+        tk.Checkbutton(timing_controls, text="Enable",
+                       variable=self.timing_enabled,
+                       command=self.update_timing_settings).pack(side="left")
+        ttk.Button(timing_controls, text="Save...",
+                   command=self.save_timings).pack(side="right")
+        
+        timings_label = tk.Label(timing_frame, textvariable=self.stage_timings,
+                                 font=("Courier", 9), justify="left")
+        timings_label.pack(anchor="w", pady=2)
+        
         # Display Settings Frame
-        display_frame = ttk.LabelFrame(self.root, text="Display Settings", padding=10)
+        display_frame = ttk.LabelFrame(controls, text="Display Settings", padding=10)
         display_frame.pack(fill="x", padx=10, pady=5)
         
         camera_check = tk.Checkbutton(display_frame, text="Show Camera Feed",
@@ -82,7 +171,7 @@ class HandTrackerGUI:
         overlay_check.pack(anchor="w", pady=2)
         
         # Mode Settings Frame
-        mode_frame = ttk.LabelFrame(self.root, text="Gesture Modes", padding=10)
+        mode_frame = ttk.LabelFrame(controls, text="Gesture Modes", padding=10)
         mode_frame.pack(fill="x", padx=10, pady=5)
         
         mode1_check = tk.Checkbutton(mode_frame, text="MODE 1: Cursor Control (Index finger)",
@@ -101,7 +190,7 @@ class HandTrackerGUI:
         mode3_check.pack(anchor="w", pady=2)
         
         # Advanced Settings Frame
-        advanced_frame = ttk.LabelFrame(self.root, text="Advanced Settings", padding=10)
+        advanced_frame = ttk.LabelFrame(controls, text="Advanced Settings", padding=10)
         advanced_frame.pack(fill="x", padx=10, pady=5)
         
         # Sensitivity slider
@@ -124,15 +213,24 @@ class HandTrackerGUI:
         self.smoothing_scale.set(0.7)
         self.smoothing_scale.pack(fill="x", pady=2)
         
+        # Acceleration curve of the fast pointer mode
+        curve_label = tk.Label(advanced_frame, text="MODE 3 Acceleration:")
+        curve_label.pack(anchor="w")
+        
+        curve_box = ttk.Combobox(advanced_frame, textvariable=self.pointer_curve,
+                                 values=list(POINTER_CURVES), state="readonly")
+        curve_box.bind("<<ComboboxSelected>>", self.update_pointer_curve)
+        curve_box.pack(fill="x", pady=2)
+        
         # Control buttons
-        button_frame = ttk.Frame(self.root)
+        button_frame = ttk.Frame(controls)
         button_frame.pack(fill="x", padx=10, pady=10)
         
         ttk.Button(button_frame, text="Stop System", 
                   command=self.stop_system).pack(side="right", padx=5)
         
         # Instructions
-        instructions_frame = ttk.LabelFrame(self.root, text="Instructions", padding=10)
+        instructions_frame = ttk.LabelFrame(controls, text="Instructions", padding=10)
         instructions_frame.pack(fill="x", padx=10, pady=5)
         
         instructions_text = """
@@ -149,47 +247,112 @@ Mode 3: Pinky finger - Fast cursor movement
     
     def update_display_settings(self):
         """Update display settings in hand tracker"""
-        if hasattr(self.tracker, 'show_camera_feed'):
-            self.tracker.show_camera_feed = self.show_camera_feed.get()
-        if hasattr(self.tracker, 'show_overlay'):
-            self.tracker.show_overlay = self.show_overlay.get()
+        self.tracker.update_settings(show_camera_feed=self.show_camera_feed.get(),
+                                     show_overlay=self.show_overlay.get())
+    
+    def update_timing_settings(self):
+        """Turn per-stage timing on or off"""
+        if hasattr(self.tracker, 'stage_timer'):
+            self.tracker.stage_timer.enabled = self.timing_enabled.get()
+            if hasattr(self.tracker, 'latency_monitor'):
+                self.tracker.latency_monitor.enabled = self.timing_enabled.get()
+            if not self.timing_enabled.get():
+                self.stage_timings.set("Timing disabled")
+    
+    def save_timings(self):
+        """Dump the current stage and end-to-end percentiles to CSV or JSON"""
+        if not hasattr(self.tracker, 'stage_timer'):
+            return
+        path = filedialog.asksaveasfilename(
+            defaultextension=".json",
+            filetypes=[("JSON", "*.json"), ("CSV", "*.csv")])
+        if path:
+            try:
+                dump_summary(self._timing_summary(), path)
+            except OSError as e:
+                print(f"Could not save timings: {e}")
+    
+    def _timing_summary(self):
+        """Stage percentiles followed by capture-to-injection latency per mode"""
+        summary = self.tracker.stage_timer.percentiles()
+        if hasattr(self.tracker, 'latency_monitor'):
+            summary.update(self.tracker.latency_monitor.percentiles())
+        return summary
     
     def update_mode_settings(self):
         """Update enabled modes in hand tracker"""
-        if hasattr(self.tracker, 'enabled_modes'):
-            self.tracker.enabled_modes = {
-                'MODE_1': self.mode_1_enabled.get(),
-                'MODE_2': self.mode_2_enabled.get(),
-                'MODE_3': self.mode_3_enabled.get()
-            }
+        enabled = {
+            'MODE_1': self.mode_1_enabled.get(),
+            'MODE_2': self.mode_2_enabled.get(),
+            'MODE_3': self.mode_3_enabled.get()
+        }
+        self.tracker.update_settings(enabled_modes=[mode for mode, on in enabled.items() if on])
     
     def update_sensitivity(self, value):
         """Update cursor sensitivity"""
-        if hasattr(self.tracker, 'cursor_sensitivity'):
-            self.tracker.cursor_sensitivity = float(value)
+        self.tracker.update_settings(cursor_sensitivity=float(value))
     
     def update_smoothing(self, value):
         """Update movement smoothing"""
-        if hasattr(self.tracker, 'smoothing_factor'):
-            self.tracker.smoothing_factor = float(value)
+        self.tracker.update_settings(smoothing=float(value))
     
-    def update_status_loop(self):
-        """Update system status in a separate thread"""
-        while True:
-            try:
-                # Update tracking status
-                if hasattr(self.tracker, 'current_mode'):
-                    self.current_mode.set(self.tracker.current_mode)
-                if hasattr(self.tracker, 'last_gesture'):
-                    self.gesture_detected.set(self.tracker.last_gesture)
-                if hasattr(self.tracker, 'fps'):
-                    self.fps.set(f"{self.tracker.fps:.1f}")
-                
-                time.sleep(0.1)  # Update every 100ms
-                
-            except Exception as e:
-                print(f"Status update error: {e}")
-                time.sleep(1)
+    def update_pointer_curve(self, event=None):
+        """Update the MODE_3 acceleration curve"""
+        self.tracker.update_settings(pointer_curve=self.pointer_curve.get())
+    
+    def poll_status(self):
+        """Apply the newest queued tracker status; runs on the Tk thread"""
+        status = None
+        try:
+            while True:
+                status = self.tracker.status_queue.get_nowait()
+        except queue.Empty:
+            pass
+        
+        try:
+            if status is not None:
+                self.current_mode.set(status['current_mode'])
+                self.gesture_detected.set(status['last_gesture'])
+                self.fps.set(f"{status['fps']:.1f}")
+                self.power_state.set("IDLE (low power)" if status['idle'] else "ACTIVE")
+                self.startup_status.set(status['startup_status'])
+                stats = status['input']
+                if stats is not None:
+                    self.input_status.set(f"depth {stats['queue_depth']} | "
+                                          f"{stats['latency_mean_ms']:.1f} ms avg")
+                roi = status['roi']
+                if roi is not None:
+                    self.roi_status.set(f"{roi['hit_rate']:.0%} hits ({roi['hits']}/{roi['misses']}) | "
+                                        f"{roi['full_frame']} full-frame")
+            if self.tracker.stage_timer.enabled:
+                summary = self._timing_summary()
+                self.stage_timings.set("\n".join(
+                    f"{name:<12}{v['p50_ms']:6.1f} {v['p95_ms']:6.1f} {v['p99_ms']:6.1f}"
+                    for name, v in summary.items()) or "Collecting...")
+        except Exception as e:
+            print(f"Status update error: {e}")
+        
+        self.root.after(self.status_interval_ms, self.poll_status)
+    
+    def poll_preview(self):
+        """Show the newest preview frame; runs on the Tk thread"""
+        feed = self.tracker.preview
+        sequence, image = feed.latest
+        if sequence != self._preview_sequence:
+            self._preview_sequence = sequence
+            if image is None:
+                self.preview_image = None
+                self.preview_label.configure(image="", text="Preview off", height=12)
+            else:
+                height, width = image.shape[:2]
+                if (self.preview_image is None or self.preview_image.width() != width
+                        or self.preview_image.height() != height):
+                    self.preview_image = tk.PhotoImage(width=width, height=height)
+                    self.preview_label.configure(image=self.preview_image, text="", height=height)
+                # Reload the same PhotoImage in place; the label keeps showing it
+                self.preview_image.configure(data=ppm_bytes(image), format="PPM")
+        
+        self.root.after(max(1, round(1000 / feed.max_fps)), self.poll_preview)
     
     def stop_system(self):
         """Stop the entire system"""
@@ -0,0 +1,115 @@
+import numpy as np
+
+NUM_LANDMARKS = 21
+
+# MediaPipe hand landmark indices
+WRIST = 0
+THUMB_IP = 3
+THUMB_TIP = 4
+INDEX_MCP = 5
+INDEX_PIP = 6
+INDEX_TIP = 8
+MIDDLE_MCP = 9
+MIDDLE_PIP = 10
+MIDDLE_TIP = 12
+RING_PIP = 14
+RING_TIP = 16
+PINKY_PIP = 18
+PINKY_TIP = 20
+
+# Thumb, index, middle, ring, pinky
+FINGER_TIPS = np.array([THUMB_TIP, INDEX_TIP, MIDDLE_TIP, RING_TIP, PINKY_TIP])
+FINGER_PIPS = np.array([THUMB_IP, INDEX_PIP, MIDDLE_PIP, RING_PIP, PINKY_PIP])
+_TIPS_AND_PIPS = np.concatenate((FINGER_TIPS, FINGER_PIPS))
+
+# Same topology as mediapipe.solutions.hands.HAND_CONNECTIONS
+HAND_CONNECTIONS = (
+    (0, 1), (1, 2), (2, 3), (3, 4),
+    (0, 5), (5, 6), (6, 7), (7, 8),
+    (5, 9), (9, 10), (10, 11), (11, 12),
+    (9, 13), (13, 14), (14, 15), (15, 16),
+    (13, 17), (0, 17), (17, 18), (18, 19), (19, 20),
+)
+
+HANDEDNESS_CODES = {'Left': 0, 'Right': 1}
+HANDEDNESS_LABELS = {code: label for label, code in HANDEDNESS_CODES.items()}
+
+
+class Hand:
+    """One detected hand as a contiguous (21, 3) float32 array.
+
+    Coordinates are MediaPipe's normalized x, y (0..1 of the frame) and
+    relative depth z. This is the only per-frame hand representation used
+    downstream of hands.process(); protobuf landmarks are converted once.
+
+    smoothed holds the temporally smoothed skeleton when a SkeletonFilter
+    runs, and is the raw points otherwise.
+    """
+
+    __slots__ = ('points', 'smoothed', 'handedness', 'score')
+
+    def __init__(self, points, handedness='Right', score=1.0):
+        self.points = np.ascontiguousarray(points, dtype=np.float32)
+        self.smoothed = self.points
+        self.handedness = handedness
+        self.score = score
+
+    def pixel_points(self, frame_shape):
+        """Landmark x, y in pixels as an int32 (21, 2) array"""
+        h, w = frame_shape[:2]
+        return (self.points[:, :2] * (w, h)).astype(np.int32)
+
+    def centroid(self):
+        """Mean normalized x, y of all landmarks"""
+        return self.points[:, :2].mean(axis=0)
+
+
+def hands_from_results(results):
+    """Convert hands.process() results into a list of Hand objects"""
+    if not results.multi_hand_landmarks:
+        return []
+
+    labels = results.multi_handedness or []
+    hands = []
+    for i, hand_landmarks in enumerate(results.multi_hand_landmarks):
+        points = np.array([(lm.x, lm.y, lm.z) for lm in hand_landmarks.landmark], dtype=np.float32)
+        if i < len(labels):
+            classification = labels[i].classification[0]
+            hands.append(Hand(points, classification.label, classification.score))
+        else:
+            hands.append(Hand(points))
+    return hands
+
+
+def mirror_hands(hands):
+    """Mirror hands detected on an unflipped frame into selfie view, in place.
+
+    Equivalent to running detection on cv2.flip(frame, 1): x becomes 1 - x
+    and the handedness label swaps, since MediaPipe labels hands assuming a
+    mirrored input image.
+    """
+    for hand in hands:
+        hand.points[:, 0] = 1.0 - hand.points[:, 0]
+        if hand.handedness == 'Left':
+            hand.handedness = 'Right'
+        elif hand.handedness == 'Right':
+            hand.handedness = 'Left'
+    return hands
+
+
+def finger_extension(points):
+    """Extended flags for thumb..pinky: tip above its PIP joint"""
+    y = points[_TIPS_AND_PIPS, 1]
+    return y[:5] < y[5:]
+
+
+def pair_distances(points, first, second):
+    """2D distances between landmark index arrays first[i] and second[i]"""
+    diff = points[first, :2] - points[second, :2]
+    return np.sqrt((diff * diff).sum(axis=1))
+
+
+def segment_angles(points, starts, ends):
+    """Angles (radians) of the 2D vectors from starts[i] to ends[i]"""
+    diff = points[ends, :2] - points[starts, :2]
+    return np.arctan2(diff[:, 1], diff[:, 0])
@@ -0,0 +1,170 @@
+import time
+
+import numpy as np
+
+from .click_handler import ClickHandler
+from .cursor_controller import CursorController
+from .gesture_detector import GestureDetector
+from .pointer_filter import create_pointer_filter
+from .scroll_controller import ScrollController
+
+# Gesture modes each hand role may act on
+HAND_ROLES = {
+    'all': ("MODE_1", "MODE_2", "MODE_3"),
+    'cursor': ("MODE_1", "MODE_3"),
+    'scroll': ("MODE_2",),
+    'none': (),
+}
+
+
+class HandState:
+    """Everything that belongs to one tracked hand.
+
+    Each hand keeps its own gesture detector, pointer filter, cursor,
+    scroll and click state, so two hands never share a debounced gesture,
+    an anchor position or a half-finished click.
+    slot is the hand's row in the SkeletonFilter.
+    """
+
+    def __init__(self, hand_id, slot, gesture_detector, pointer_filter, cursor_controller,
+                 scroll_controller, click_handler):
+        self.hand_id = hand_id
+        self.slot = slot
+        self.gesture_detector = gesture_detector
+        self.pointer_filter = pointer_filter
+        self.cursor_controller = cursor_controller
+        self.scroll_controller = scroll_controller
+        self.click_handler = click_handler
+
+        self.handedness = None
+        self.role = 'all'
+        self.hand = None
+        self.centroid = None
+        self.last_seen = 0.0
+        self.mode = "NONE"
+        self._votes = {}
+
+    @classmethod
+    def create(cls, hand_id, slot, actuator, screen_size=(1920, 1080), pointer_filter="one_euro",
+               smoothing=0.7, layout=None, clock=time.time, scroll_scheduler=None):
+        """Fresh detector, filter and controllers for a newly tracked hand.
+
+        The factory HandTracker gives its HandRegistry; replays pass a
+        virtual clock and no scheduler, so scroll steps are emitted per call.
+        """
+        screen_width, screen_height = screen_size
+        return cls(
+            hand_id, slot,
+            GestureDetector(),
+            create_pointer_filter(pointer_filter, smoothing),
+            CursorController(screen_width, screen_height, actuator, clock=clock, layout=layout),
+            ScrollController(actuator, clock=clock, scheduler=scroll_scheduler),
+            ClickHandler(actuator)
+        )
+
+    def allows(self, mode):
+        """Whether this hand's role lets it act on a gesture mode"""
+        return mode in HAND_ROLES.get(self.role, ())
+
+    def vote(self, label, score):
+        """Accumulate handedness evidence; a few flipped labels do not change it"""
+        for key in self._votes:
+            self._votes[key] *= 0.9
+        self._votes[label] = self._votes.get(label, 0.0) + score
+        self.handedness = max(self._votes, key=self._votes.get)
+
+
+class HandRegistry:
+    """Stable per-hand identities across frames.
+
+    Detections are matched to known hands by nearest landmark centroid,
+    with a penalty when the handedness label disagrees with the hand's
+    voted handedness. Matches farther apart than max_distance (normalized
+    units) start a new hand. A hand that is not seen keeps its state for
+    timeout seconds, so a dropped frame does not reset its controllers.
+
+    create_state(hand_id, slot) builds the HandState for a new hand, usually
+    through HandState.create. roles maps 'Left'/'Right' to a HAND_ROLES key;
+    unlisted hands get 'all'. When a skeleton_filter is given, a new hand's
+    slot in it is reset so it does not inherit the previous hand's history.
+    """
+
+    def __init__(self, create_state, max_hands=1, roles=None, max_distance=0.25,
+                 handedness_penalty=0.1, timeout=0.5, skeleton_filter=None):
+        self.create_state = create_state
+        self.skeleton_filter = skeleton_filter
+        self.max_hands = max_hands
+        self.roles = dict(roles or {})
+        self.max_distance = max_distance
+        self.handedness_penalty = handedness_penalty
+        self.timeout = timeout
+        self.states = []
+        self._next_id = 1
+
+    def reset(self):
+        """Forget every hand"""
+        self.states = []
+
+    def assign(self, hands, now):
+        """Match this frame's hands to tracked hands.
+
+        Returns the HandState of each detection, in detection order, with
+        state.hand set to it; detections beyond max_hands are left out.
+        States not matched this frame have hand set to None and are dropped
+        once unseen for longer than timeout.
+        """
+        self.states = [s for s in self.states if now - s.last_seen <= self.timeout]
+        for state in self.states:
+            state.hand = None
+
+        centroids = [hand.centroid() for hand in hands]
+        pairs = []
+        for d, (hand, centroid) in enumerate(zip(hands, centroids)):
+            for s, state in enumerate(self.states):
+                cost = float(np.hypot(*(centroid - state.centroid)))
+                if state.handedness is not None and hand.handedness != state.handedness:
+                    cost += self.handedness_penalty
+                if cost <= self.max_distance:
+                    pairs.append((cost, d, s))
+        pairs.sort()
+
+        assigned = [None] * len(hands)
+        taken = set()
+        for _, d, s in pairs:
+            state = self.states[s]
+            if assigned[d] is None and state not in taken:
+                assigned[d] = state
+                taken.add(state)
+
+        for d, hand in enumerate(hands):
+            if assigned[d] is None:
+                assigned[d] = self._new_state(taken)
+                if assigned[d] is None:
+                    continue
+            state = assigned[d]
+            state.hand = hand
+            state.centroid = centroids[d]
+            state.last_seen = now
+            state.vote(hand.handedness, hand.score)
+            state.role = self.roles.get(state.handedness, 'all')
+        return [state for state in assigned if state is not None]
+
+    def _new_state(self, taken):
+        """Start a new hand, evicting the longest-unseen one if every slot is in use"""
+        used = {state.slot for state in self.states}
+        free = [slot for slot in range(self.max_hands) if slot not in used]
+        if not free:
+            candidates = [state for state in self.states if state not in taken]
+            if not candidates:
+                return None
+            oldest = min(candidates, key=lambda state: state.last_seen)
+            self.states.remove(oldest)
+            free = [oldest.slot]
+
+        if self.skeleton_filter is not None:
+            self.skeleton_filter.reset(free[0])
+        state = self.create_state(self._next_id, free[0])
+        self._next_id += 1
+        self.states.append(state)
+        taken.add(state)
+        return state
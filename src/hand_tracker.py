@@ -1,51 +1,89 @@
 import cv2
-import mediapipe as mp
-import pyautogui
-import tkinter as tk
+import numpy as np
 import time
 import threading
+import queue
 
-from .gesture_detector import GestureDetector
-from .cursor_controller import CursorController
-from .scroll_controller import ScrollController
-from .click_handler import ClickHandler
-from .coordinate_mapper import CoordinateMapper
-from .stability_filter import StabilityFilter
+from .scroll_scheduler import ScrollScheduler
+from .monitor_layout import MonitorLayout, detect_monitor_layout
 from .ui_overlay import UIOverlay
+from .frame_grabber import FrameGrabber
+from .inference_process import InferenceProcess
+from .frame_source import source_from_spec
+from .actuator import create_actuator, measure_event_cost
+from .input_queue import AsyncActuator
+from .latency_monitor import LatencyMonitor
+from .hand_landmarks import hands_from_results, mirror_hands
+from .roi_tracker import RoiTracker
+from .hand_registry import HandRegistry, HandState
+from .skeleton_filter import SkeletonFilter
+from .stage_timer import (StageTimer, CAPTURE, CONVERT, INFERENCE, GESTURE,
+                          CONTROLLERS, OVERLAY, DISPLAY)
+from .motion_detector import MotionDetector
+from .tracker_settings import TrackerSettings
+from .preview_feed import PreviewFeed
+from .transfer_function import POINTER_CURVES
 
 class HandTracker:
-    def __init__(self):
-        root = tk.Tk()
-        self.screen_width = root.winfo_screenwidth()
-        self.screen_height = root.winfo_screenheight()
-        root.destroy()
-        
-        print(f"Screen resolution: {self.screen_width} x {self.screen_height}")
-        
-        pyautogui.FAILSAFE = True
-        pyautogui.PAUSE = 0.01
-        
-        try:
-            import pyautogui._pyautogui_win as pag_win
-            pag_win.MINIMUM_DURATION = 0
-            pag_win.MINIMUM_SLEEP = 0
-        except ImportError:
-            pass
-        
-        self.initial_cursor_pos = pyautogui.position()
-        print(f"Initial cursor position: {self.initial_cursor_pos}")
-        
-        self.mp_hands = mp.solutions.hands
-        self.hands = self.mp_hands.Hands(
-            static_image_mode=False,
-            max_num_hands=1,
-            min_detection_confidence=0.7,
-            min_tracking_confidence=0.5
-        )
-        self.mp_draw = mp.solutions.drawing_utils
-        
-        # Initialize camera
-        self.cap = None
+    def __init__(self, source=None, roi_tracking=False, input_backend="pyautogui",
+                 pointer_filter="one_euro", inference_workers=0, max_num_hands=1,
+                 hand_roles=None, screen_size=None, started_at=None, monitors=None):
+        # Construction is cheap: the input backend, the MediaPipe graph and
+        # the camera are loaded by prepare(), which run() calls on the
+        # tracking thread, so a GUI can be shown first. screen_size (the
+        # GUI knows it) avoids a throwaway Tk root; started_at is the
+        # launch time that time-to-first-frame is measured from. monitors
+        # (Monitor list) overrides monitor detection; screen_size is the
+        # single-screen fallback when detection is unavailable
+        self.started_at = started_at if started_at is not None else time.perf_counter()
+        self.screen_size = screen_size
+        self.monitor_layout = MonitorLayout(monitors) if monitors else None
+        self.screen_width = 0
+        self.screen_height = 0
+        self.screen_left = 0
+        self.screen_top = 0
+        self.input_backend = input_backend
+        self.input_event_cost = 0.0
+        self.actuator = None
+        self.scroll_scheduler = None
+        self.initial_cursor_pos = None
+        
+        # Startup progress, readable from other threads
+        self.prepared = False
+        self._stop_requested = False
+        self.startup_status = "Not started"
+        self.startup_timings = {}
+        
+        # Per-stage timing, off until enabled (e.g. from the GUI)
+        self.stage_timer = StageTimer()
+        # Capture-to-injection latency per gesture mode, also off by default
+        self.latency_monitor = LatencyMonitor()
+        
+        self.max_num_hands = max_num_hands
+        self.mp_hands = None
+        self.hands = None
+        
+        # Mirror mode: infer on the camera frame as captured and mirror the
+        # landmarks, instead of flipping every frame before inference. The
+        # preview is flipped only when it is displayed, after downscaling
+        self.mirror_landmarks = True
+        self._rgb_buffer = None
+        
+        # Tracking-ROI mode: infer on a crop around the last hand
+        if roi_tracking and max_num_hands > 1:
+            print("ROI tracking follows a single hand - disabled for multi-hand tracking")
+            roi_tracking = False
+        self.roi_tracking = roi_tracking
+        self.roi_tracker = RoiTracker()
+        self.roi_hands = None
+        
+        # Pipeline mode: 0 runs capture and inference in this process, N > 0
+        # runs them in worker processes with N MediaPipe graphs
+        self.inference_workers = inference_workers
+        
+        # Frame source: live camera by default, or any FrameSource / spec
+        self.source = source_from_spec(source)
+        self.frame_grabber = None
         self.cam_width = 640
         self.cam_height = 480
         
@@ -82,85 +120,309 @@ class HandTracker:
         self.buffer_size = 5
         
         # Initialize components
-        self.gesture_detector = GestureDetector()
-        self.cursor_controller = CursorController(self.screen_width, self.screen_height)
-        self.scroll_controller = ScrollController()
-        self.click_handler = ClickHandler()
-        self.coordinate_mapper = CoordinateMapper(
-            self.screen_width, self.screen_height, 
-            self.cam_width, self.cam_height, 
-            self.tracking_area
-        )
-        self.stability_filter = StabilityFilter(self.buffer_size, self.movement_threshold)
+        # Whole-skeleton smoothing for gesture and click detection
+        self.skeleton_filter = SkeletonFilter(max_hands=self.max_num_hands)
+        # Each tracked hand gets its own fingertip filter (driven by the
+        # smoothing setting), cursor, scroll and click state. With
+        # several hands the right hand drives the cursor and the left one
+        # scrolls unless hand_roles says otherwise
+        self.pointer_filter_name = pointer_filter
+        if hand_roles is None:
+            hand_roles = {'Right': 'cursor', 'Left': 'scroll'} if max_num_hands > 1 else {}
+        self.hand_registry = HandRegistry(self._create_hand_state, self.max_num_hands, hand_roles,
+                                          skeleton_filter=self.skeleton_filter)
         self.ui_overlay = UIOverlay()
         
-        # GUI control variables
-        self.show_camera_feed = True
-        self.show_overlay = True
-        self.enabled_modes = {
-            'MODE_1': True,
-            'MODE_2': True,
-            'MODE_3': True
-        }
-        self.cursor_sensitivity = 1.0
-        self.smoothing_factor = 0.7
+        # User settings: the GUI publishes a new snapshot with
+        # update_settings(), the pipeline adopts it at the start of a frame
+        self.settings = TrackerSettings()
+        self._active_settings = self.settings
+        # Status for the GUI, published from the tracking thread every
+        # status_interval seconds; the oldest entries are dropped if nobody reads
+        self.status_queue = queue.Queue(maxsize=8)
+        self.status_interval = 0.1
+        self._last_status_time = 0.0
+        # Camera preview for the GUI: the loop only publishes the latest
+        # frame, downscaled and at most preview.max_fps times a second
+        self.preview = PreviewFeed()
         self.running = False
         self.last_gesture = "None"
         self.fps = 0.0
         self.frame_count = 0
         self.fps_start_time = time.time()
         
-        # Initialize camera immediately
-        self._init_camera()
+        # Loop pacing: None follows the camera rate, otherwise caps processing
+        self.target_fps = None
+        self.last_frame_timestamp = None
+        self.frame_latency = 0.0
+        
+        # Idle mode: after idle_timeout seconds without a hand, capture and
+        # inference drop to idle_fps until the motion detector sees movement
+        self.idle_timeout = 5.0
+        self.idle_fps = 5.0
+        self.idle = False
+        self.motion_detector = MotionDetector()
+        self._last_hand_time = time.perf_counter()
+        
+        # Optional LandmarkRecorder fed with every frame's detections
+        self.recorder = None
     
-    def _init_camera(self):
-        """Initialize camera"""
-        if self.cap is None:
-            self.cap = cv2.VideoCapture(0)
-            if not self.cap.isOpened():
-                print("Error: Could not open camera")
-                return False
-                
-            self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, 640)
-            self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
-            
-            self.cam_width = int(self.cap.get(cv2.CAP_PROP_FRAME_WIDTH))
-            self.cam_height = int(self.cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+    def update_settings(self, **changes):
+        """Publish a new settings snapshot; call from one thread (the GUI).
+        
+        The pipeline never sees a partly updated snapshot and applies it
+        from the next frame on, so no lock is taken on either side.
+        """
+        self.settings = self.settings.replace(**changes)
+    
+    def _adopt_settings(self):
+        """Apply the latest published settings snapshot, once per frame"""
+        settings = self.settings
+        if settings is self._active_settings:
+            return settings
+        previous = self._active_settings
+        self._active_settings = settings
+        for state in self.hand_registry.states:
+            self._apply_hand_settings(state, settings)
+        if previous.show_camera_feed and not settings.show_camera_feed:
+            self.preview.clear()
+        return settings
+    
+    def _apply_hand_settings(self, state, settings):
+        state.pointer_filter.smoothing = settings.smoothing
+        state.cursor_controller.sensitivity = settings.cursor_sensitivity
+        state.cursor_controller.set_curve("MODE_3", POINTER_CURVES[settings.pointer_curve])
+    
+    def _create_hand_state(self, hand_id, slot):
+        """Fresh filter and controllers for a newly tracked hand"""
+        settings = self._active_settings
+        state = HandState.create(hand_id, slot, self.actuator, (self.screen_width, self.screen_height),
+                                 self.pointer_filter_name, settings.smoothing, layout=self.monitor_layout,
+                                 scroll_scheduler=self.scroll_scheduler)
+        self._apply_hand_settings(state, settings)
+        return state
+    
+    def _set_startup_status(self, status):
+        self.startup_status = status
+        self._publish_status()
+    
+    def _publish_status(self):
+        """Queue a status snapshot for the GUI; the oldest is dropped when full"""
+        status = {
+            'current_mode': self.current_mode,
+            'last_gesture': self.last_gesture,
+            'fps': self.fps,
+            'idle': self.idle,
+            'startup_status': self.startup_status,
+            'input': self.actuator.stats() if hasattr(self.actuator, 'stats') else None,
+            'roi': self.roi_tracker.stats() if self.roi_tracking else None,
+        }
+        while True:
+            try:
+                self.status_queue.put_nowait(status)
+                return
+            except queue.Full:
+                try:
+                    self.status_queue.get_nowait()
+                except queue.Empty:
+                    pass
+    
+    def prepare(self):
+        """Load the input backend, hand model and camera; returns False on failure.
+        
+        run() calls this on the tracking thread. The camera opens on a
+        helper thread while the backend and model load, and the model runs
+        once on a blank frame so the first real frame does not pay for
+        graph initialisation. Progress is published in startup_status.
+        """
+        if self.prepared:
+            return True
+        timings = self.startup_timings
+        
+        camera_thread = threading.Thread(target=self._prepare_camera, daemon=True)
+        camera_thread.start()
+        
+        self._set_startup_status("Loading input backend")
+        start = time.perf_counter()
+        self._prepare_actuator()
+        timings['backend_s'] = time.perf_counter() - start
+        
+        # Worker processes build and warm up their own graphs
+        if not self.inference_workers:
+            self._set_startup_status("Loading hand model")
+            start = time.perf_counter()
+            import mediapipe as mp
+            self.mp_hands = mp.solutions.hands
+            self.hands = self.mp_hands.Hands(
+                static_image_mode=False,
+                max_num_hands=self.max_num_hands,
+                min_detection_confidence=0.7,
+                min_tracking_confidence=0.5
+            )
+            timings['model_s'] = time.perf_counter() - start
             
-            if self.cam_width == 0 or self.cam_height == 0:
-                print("Error: Could not get camera resolution")
-                self.cap.release()
-                self.cap = None
+            self._set_startup_status("Warming up hand model")
+            start = time.perf_counter()
+            self.hands.process(np.zeros((self.cam_height, self.cam_width, 3), dtype=np.uint8))
+            timings['warmup_s'] = time.perf_counter() - start
+        
+        self._set_startup_status("Opening camera")
+        camera_thread.join()
+        if self.frame_grabber is None:
+            self._set_startup_status("Camera failed")
+            print("Failed to initialize camera")
+            return False
+        
+        self.prepared = True
+        self._set_startup_status("Ready")
+        return True
+    
+    def _prepare_actuator(self):
+        """Find the monitors and create the input backend for the desktop size"""
+        if self.monitor_layout is None:
+            self.monitor_layout = detect_monitor_layout()
+        if self.monitor_layout is None:
+            if self.screen_size is None:
+                self.screen_size = self._detect_screen_size()
+            self.monitor_layout = MonitorLayout.single(*self.screen_size)
+        layout = self.monitor_layout
+        # The whole virtual desktop, which may start left of or above the
+        # primary monitor; cursors are clamped per monitor
+        self.screen_left, self.screen_top = layout.left, layout.top
+        self.screen_width, self.screen_height = layout.width, layout.height
+        print(f"Screen resolution: {self.screen_width} x {self.screen_height} "
+              f"at ({self.screen_left}, {self.screen_top}) ({layout})")
+        for monitor in layout.monitors if len(layout.monitors) > 1 else ():
+            print(f"  {monitor}")
+        
+        # Input injection backend, selected once at startup. It runs on its
+        # own thread so per-call pauses never block the vision loop
+        backend = create_actuator(self.input_backend, self.screen_width, self.screen_height,
+                                  self.screen_left, self.screen_top)
+        self.input_event_cost = measure_event_cost(backend)
+        print(f"Input backend: {backend.name} ({self.input_event_cost * 1e6:.0f} us/event)")
+        actuator = AsyncActuator(backend)
+        actuator.stage_timer = self.stage_timer
+        actuator.latency_monitor = self.latency_monitor
+        
+        self.initial_cursor_pos = actuator.position()
+        print(f"Initial cursor position: {self.initial_cursor_pos}")
+        self.actuator = actuator
+        
+        # Scroll steps are emitted at a fixed rate from the gesture's
+        # velocity; a slow backend gets a lower rate so steps cannot queue up
+        rate = 120.0
+        if self.input_event_cost > 0:
+            rate = min(rate, 0.5 / self.input_event_cost)
+        self.scroll_scheduler = ScrollScheduler(actuator, rate=rate)
+    
+    def _detect_screen_size(self):
+        """Screen size from a temporary Tk root, when no GUI supplied it"""
+        import tkinter as tk
+        root = tk.Tk()
+        size = (root.winfo_screenwidth(), root.winfo_screenheight())
+        root.destroy()
+        return size
+    
+    def _prepare_camera(self):
+        """Open the frame source and start its grabber (startup helper thread)"""
+        start = time.perf_counter()
+        # Live and real-time sources drop stale frames, offline sources
+        # running as fast as possible hand over every frame
+        drop_frames = self.source.live or self.source.realtime
+        if self.inference_workers:
+            # The source is opened by the capture process, not here
+            grabber = InferenceProcess(self.source, self.inference_workers,
+                                       self.max_num_hands, drop_frames)
+            if not grabber.start():
+                return
+            self._set_resolution(grabber.width, grabber.height)
+        else:
+            if not self._init_camera():
+                return
+            grabber = FrameGrabber(self.source, drop_frames=drop_frames)
+            grabber.start()
+        self.frame_grabber = grabber
+        self.startup_timings['camera_s'] = time.perf_counter() - start
+    
+    def _init_camera(self):
+        """Open the frame source and adopt its resolution"""
+        if not self.source.is_opened():
+            if not self.source.open():
                 return False
-                
-            print(f"Camera resolution: {self.cam_width} x {self.cam_height}")
-            
-            # Update tracking area with actual camera dimensions
-            self.tracking_area = {
-                'left': self.margin,
-                'right': self.cam_width - self.margin,
-                'top': self.margin,
-                'bottom': self.cam_height - self.margin
-            }
-            
-            return True
+            self._set_resolution(self.source.width, self.source.height)
         return True
     
+    def _set_resolution(self, width, height):
+        """Adopt the camera resolution for the tracking area and mapping"""
+        self.cam_width = width
+        self.cam_height = height
+        
+        print(f"Camera resolution: {self.cam_width} x {self.cam_height}")
+        
+        # Update tracking area with actual camera dimensions
+        self.tracking_area = {
+            'left': self.margin,
+            'right': self.cam_width - self.margin,
+            'top': self.margin,
+            'bottom': self.cam_height - self.margin
+        }
+    
     def _release_camera(self):
         """Release camera resources"""
-        if self.cap:
-            self.cap.release()
-            self.cap = None
-            cv2.destroyAllWindows()
+        if self.frame_grabber:
+            self.frame_grabber.stop()
+            self.frame_grabber = None
+        if self.source.is_opened():
+            self.source.release()
     
-    def process_frame(self, frame):
-        """Process a single frame and return the processed frame and detection results"""
-        frame = cv2.flip(frame, 1)
-        
-        self.ui_overlay.draw_tracking_area(frame, self.tracking_area)
-        
-        rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        results = self.hands.process(rgb_frame)
+    def process_frame(self, frame, hands=None):
+        """Process a single frame and return the processed frame and detection results.
+        
+        hands, when given, are detections for this unflipped frame already
+        in mirrored coordinates (from the inference workers); inference is
+        then skipped. The returned frame is the preview with its overlay
+        when one was drawn, else the camera frame.
+        """
+        timer = self.stage_timer
+        timer.begin()
+        settings = self._adopt_settings()
+        # Frames the preview would drop are neither shrunk nor drawn on
+        show_preview = settings.show_camera_feed and self.preview.due()
+        
+        flipped = False
+        if hands is None:
+            if self.mirror_landmarks:
+                if self._rgb_buffer is None or self._rgb_buffer.shape != frame.shape:
+                    self._rgb_buffer = np.empty_like(frame)
+                rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=self._rgb_buffer)
+                timer.lap(CONVERT)
+                hands = mirror_hands(self._detect_hands(rgb_frame))
+            else:
+                frame = cv2.flip(frame, 1)
+                flipped = True
+                rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+                timer.lap(CONVERT)
+                hands = self._detect_hands(rgb_frame)
+            timer.lap(INFERENCE)
+        
+        if self.recorder is not None:
+            self.recorder.record(hands, self.last_frame_timestamp, frame.shape)
+            timer.lap(INFERENCE)
+        
+        # The preview is downscaled (and mirrored, unless the camera frame
+        # already was) first; the overlay is drawn on the small image
+        canvas = None
+        if show_preview:
+            canvas = self.preview.shrink(frame, mirror=not flipped)
+            timer.lap(DISPLAY)
+        
+        # Nothing is drawn unless the preview is shown with its overlay
+        draw_overlay = show_preview and settings.show_overlay
+        if draw_overlay:
+            self.ui_overlay.begin(canvas, frame.shape[1])
+            self.ui_overlay.draw_static(canvas, self.tracking_area)
+            timer.lap(OVERLAY)
         
         detection_result = {
             'mode_detected': False,
@@ -170,92 +432,179 @@ class HandTracker:
         }
         
         current_mode = "NONE"
-        cam_x, cam_y = None, None
-        click_action = "NONE"
-        scroll_delta_y = 0
-        screen_x, screen_y = None, None
-        previous_position = getattr(self, '_previous_position', None)
-        
-        if results.multi_hand_landmarks:
-            for hand_landmarks in results.multi_hand_landmarks:
-                self.mp_draw.draw_landmarks(
-                    frame, hand_landmarks, self.mp_hands.HAND_CONNECTIONS
-                )
+        info_drawn = False
+        
+        # Match detections to tracked hands. Each hand is smoothed in its own
+        # skeleton slot; gesture and click detection read the smoothed
+        # landmarks, the fingertip goes through the hand's pointer filter
+        states = self.hand_registry.assign(hands, time.perf_counter())
+        for state in states:
+            state.hand.smoothed = self.skeleton_filter.update(state.slot, state.hand.points)
+        for state in self.hand_registry.states:
+            if state.hand is None:
+                self.skeleton_filter.reset(state.slot)
+                state.pointer_filter.reset()
+                state.scroll_controller.release()
+        timer.lap(GESTURE)
+        
+        if states:
+            self._last_hand_time = time.perf_counter()
+            for state in states:
+                hand = state.hand
+                points = hand.smoothed
+                if draw_overlay:
+                    self.ui_overlay.draw_landmarks(canvas, points)
+                    timer.lap(OVERLAY)
                 
-                current_mode = self.gesture_detector.detect_gesture_mode(hand_landmarks)
+                current_mode = state.gesture_detector.detect_gesture_mode(points, self.last_frame_timestamp)
+                state.mode = current_mode
                 
                 if current_mode in ["MODE_1", "MODE_2", "MODE_3"]:
                     detection_result['mode_detected'] = True
-                    detection_result['hand_landmarks'] = hand_landmarks
+                    detection_result['hand_landmarks'] = hand
                     detection_result['gesture'] = current_mode
                     detection_result['current_mode'] = current_mode
                 
-                cam_x, cam_y = self.gesture_detector.get_finger_tip_position(hand_landmarks, frame.shape, current_mode)
+                cam_x, cam_y = state.gesture_detector.get_finger_tip_position(hand.points, frame.shape, current_mode)
+                # Disabled modes and gestures outside this hand's role leave
+                # its controllers alone
+                allowed = state.allows(current_mode) and settings.mode_enabled(current_mode)
+                action_mode = current_mode if allowed else "NONE"
+                timer.lap(GESTURE)
                 
                 smooth_cam_pos = None
+                click_action = "NONE"
+                scroll_delta = (0, 0)
+                screen_x, screen_y = None, None
                 
                 if cam_x is not None and cam_y is not None:
+                    # Input events issued from here on carry this frame's capture time
+                    self.actuator.set_origin(self.last_frame_timestamp, current_mode)
                     current_pos = (cam_x, cam_y)
-                    smooth_cam_pos = self.stability_filter.smooth_position(current_pos, previous_position)
-                    self._previous_position = smooth_cam_pos
+                    smooth_cam_pos = state.pointer_filter.filter(
+                        current_pos, self.last_frame_timestamp, time.perf_counter())
                     
-                    if current_mode == "MODE_1":
-                        click_action = self.click_handler.handle_click_detection(hand_landmarks, current_mode, smooth_cam_pos)
-                        screen_x, screen_y = self.cursor_controller.calculate_relative_position(smooth_cam_pos, current_mode)
-                    elif current_mode == "MODE_2":
-                        _, scroll_delta_y = self.scroll_controller.handle_scroll_control(smooth_cam_pos, current_mode)
-                        screen_x, screen_y = None, None
-                    elif current_mode == "MODE_3":
-                        click_action = self.click_handler.handle_click_detection(hand_landmarks, current_mode, smooth_cam_pos)
-                        screen_x, screen_y = self.cursor_controller.calculate_relative_position(smooth_cam_pos, current_mode)
-                    else:
-                        screen_x, screen_y = None, None
+                    if action_mode != "MODE_2":
+                        # Leaving the scroll gesture lets the scroll coast out
+                        state.scroll_controller.release()
+                    if action_mode == "MODE_1":
+                        click_action = state.click_handler.handle_click_detection(points, action_mode, smooth_cam_pos)
+                        screen_x, screen_y = state.cursor_controller.calculate_relative_position(smooth_cam_pos, action_mode)
+                    elif action_mode == "MODE_2":
+                        scroll_delta = state.scroll_controller.handle_scroll_control(
+                            smooth_cam_pos, action_mode, self.last_frame_timestamp)
+                    elif action_mode == "MODE_3":
+                        click_action = state.click_handler.handle_click_detection(points, action_mode, smooth_cam_pos)
+                        screen_x, screen_y = state.cursor_controller.calculate_relative_position(smooth_cam_pos, action_mode)
+                    self.actuator.set_origin(None)
+                    timer.lap(CONTROLLERS)
                 
                 self.previous_mode = self.current_mode
                 self.current_mode = current_mode
                 self.last_gesture = current_mode
                 
-                # Draw visual feedback
-                self._draw_visual_feedback(frame, current_mode, smooth_cam_pos, click_action, 
-                                         scroll_delta_y, screen_x, screen_y)
+                # Draw visual feedback; the text panel describes the first active hand
+                if draw_overlay:
+                    show_info = not info_drawn and action_mode != "NONE"
+                    info_drawn = info_drawn or show_info
+                    self._draw_visual_feedback(canvas, state, action_mode, smooth_cam_pos, click_action, 
+                                             scroll_delta, screen_x, screen_y, show_info)
+                    timer.lap(OVERLAY)
+            
+            # With several hands, report the active one's mode
+            if detection_result['mode_detected']:
+                current_mode = detection_result['current_mode']
+                self.current_mode = current_mode
+                self.last_gesture = current_mode
         else:
             if self.current_mode in ["MODE_1", "MODE_2", "MODE_3"]:
                 print("Hand lost - Resetting position")
                 self._reset_tracking_state()
+                timer.lap(CONTROLLERS)
         
-        self._draw_mode_info(frame, current_mode)
-        self._draw_instructions(frame)
+        if draw_overlay:
+            self.ui_overlay.draw_mode_info(canvas, current_mode)
+            timer.lap(OVERLAY)
         
-        return frame, detection_result
+        if show_preview:
+            self.preview.publish(canvas)
+            timer.lap(DISPLAY)
+        
+        return (canvas if canvas is not None else frame), detection_result
     
-    def _draw_visual_feedback(self, frame, current_mode, smooth_cam_pos, click_action, 
-                             scroll_delta_y, screen_x, screen_y):
+    def _detect_hands(self, rgb_frame):
+        """Run hand inference, on the tracked ROI when possible"""
+        if self.roi_tracking and self.roi_tracker.roi is not None:
+            crop = self.roi_tracker.crop(rgb_frame)
+            # Convert each detected hand to a landmark array once per frame
+            hands = hands_from_results(self._get_roi_hands().process(crop))
+            if hands:
+                self.roi_tracker.to_frame(hands[0].points, rgb_frame.shape)
+            if hands and self.roi_tracker.consistent(hands[0].points, rgb_frame.shape):
+                self.roi_tracker.hits += 1
+                self.roi_tracker.update(hands[0].points, rgb_frame.shape)
+                return hands
+            
+            # Lost the hand or it jumped or changed size: fall back to full-frame detection
+            self.roi_tracker.misses += 1
+            self.roi_tracker.reset()
+        
+        hands = hands_from_results(self.hands.process(rgb_frame))
+        
+        if self.roi_tracking:
+            self.roi_tracker.full_frame += 1
+            self.roi_tracker.update(hands[0].points if hands else None, rgb_frame.shape)
+        
+        return hands
+    
+    def _get_roi_hands(self):
+        """Separate graph for ROI crops so full-frame tracking state stays valid"""
+        if self.roi_hands is None:
+            self.roi_hands = self.mp_hands.Hands(
+                static_image_mode=False,
+                max_num_hands=1,
+                min_detection_confidence=0.5,
+                min_tracking_confidence=0.5
+            )
+        return self.roi_hands
+    
+    def _draw_visual_feedback(self, frame, state, current_mode, smooth_cam_pos, click_action, 
+                             scroll_delta, screen_x, screen_y, show_info=True):
         """Draw visual feedback on frame"""
+        overlay = self.ui_overlay
         if current_mode in ["MODE_1", "MODE_2", "MODE_3"] and smooth_cam_pos is not None:
             cursor_color = (0, 255, 0)
-            cv2.circle(frame, smooth_cam_pos, 10, cursor_color, -1)
-            cv2.circle(frame, smooth_cam_pos, 15, cursor_color, 2)
+            cam_point = overlay.point(*smooth_cam_pos)
+            cv2.circle(frame, cam_point, overlay.length(10), cursor_color, -1)
+            cv2.circle(frame, cam_point, overlay.length(15), cursor_color, overlay.length(2))
+            if self.max_num_hands > 1:
+                overlay.text(frame, f"{state.handedness} #{state.hand_id} ({state.role})",
+                             (cam_point[0] + overlay.length(18), cam_point[1] - overlay.length(18)),
+                             0.4, cursor_color)
             
             if self.initial_position and current_mode == "MODE_1":
-                cv2.circle(frame, self.initial_position, 8, (0, 0, 255), 2)
-                cv2.putText(frame, "START", 
-                          (self.initial_position[0] - 25, self.initial_position[1] - 15),
-                          cv2.FONT_HERSHEY_SIMPLEX, 0.4, (0, 0, 255), 1)
+                start = overlay.point(*self.initial_position)
+                cv2.circle(frame, start, overlay.length(8), (0, 0, 255), overlay.length(2))
+                overlay.text(frame, "START", (start[0] - overlay.length(25), start[1] - overlay.length(15)),
+                             0.4, (0, 0, 255))
             elif self.scroll_initial_pos and current_mode == "MODE_2":
-                cv2.circle(frame, self.scroll_initial_pos, 8, (255, 0, 255), 2)
-                cv2.putText(frame, "SCROLL", 
-                          (self.scroll_initial_pos[0] - 30, self.scroll_initial_pos[1] - 15),
-                          cv2.FONT_HERSHEY_SIMPLEX, 0.4, (255, 0, 255), 1)
+                start = overlay.point(*self.scroll_initial_pos)
+                cv2.circle(frame, start, overlay.length(8), (255, 0, 255), overlay.length(2))
+                overlay.text(frame, "SCROLL", (start[0] - overlay.length(30), start[1] - overlay.length(15)),
+                             0.4, (255, 0, 255))
         
         # Draw mode-specific information
+        if not show_info:
+            return
         if current_mode == "MODE_1" and screen_x is not None and screen_y is not None:
-            self._draw_mode1_info(frame, smooth_cam_pos, screen_x, screen_y, click_action)
+            self._draw_mode1_info(frame, state, smooth_cam_pos, screen_x, screen_y, click_action)
         elif current_mode == "MODE_2":
-            self._draw_mode2_info(frame, smooth_cam_pos, scroll_delta_y)
+            self._draw_mode2_info(frame, state, smooth_cam_pos, scroll_delta)
     
-    def _draw_mode1_info(self, frame, smooth_cam_pos, screen_x, screen_y, click_action):
+    def _draw_mode1_info(self, frame, state, smooth_cam_pos, screen_x, screen_y, click_action):
         """Draw MODE_1 specific information"""
-        actual_cursor = pyautogui.position()
+        overlay = self.ui_overlay
+        actual_cursor = self.actuator.cached_position()
         
         in_tracking_area = (
             self.tracking_area['left'] <= smooth_cam_pos[0] <= self.tracking_area['right'] and
@@ -263,17 +612,15 @@ class HandTracker:
         )
         
         status_color = (0, 255, 0) if in_tracking_area else (0, 0, 255)
-        cv2.putText(frame, f"Camera: ({smooth_cam_pos[0]}, {smooth_cam_pos[1]})", 
-                  (10, 60), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 2)
-        cv2.putText(frame, f"Target: ({screen_x}, {screen_y})", 
-                  (10, 90), cv2.FONT_HERSHEY_SIMPLEX, 0.6, status_color, 2)
-        cv2.putText(frame, f"Actual: ({actual_cursor[0]}, {actual_cursor[1]})", 
-                  (10, 120), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 255), 2)
+        overlay.text(frame, f"Camera: ({smooth_cam_pos[0]:.0f}, {smooth_cam_pos[1]:.0f})",
+                     overlay.at(10, 60), 0.6, (255, 255, 255), 2)
+        overlay.text(frame, f"Target: ({screen_x}, {screen_y})",
+                     overlay.at(10, 90), 0.6, status_color, 2)
+        overlay.text(frame, f"Actual: ({actual_cursor[0]}, {actual_cursor[1]})",
+                     overlay.at(10, 120), 0.6, (0, 255, 255), 2)
         
         # Click feedback
-        if hasattr(self.click_handler, 'detect_finger_touch') and self.click_handler.detect_finger_touch(
-            getattr(self, '_last_hand_landmarks', None) if hasattr(self, '_last_hand_landmarks') else None
-        ):
+        if state.click_handler.detect_finger_touch(state.hand.smoothed):
             if click_action == "DRAGGING":
                 click_text = "DRAGGING - Move to drag object"
                 click_color = (255, 0, 0)
@@ -287,70 +634,49 @@ class HandTracker:
                 click_text = "FINGERS DETECTED"
                 click_color = (0, 255, 255)
         else:
-            click_text = "Touch: Click | Hold: Right-click | Move while touch: Drag"
+            click_text = "Touch: Click | Hold: Right-click | Touch+move: Drag"
             click_color = (255, 255, 255)
             
-        cv2.putText(frame, click_text, 
-                  (10, 150), cv2.FONT_HERSHEY_SIMPLEX, 0.5, click_color, 2)
+        overlay.text(frame, click_text,
+                     overlay.at(10, 150), 0.5, click_color, 2)
         
         if click_action in ["SINGLE_CLICK", "DOUBLE_CLICK", "RIGHT_CLICK", "DRAG_END"]:
             action_text = f"Last Action: {click_action.replace('_', ' ')}"
-            cv2.putText(frame, action_text, 
-                      (10, 170), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 0), 2)
+            overlay.text(frame, action_text,
+                         overlay.at(10, 180), 0.5, (0, 255, 0), 2)
         
         stability_text = f"Stability: {len(self.stability_buffer)}/{self.buffer_size}"
-        cv2.putText(frame, stability_text, 
-                  (10, 190), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (128, 128, 128), 1)
+        overlay.text(frame, stability_text,
+                     overlay.at(10, 210), 0.5, (128, 128, 128), 1)
     
-    def _draw_mode2_info(self, frame, smooth_cam_pos, scroll_delta_y):
+    def _draw_mode2_info(self, frame, state, smooth_cam_pos, scroll_delta):
         """Draw MODE_2 specific information"""
-        cv2.putText(frame, f"Camera: ({smooth_cam_pos[0]}, {smooth_cam_pos[1]})", 
-                  (10, 60), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 2)
-        cv2.putText(frame, f"Scroll Delta Y: {scroll_delta_y:+d}", 
-                  (10, 90), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 0, 255), 2)
-        
-        delta_magnitude = abs(scroll_delta_y)
-        cv2.putText(frame, f"Scroll Speed: {self.scroll_speed_multiplier:.1f}x (Distance: {delta_magnitude:.1f})", 
-                  (10, 120), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 0, 255), 2)
-        
-        direction_text = ""
-        if self.scroll_direction_y != 0:
-            direction_text = "DOWN" if self.scroll_direction_y > 0 else "UP"
+        overlay = self.ui_overlay
+        delta_x, delta_y = scroll_delta
+        overlay.text(frame, f"Camera: ({smooth_cam_pos[0]:.0f}, {smooth_cam_pos[1]:.0f})",
+                     overlay.at(10, 60), 0.6, (255, 255, 255), 2)
+        overlay.text(frame, f"Scroll Delta: ({delta_x:+.0f}, {delta_y:+.0f})",
+                     overlay.at(10, 90), 0.6, (255, 0, 255), 2)
+        
+        delta_magnitude = max(abs(delta_x), abs(delta_y))
+        speed = state.scroll_controller.scroll_speed_multiplier
+        overlay.text(frame, f"Scroll Speed: {speed:.1f}x (Distance: {delta_magnitude:.1f})",
+                     overlay.at(10, 120), 0.6, (255, 0, 255), 2)
+        
+        # Positive scroll steps scroll up and right
+        directions = []
+        if state.scroll_controller.scroll_direction_y != 0:
+            directions.append("UP" if state.scroll_controller.scroll_direction_y > 0 else "DOWN")
+        if state.scroll_controller.scroll_direction_x != 0:
+            directions.append("RIGHT" if state.scroll_controller.scroll_direction_x > 0 else "LEFT")
+        direction_text = "-".join(directions)
         
         if direction_text:
-            cv2.putText(frame, f"Direction: {direction_text}", 
-                      (10, 150), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 0, 255), 2)
+            overlay.text(frame, f"Direction: {direction_text}",
+                         overlay.at(10, 150), 0.6, (255, 0, 255), 2)
         else:
-            cv2.putText(frame, "Move finger up/down from start for vertical scrolling", 
-                      (10, 150), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 0, 255), 2)
-    
-    def _draw_mode_info(self, frame, current_mode):
-        """Draw current mode information"""
-        mode_color = {
-            "MODE_1": (0, 255, 0),
-            "MODE_2": (255, 0, 255),
-            "MODE_3": (255, 255, 0),
-            "NONE": (128, 128, 128)
-        }
-        
-        mode_text = {
-            "MODE_1": "MODE 1: Precise Cursor Control (1:1)",
-            "MODE_2": "MODE 2: Vertical Scroll Control",
-            "MODE_3": "MODE 3: Exponential Cursor Control",
-            "NONE": "No Gesture Detected"
-        }
-        
-        cv2.putText(frame, mode_text[current_mode], 
-                   (10, 30), cv2.FONT_HERSHEY_SIMPLEX, 0.7, mode_color[current_mode], 2)
-    
-    def _draw_instructions(self, frame):
-        """Draw instruction text"""
-        cv2.putText(frame, "MODE 1: Index=Precise | MODE 2: Index+Middle=Vertical Scroll | MODE 3: Pinky=Exponential", 
-                   (10, frame.shape[0] - 60), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 255), 2)
-        cv2.putText(frame, "M1: 1:1 Control | M2: Up/Down=Scroll | M3: Fast Long Distance Movement", 
-                   (10, frame.shape[0] - 40), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 255), 2)
-        cv2.putText(frame, "FAILSAFE: Move mouse to top-left | Press 'q' to quit", 
-                   (10, frame.shape[0] - 20), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 255), 2)
+            overlay.text(frame, "Move finger away from start to scroll",
+                         overlay.at(10, 150), 0.6, (255, 0, 255), 2)
     
     def _reset_tracking_state(self):
         """Reset tracking state"""
@@ -361,6 +687,35 @@ class HandTracker:
         self.current_mode = "NONE"
         self.is_clicking = False
         self.stability_buffer = []
+        for state in self.hand_registry.states:
+            state.pointer_filter.reset()
+            state.scroll_controller.release()
+    
+    def _enter_idle(self, grabber):
+        """Drop to low-rate capture until motion is detected"""
+        print("No hand detected - entering idle mode")
+        self.idle = True
+        self.motion_detector.reset()
+        grabber.min_interval = 1.0 / self.idle_fps
+        if self.current_mode != "NONE":
+            self._reset_tracking_state()
+        self.hand_registry.reset()
+    
+    def _exit_idle(self, grabber):
+        """Resume full-rate capture and inference"""
+        print("Motion detected - resuming tracking")
+        self.idle = False
+        self._last_hand_time = time.perf_counter()
+        grabber.min_interval = 0.0
+    
+    def _report_startup(self):
+        """Record and print the time from launch to the first processed frame"""
+        timings = self.startup_timings
+        timings['first_frame_s'] = time.perf_counter() - self.started_at
+        parts = ", ".join(f"{name[:-2]} {timings[name]:.2f} s"
+                          for name in ('backend_s', 'model_s', 'warmup_s', 'camera_s') if name in timings)
+        print(f"First frame processed {timings['first_frame_s']:.2f} s after launch ({parts})")
+        self._set_startup_status(f"Ready - first frame after {timings['first_frame_s']:.2f} s")
     
     def _update_fps(self):
         """Update FPS calculation"""
@@ -372,10 +727,22 @@ class HandTracker:
             self.frame_count = 0
             self.fps_start_time = current_time
     
+    def _maybe_publish_status(self):
+        now = time.perf_counter()
+        if now - self._last_status_time >= self.status_interval:
+            self._last_status_time = now
+            self._publish_status()
+    
     def stop(self):
         """Stop the hand tracker"""
         self.running = False
+        self._stop_requested = True
         self._release_camera()
+        if self.scroll_scheduler is not None:
+            self.scroll_scheduler.shutdown()
+        if self.actuator is not None:
+            self.actuator.stop()
+        self._publish_status()
     
     def run(self):
         """Main tracking loop"""
@@ -390,41 +757,80 @@ class HandTracker:
         print("    - Hold touch = Right click")
         print("    - Touch & move = Drag and drop")
         print("  MODE 2: Index + Middle fingers extended (parallel)")
-        print("    - Set direction = Continuous delta-based scroll")
+        print("    - Set direction = Continuous delta-based scroll, vertical or horizontal")
         print("    - Speed increases exponentially with finger distance")
         print("    - Move finger further for faster scroll")
         
-        if not self._init_camera():
-            print("Failed to initialize camera")
+        if not self.prepare():
+            self.stop()
+            return
+        if self._stop_requested:
+            # Stopped from the GUI while still starting up
+            self.stop()
             return
         
         self.running = True
+        self.actuator.start()
+        self.scroll_scheduler.start()
+        grabber = self.frame_grabber
+        first_frame = True
+        next_deadline = time.perf_counter()
+        self._last_hand_time = next_deadline
         
         try:
             while self.running:
-                # Read frame
-                ret, frame = self.cap.read()
-                if not ret:
-                    print("Error: Could not read frame")
-                    break
+                # Take the newest frame, older ones are dropped by the grabber
+                frame, timestamp = grabber.read_latest()
+                if frame is None:
+                    if grabber.failed:
+                        break
+                    continue
+                
+                self.last_frame_timestamp = timestamp
+                settings = self._adopt_settings()
+                # Time the frame spent between capture and pickup
+                self.stage_timer.record(CAPTURE, grabber.frame_age(timestamp))
                 
-                # Process frame
-                processed_frame, detection_result = self.process_frame(frame)
+                if self.idle:
+                    if not self.motion_detector.detect(frame):
+                        self._update_fps()
+                        self._maybe_publish_status()
+                        if settings.show_camera_feed and self.preview.due():
+                            idle_frame = self.preview.shrink(frame, mirror=True)
+                            self.ui_overlay.begin(idle_frame, frame.shape[1])
+                            self.ui_overlay.text(idle_frame, "IDLE - move your hand to wake up",
+                                                 self.ui_overlay.at(10, 30), 0.7, (128, 128, 128), 2)
+                            self.preview.publish(idle_frame)
+                        continue
+                    self._exit_idle(grabber)
                 
-                # Display frame if enabled
-                if self.show_camera_feed:
-                    cv2.imshow('Hand Tracking', processed_frame)
+                # Process frame; worker processes have already found the hands
+                hands = grabber.latest_hands if self.inference_workers else None
+                processed_frame, detection_result = self.process_frame(frame, hands)
+                self.frame_latency = grabber.frame_age(timestamp)
+                
+                if first_frame:
+                    first_frame = False
+                    self._report_startup()
+                
+                if (self.idle_timeout and 
+                        time.perf_counter() - self._last_hand_time > self.idle_timeout):
+                    self._enter_idle(grabber)
                 
                 # Update FPS
                 self._update_fps()
+                self._maybe_publish_status()
+                self.stage_timer.end_frame()
                 
-                # Handle key presses
-                key = cv2.waitKey(1) & 0xFF
-                if key == ord('q'):
-                    break
-                
-                # Small delay to prevent excessive CPU usage
-                time.sleep(0.01)
+                # Waiting on the grabber paces the loop to the camera; an
+                # optional target rate caps it further
+                if self.target_fps:
+                    next_deadline += 1.0 / self.target_fps
+                    delay = next_deadline - time.perf_counter()
+                    if delay > 0:
+                        time.sleep(delay)
+                    else:
+                        next_deadline = time.perf_counter()
                     
         except KeyboardInterrupt:
             print("\nShutting down...")
@@ -432,8 +838,13 @@ class HandTracker:
             self.stop()
 
 if __name__ == "__main__":
+    import sys
+    
     try:
-        tracker = HandTracker()
+        # Optional source: camera index, video file, image directory or "synthetic",
+        # then optionally the number of inference worker processes
+        tracker = HandTracker(sys.argv[1] if len(sys.argv) > 1 else None,
+                              inference_workers=int(sys.argv[2]) if len(sys.argv) > 2 else 0)
         tracker.run()
     except Exception as e:
         print(f"Fatal error: {e}")
@@ -0,0 +1,289 @@
+import multiprocessing as mp
+import queue
+import time
+
+import cv2
+import numpy as np
+
+from .frame_ring import FrameRing
+from .hand_landmarks import HANDEDNESS_CODES, HANDEDNESS_LABELS, NUM_LANDMARKS, Hand, hands_from_results, mirror_hands
+
+# Spare ring slots beyond one per worker, so the slot of the newest result
+# is rarely rewritten before the control process has copied it out
+_SPARE_SLOTS = 4
+
+
+def _capture_main(source, results, setup, tasks, idle_workers, busy, slots,
+                  stop, min_interval, dropped, drop_frames):
+    """Capture process: read frames straight into free ring slots"""
+    if not source.open():
+        results.put(('failed',))
+        return
+    shape = (source.height, source.width, 3)
+    results.put(('ready', shape, source.fps))
+
+    ring = FrameRing.attach(setup.get(), shape, slots)
+    scratch = np.empty(shape, dtype=np.uint8)
+    seq = 0
+    next_slot = 0
+    last_read = 0.0
+
+    try:
+        while not stop.is_set():
+            interval = min_interval.value
+            if interval > 0:
+                delay = last_read + interval - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+            last_read = time.perf_counter()
+
+            slot = next((s % slots for s in range(next_slot, next_slot + slots)
+                         if not busy[s % slots]), None)
+            if slot is not None:
+                # Mark the slot as being rewritten, so a reader still copying
+                # its previous frame sees the seq change
+                ring.set_seq(slot, 0)
+                target = ring.frame(slot)
+            else:
+                target = scratch
+            if not source.read_into(target):
+                results.put(('eof',))
+                break
+            captured_at = time.perf_counter()
+
+            if slot is None:
+                dropped.value += 1
+                continue
+            if drop_frames:
+                if not idle_workers.acquire(block=False):
+                    # Every worker is busy; newer frames will replace this one
+                    dropped.value += 1
+                    continue
+            else:
+                while not idle_workers.acquire(timeout=0.1):
+                    if stop.is_set():
+                        return
+
+            seq += 1
+            ring.set_seq(slot, seq)
+            busy[slot] = 1
+            tasks.put((seq, slot, captured_at))
+            next_slot = slot + 1
+    finally:
+        source.release()
+        ring.close()
+
+
+def _inference_main(ring_name, shape, slots, tasks, results, idle_workers, busy, max_num_hands):
+    """Inference process: run MediaPipe on ring slots, send back landmarks only"""
+    import mediapipe as mp_solutions
+
+    ring = FrameRing.attach(ring_name, shape, slots)
+    hands = mp_solutions.solutions.hands.Hands(
+        static_image_mode=False,
+        max_num_hands=max_num_hands,
+        min_detection_confidence=0.7,
+        min_tracking_confidence=0.5
+    )
+    rgb = np.empty(shape, dtype=np.uint8)
+    # Warm up on a blank frame before taking work
+    rgb[...] = 0
+    hands.process(rgb)
+    idle_workers.release()
+
+    try:
+        while True:
+            task = tasks.get()
+            if task is None:
+                break
+            seq, slot, captured_at = task
+
+            cv2.cvtColor(ring.frame(slot), cv2.COLOR_BGR2RGB, dst=rgb)
+            detected = mirror_hands(hands_from_results(hands.process(rgb)))
+
+            points = np.empty((len(detected), NUM_LANDMARKS, 3), dtype=np.float32)
+            codes = np.empty(len(detected), dtype=np.int8)
+            scores = np.empty(len(detected), dtype=np.float32)
+            for i, hand in enumerate(detected):
+                points[i] = hand.points
+                codes[i] = HANDEDNESS_CODES.get(hand.handedness, -1)
+                scores[i] = hand.score
+
+            results.put(('hands', seq, slot, captured_at, points, codes, scores))
+            busy[slot] = 0
+            idle_workers.release()
+    finally:
+        hands.close()
+        ring.close()
+
+
+class InferenceProcess:
+    """Runs capture and hands.process() in worker processes.
+
+    A capture process reads frames directly into a shared-memory FrameRing
+    and hands slot numbers to `workers` inference processes, each with its
+    own MediaPipe graph. Only landmark arrays, handedness codes, scores and
+    timestamps come back through a queue; frames never cross a pipe.
+    Landmarks are mirrored in the worker, as in HandTracker's mirror mode.
+
+    Offers the FrameGrabber interface: read_latest() returns the newest
+    (frame, capture timestamp) and sets latest_hands to that frame's hands.
+    The frame is copied out of the ring into a buffer that the next
+    read_latest() reuses; a copy whose slot was rewritten meanwhile (the
+    slot's seq changed) is discarded. Results arriving out of order from
+    different workers are dropped in favour of the newest.
+
+    With several workers each MediaPipe graph tracks every workers-th
+    frame, so tracking between frames is coarser; the gain is throughput on
+    multi-core machines.
+    """
+
+    def __init__(self, source, workers=1, max_num_hands=1, drop_frames=True):
+        self.source = source
+        self.workers = max(1, workers)
+        self.max_num_hands = max_num_hands
+        self.drop_frames = drop_frames
+        self.slots = self.workers + _SPARE_SLOTS
+
+        self._ctx = mp.get_context("spawn")
+        self._results = self._ctx.Queue()
+        self._setup = self._ctx.Queue()
+        self._tasks = self._ctx.Queue()
+        self._idle_workers = self._ctx.Semaphore(0)
+        self._busy = self._ctx.Array('b', self.slots, lock=False)
+        self._stop = self._ctx.Event()
+        self._min_interval = self._ctx.Value('d', 0.0, lock=False)
+        self._dropped = self._ctx.Value('q', 0, lock=False)
+        self._processes = []
+        self._ring = None
+        self._last_seq = 0
+        self._frame = None
+
+        self.width = 0
+        self.height = 0
+        self.fps = 0.0
+        self.latest_hands = []
+        self.running = False
+        self.failed = False
+        self.frames_captured = 0
+        self.stale_results = 0
+
+    @property
+    def min_interval(self):
+        return self._min_interval.value
+
+    @min_interval.setter
+    def min_interval(self, value):
+        # Read by the capture process before every frame
+        self._min_interval.value = value
+
+    @property
+    def frames_dropped(self):
+        return self._dropped.value + self.stale_results
+
+    def start(self, timeout=10.0):
+        """Start the worker processes; returns False if the source did not open"""
+        capture = self._ctx.Process(
+            target=_capture_main, daemon=True,
+            args=(self.source, self._results, self._setup, self._tasks, self._idle_workers,
+                  self._busy, self.slots, self._stop, self._min_interval, self._dropped,
+                  self.drop_frames))
+        capture.start()
+        self._processes.append(capture)
+
+        try:
+            message = self._results.get(timeout=timeout)
+        except queue.Empty:
+            message = ('failed',)
+        if message[0] != 'ready':
+            print("Error: inference worker could not open the frame source")
+            self.failed = True
+            self.stop()
+            return False
+
+        shape, self.fps = message[1], message[2]
+        self.height, self.width = shape[:2]
+        self._ring = FrameRing.create(shape, self.slots)
+        self._setup.put(self._ring.name)
+
+        for _ in range(self.workers):
+            worker = self._ctx.Process(
+                target=_inference_main, daemon=True,
+                args=(self._ring.name, shape, self.slots, self._tasks, self._results,
+                      self._idle_workers, self._busy, self.max_num_hands))
+            worker.start()
+            self._processes.append(worker)
+
+        self.running = True
+        return True
+
+    def stop(self):
+        """Stop and join all worker processes and free the ring"""
+        self.running = False
+        self._stop.set()
+        for _ in range(self.workers):
+            self._tasks.put(None)
+        for process in self._processes:
+            process.join(timeout=2.0)
+            if process.is_alive():
+                process.terminate()
+        self._processes = []
+        if self._ring is not None:
+            self._ring.close()
+            self._ring = None
+
+    def read_latest(self, timeout=1.0):
+        """Return (frame, captured_at) for the newest result, or (None, None)"""
+        try:
+            message = self._results.get(timeout=timeout)
+        except queue.Empty:
+            return None, None
+
+        # Take the highest-seq result of everything already waiting; workers
+        # finish out of order, so the last message is not always the newest.
+        # A failure anywhere in the queue is remembered
+        newest = None
+        while message is not None:
+            if message[0] != 'hands':
+                self.failed = True
+            elif newest is None or message[1] > newest[1]:
+                if newest is not None:
+                    self.stale_results += 1
+                newest = message
+            else:
+                self.stale_results += 1
+            try:
+                message = self._results.get_nowait()
+            except queue.Empty:
+                message = None
+
+        if newest is None:
+            return None, None
+        _, seq, slot, captured_at, points, codes, scores = newest
+        if self._ring is None:
+            # Stopped while waiting
+            return None, None
+        if seq < self._last_seq:
+            self.stale_results += 1
+            return None, None
+
+        source = self._ring.frame(slot)
+        if self._frame is None or self._frame.shape != source.shape:
+            self._frame = np.empty_like(source)
+        np.copyto(self._frame, source)
+        if self._ring.seq(slot) != seq:
+            # The capture process reused the slot while it was copied
+            self.stale_results += 1
+            return None, None
+        self._last_seq = seq
+        self.frames_captured += 1
+
+        self.latest_hands = [Hand(points[i], HANDEDNESS_LABELS.get(int(codes[i]), 'Right'), float(scores[i]))
+                             for i in range(len(points))]
+        return self._frame, captured_at
+
+    def frame_age(self, timestamp):
+        """Seconds since the given capture timestamp"""
+        if timestamp is None:
+            return 0.0
+        return time.perf_counter() - timestamp
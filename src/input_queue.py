@@ -0,0 +1,209 @@
+import collections
+import threading
+import time
+
+import numpy as np
+
+from .stage_timer import ACTUATION
+
+MOVE = "move"
+CLICK = "click"
+SCROLL = "scroll"
+HSCROLL = "hscroll"
+
+
+class AsyncActuator:
+    """Moves input injection off the vision loop onto a dedicated thread.
+
+    Wraps another actuator and exposes the same move_to/click/scroll/position
+    interface. Events go into a bounded queue drained by the actuator thread.
+    Consecutive cursor moves are coalesced into the newest target, while
+    clicks and scrolls keep their order relative to everything else. Queue
+    depth and enqueue-to-injection latency are tracked for monitoring.
+
+    set_origin() tags subsequent events from the calling thread with the
+    capture timestamp and gesture mode of the frame being processed; a
+    latency_monitor, when set, receives the full capture-to-injection
+    latency of each tagged event.
+    """
+
+    def __init__(self, actuator, max_events=64, latency_window=512):
+        self.actuator = actuator
+        self.max_events = max_events
+        self._events = collections.deque()
+        self._condition = threading.Condition()
+        self._thread = None
+        self._pending_target = None
+        self.running = False
+        # Optional StageTimer that receives every injection latency
+        self.stage_timer = None
+        # Optional LatencyMonitor for capture-to-injection latency
+        self.latency_monitor = None
+        # Per thread, so events from another thread are not tagged with
+        # whatever frame the vision loop is on; the scroll scheduler sets
+        # the origin of the velocity it is following on its own thread
+        self._local = threading.local()
+
+        self._latencies = np.zeros(latency_window, dtype=np.float64)
+        self._latency_count = 0
+        self.injected = 0
+        self.coalesced = 0
+        self.dropped = 0
+        self.max_depth = 0
+
+    def start(self):
+        """Start the actuator thread"""
+        if self._thread is not None:
+            return
+        self.running = True
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Flush pending events and stop the actuator thread"""
+        with self._condition:
+            self.running = False
+            self._condition.notify_all()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout=1.0)
+        self._thread = None
+
+    def close(self):
+        self.stop()
+        self.actuator.close()
+
+    def move_to(self, x, y):
+        self._put(MOVE, (x, y))
+
+    def click(self):
+        self._put(CLICK, None)
+
+    def scroll(self, amount):
+        self._put(SCROLL, amount)
+
+    def hscroll(self, amount):
+        self._put(HSCROLL, amount)
+
+    def position(self):
+        """Cursor position, including moves that are queued but not yet injected"""
+        target = self._pending_target
+        if target is not None:
+            return target
+        return self.actuator.position()
+
+    def cached_position(self):
+        """Last known target without an OS round trip, for display"""
+        target = self._pending_target
+        if target is not None:
+            return target
+        return self.actuator.cached_position()
+
+    def set_origin(self, captured_at, mode=None):
+        """Tag the following events with the frame they come from; None clears"""
+        self._local.origin = (captured_at, mode) if captured_at is not None else None
+
+    @property
+    def name(self):
+        return self.actuator.name
+
+    def _put(self, kind, args):
+        now = time.perf_counter()
+        origin = getattr(self._local, 'origin', None)
+
+        if not self.running:
+            # No actuator thread: inject synchronously
+            self._inject(kind, args, now, origin)
+            self.actuator.flush()
+            return
+
+        with self._condition:
+            if kind == MOVE:
+                self._pending_target = args
+                if self._events and self._events[-1][0] == MOVE:
+                    # Only the newest cursor target matters
+                    self._events[-1] = (MOVE, args, now, origin)
+                    self.coalesced += 1
+                    return
+
+            if len(self._events) >= self.max_events and not self._drop_oldest_move():
+                self.dropped += 1
+                print(f"Input queue full - dropping {kind} event")
+                return
+
+            self._events.append((kind, args, now, origin))
+            self.max_depth = max(self.max_depth, len(self._events))
+            self._condition.notify()
+
+    def _drop_oldest_move(self):
+        """Make room by discarding a stale cursor move; clicks and scrolls are kept"""
+        for i, event in enumerate(self._events):
+            if event[0] == MOVE:
+                del self._events[i]
+                self.dropped += 1
+                return True
+        return False
+
+    def _run(self):
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._events or not self.running)
+                if not self._events:
+                    break
+                batch = list(self._events)
+                self._events.clear()
+
+            # Inject everything that queued up, then push it to the OS at once
+            for kind, args, enqueued, origin in batch:
+                self._inject(kind, args, enqueued, origin)
+            try:
+                self.actuator.flush()
+            except Exception as e:
+                print(f"Input flush error: {e}")
+
+            with self._condition:
+                # Position queries go back to the OS once the last queued
+                # move has been injected
+                if self._pending_target is not None and not self._events:
+                    self._pending_target = None
+
+    def _inject(self, kind, args, enqueued, origin=None):
+        try:
+            if kind == MOVE:
+                self.actuator.move_to(*args)
+            elif kind == CLICK:
+                self.actuator.click()
+            elif kind == HSCROLL:
+                self.actuator.hscroll(args)
+            else:
+                self.actuator.scroll(args)
+        except Exception as e:
+            print(f"Input injection error ({kind}): {e}")
+            return
+
+        injected_at = time.perf_counter()
+        latency = injected_at - enqueued
+        self._latencies[self._latency_count % len(self._latencies)] = latency
+        if self.stage_timer is not None:
+            self.stage_timer.record(ACTUATION, latency)
+        if self.latency_monitor is not None and origin is not None:
+            self.latency_monitor.record(origin[1], kind, origin[0], injected_at)
+        self._latency_count += 1
+        self.injected += 1
+
+    @property
+    def queue_depth(self):
+        return len(self._events)
+
+    def stats(self):
+        """Queue depth and injection latency summary (latencies in ms)"""
+        count = min(self._latency_count, len(self._latencies))
+        latencies = self._latencies[:count] * 1000.0
+        return {
+            'queue_depth': len(self._events),
+            'max_depth': self.max_depth,
+            'injected': self.injected,
+            'coalesced': self.coalesced,
+            'dropped': self.dropped,
+            'latency_mean_ms': float(latencies.mean()) if count else 0.0,
+            'latency_p95_ms': float(np.percentile(latencies, 95)) if count else 0.0,
+        }
@@ -0,0 +1,256 @@
+import time
+
+import numpy as np
+
+from .hand_landmarks import NUM_LANDMARKS, INDEX_TIP, HANDEDNESS_CODES, HANDEDNESS_LABELS, Hand, hands_from_results
+
+
+class LandmarkRecorder:
+    """Collects MediaPipe hand landmark streams for offline replay.
+
+    Each recorded frame stores up to max_hands Hand objects as their (21, 3)
+    landmark arrays plus handedness and score. Missing hands are NaN
+    with handedness -1, so a recording is a handful of dense arrays that
+    save to a single .npz file.
+    """
+
+    def __init__(self, max_hands=1):
+        self.max_hands = max_hands
+        self.timestamps = []
+        self.landmarks = []
+        self.handedness = []
+        self.scores = []
+        self.frame_size = (0, 0)
+
+    def __len__(self):
+        return len(self.timestamps)
+
+    def record(self, hands, timestamp=None, frame_shape=None):
+        """Append one frame of detected hands"""
+        if timestamp is None:
+            timestamp = time.perf_counter()
+        if frame_shape is not None:
+            self.frame_size = (frame_shape[1], frame_shape[0])
+
+        points = np.full((self.max_hands, NUM_LANDMARKS, 3), np.nan, dtype=np.float32)
+        handedness = np.full(self.max_hands, -1, dtype=np.int8)
+        scores = np.zeros(self.max_hands, dtype=np.float32)
+
+        for i, hand in enumerate(hands[:self.max_hands]):
+            points[i] = hand.points
+            handedness[i] = HANDEDNESS_CODES.get(hand.handedness, -1)
+            scores[i] = hand.score
+
+        self.timestamps.append(timestamp)
+        self.landmarks.append(points)
+        self.handedness.append(handedness)
+        self.scores.append(scores)
+
+    def save(self, path):
+        """Write the recording to an .npz file"""
+        np.savez_compressed(
+            path,
+            timestamps=np.asarray(self.timestamps, dtype=np.float64),
+            landmarks=np.asarray(self.landmarks, dtype=np.float32).reshape(-1, self.max_hands, NUM_LANDMARKS, 3),
+            handedness=np.asarray(self.handedness, dtype=np.int8).reshape(-1, self.max_hands),
+            scores=np.asarray(self.scores, dtype=np.float32).reshape(-1, self.max_hands),
+            frame_size=np.asarray(self.frame_size, dtype=np.int32),
+        )
+        print(f"Saved {len(self)} frames to {path}")
+
+
+def load_recording(path):
+    """Load a recording saved by LandmarkRecorder.save as a dict of arrays"""
+    with np.load(path) as data:
+        return {key: data[key] for key in data.files}
+
+
+class ReplayClock:
+    """Virtual clock for controllers during a replay; set now to each frame's timestamp"""
+
+    def __init__(self, now=0.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def recorded_hands(recording, index):
+    """Rebuild the Hand objects of one recorded frame"""
+    hands = []
+    for points, code, score in zip(recording['landmarks'][index], recording['handedness'][index],
+                                   recording['scores'][index]):
+        if code >= 0:
+            hands.append(Hand(points, HANDEDNESS_LABELS[int(code)], float(score)))
+    return hands
+
+
+def record_source(source, path, max_hands=1, max_frames=None):
+    """Run MediaPipe over a frame source once and save its landmark stream"""
+    import cv2
+    import mediapipe as mp
+
+    if not source.open():
+        return None
+
+    hands = mp.solutions.hands.Hands(
+        static_image_mode=False,
+        max_num_hands=max_hands,
+        min_detection_confidence=0.7,
+        min_tracking_confidence=0.5
+    )
+    recorder = LandmarkRecorder(max_hands)
+
+    try:
+        while max_frames is None or len(recorder) < max_frames:
+            ret, frame = source.read()
+            if not ret:
+                break
+            timestamp = time.perf_counter()
+            # Same preprocessing as HandTracker.process_frame
+            frame = cv2.flip(frame, 1)
+            results = hands.process(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
+            recorder.record(hands_from_results(results), timestamp, frame.shape)
+    finally:
+        hands.close()
+        source.release()
+
+    recorder.save(path)
+    return recorder
+
+
+# Finger chains as landmark indices (MCP/CMC to tip)
+_FINGERS = [(1, 2, 3, 4), (5, 6, 7, 8), (9, 10, 11, 12), (13, 14, 15, 16), (17, 18, 19, 20)]
+# Base offsets from the palm centre and segment lengths, in hand units
+_FINGER_BASES = [(-0.55, 0.35), (-0.35, -0.45), (-0.1, -0.5), (0.15, -0.47), (0.38, -0.4)]
+_FINGER_SEGMENTS = [(0.3, 0.28, 0.22), (0.4, 0.25, 0.2), (0.45, 0.28, 0.22), (0.4, 0.26, 0.2), (0.3, 0.2, 0.17)]
+
+# Synthetic script: (gesture, seconds, finger flags thumb..pinky)
+_SCRIPT = [
+    ("MODE_1", 3.0, (False, True, False, False, False)),
+    ("MODE_2", 2.0, (False, True, True, False, False)),
+    ("MODE_3", 2.0, (False, False, False, False, True)),
+    ("NONE", 1.0, (False, False, False, False, False)),
+    ("ABSENT", 1.0, None),
+]
+
+
+def synthetic_hand(center, flags, scale=0.12, pinch=False):
+    """Build a (21, 3) skeleton for an upright right hand in a given pose"""
+    points = np.zeros((NUM_LANDMARKS, 3), dtype=np.float32)
+    cx, cy = center
+    points[0] = (cx, cy + 0.7 * scale, 0.0)
+
+    for f, (chain, (bx, by), segments) in enumerate(zip(_FINGERS, _FINGER_BASES, _FINGER_SEGMENTS)):
+        x, y = cx + bx * scale, cy + by * scale
+        points[chain[0]] = (x, y, 0.0)
+        if f == 0:
+            direction = np.array([-0.8, -0.6]) if flags[0] else np.array([0.6, -0.8])
+        else:
+            direction = np.array([0.0, -1.0])
+        for joint, length in zip(chain[1:], segments):
+            if not flags[f]:
+                # Curl each segment further towards the palm
+                direction = np.array([direction[0] * 0.3, abs(direction[1]) * 0.9 + 0.3])
+                direction /= np.linalg.norm(direction)
+            x += direction[0] * length * scale
+            y += direction[1] * length * scale
+            points[joint] = (x, y, -0.02 * (joint % 4))
+
+    if pinch:
+        points[4, :2] = points[12, :2] + (0.004, 0.0)
+        points[3, :2] = points[10, :2] + (0.01, 0.01)
+
+    return points
+
+
+def synthesize_recording(num_frames=900, fps=30.0, seed=0, num_hands=1, jitter=0.002):
+    """Generate a scripted landmark stream without any camera or model.
+
+    The hand cycles through MODE_1 (with a pinch click), MODE_2, MODE_3,
+    NONE and an absent phase. Within each phase it holds still briefly and
+    then starts moving; those motion onsets are returned as frame indices in
+    the 'onsets' array so latency measurements have a known ground truth.
+    A second hand, when requested, holds the MODE_2 pose on the other side
+    and follows the same motion.
+    """
+    rng = np.random.default_rng(seed)
+    landmarks = np.full((num_frames, num_hands, NUM_LANDMARKS, 3), np.nan, dtype=np.float32)
+    handedness = np.full((num_frames, num_hands), -1, dtype=np.int8)
+    scores = np.zeros((num_frames, num_hands), dtype=np.float32)
+    timestamps = np.arange(num_frames, dtype=np.float64) / fps
+    onsets = []
+
+    cycle = sum(seconds for _, seconds, _ in _SCRIPT)
+    hold = 0.3
+
+    for i in range(num_frames):
+        t = (i / fps) % cycle
+        start = 0.0
+        for gesture, seconds, flags in _SCRIPT:
+            if t < start + seconds:
+                break
+            start += seconds
+        local = t - start
+
+        if flags is None:
+            continue
+        # First frame that has moved off the hold position; the epsilon keeps
+        # float error in the phase arithmetic from skipping an onset
+        if hold + 1e-6 < local <= hold + 1.0 / fps + 1e-6:
+            onsets.append(i)
+
+        moving = max(0.0, local - hold)
+        center = (0.45 + 0.12 * np.sin(1.7 * moving), 0.55 + 0.08 * np.sin(2.3 * moving))
+        pinch = gesture == "MODE_1" and 1.5 <= local < 1.8
+
+        for h in range(num_hands):
+            hand_center = center if h == 0 else (1.0 - center[0], center[1])
+            hand_flags = flags if h == 0 else _SCRIPT[1][2]
+            points = synthetic_hand(hand_center, hand_flags, pinch=pinch and h == 0)
+            if h:
+                points[:, 0] = 2 * hand_center[0] - points[:, 0]
+            points[:, :2] += rng.normal(0.0, jitter, size=(NUM_LANDMARKS, 2))
+            landmarks[i, h] = points
+            handedness[i, h] = HANDEDNESS_CODES['Right'] if h == 0 else HANDEDNESS_CODES['Left']
+            scores[i, h] = 0.98
+
+    return {
+        'timestamps': timestamps,
+        'landmarks': landmarks,
+        'handedness': handedness,
+        'scores': scores,
+        'frame_size': np.array([640, 480], dtype=np.int32),
+        'onsets': np.array(onsets, dtype=np.int64),
+    }
+
+
+def motion_onsets(recording, hand_index=0, threshold=0.015, hold=0.3):
+    """Frame indices where the index fingertip starts moving after holding still.
+
+    For recordings without scripted onsets. The tip counts as still while it
+    stays within threshold (normalized units) of where it settled; an onset
+    is the first frame that leaves that spot after at least hold seconds.
+    Detected onsets therefore trail the true start of motion by the time it
+    takes to cover threshold.
+    """
+    timestamps = recording['timestamps']
+    tips = recording['landmarks'][:, hand_index, INDEX_TIP, :2]
+    fps = (len(timestamps) - 1) / (timestamps[-1] - timestamps[0]) if len(timestamps) > 1 else 30.0
+    hold_frames = int(round(hold * fps))
+
+    onsets = []
+    anchor = None
+    still_frames = 0
+    for i, tip in enumerate(tips):
+        if np.isnan(tip[0]):
+            anchor = None
+            continue
+        if anchor is None or np.hypot(*(tip - anchor)) > threshold:
+            if anchor is not None and still_frames >= hold_frames:
+                onsets.append(i)
+            anchor = tip
+            still_frames = 0
+        else:
+            still_frames += 1
+    return np.array(onsets, dtype=np.int64)
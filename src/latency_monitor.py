@@ -0,0 +1,53 @@
+import numpy as np
+
+GESTURE_MODES = ("MODE_1", "MODE_2", "MODE_3")
+
+
+class LatencyMonitor:
+    """Capture-to-injection latency of every input event, per gesture mode.
+
+    The AsyncActuator tags each queued event with the capture timestamp and
+    gesture mode of the frame that produced it, and reports here once the
+    backend has actually issued the event. Latencies go into a preallocated
+    ring per mode. With log_events the monitor also keeps every
+    (injected_at, captured_at, kind, mode) tuple, which the loopback
+    benchmark matches against known motion onsets.
+    """
+
+    def __init__(self, window=1024, enabled=False, log_events=False):
+        self.enabled = enabled
+        self.window = window
+        self.log_events = log_events
+        self.events = []
+        self._samples = np.zeros((len(GESTURE_MODES), window), dtype=np.float64)
+        self._counts = [0] * len(GESTURE_MODES)
+
+    def reset(self):
+        """Drop all samples and logged events"""
+        self._counts = [0] * len(GESTURE_MODES)
+        self.events = []
+
+    def record(self, mode, kind, captured_at, injected_at):
+        """Store the latency of one injected event"""
+        if not self.enabled:
+            return
+        if self.log_events:
+            self.events.append((injected_at, captured_at, kind, mode))
+        if mode not in GESTURE_MODES:
+            return
+        row = GESTURE_MODES.index(mode)
+        count = self._counts[row]
+        self._samples[row, count % self.window] = injected_at - captured_at
+        self._counts[row] = count + 1
+
+    def percentiles(self):
+        """p50/p95/p99 in milliseconds and sample count for each mode with data"""
+        summary = {}
+        for row, mode in enumerate(GESTURE_MODES):
+            count = min(self._counts[row], self.window)
+            if not count:
+                continue
+            p50, p95, p99 = np.percentile(self._samples[row, :count], (50, 95, 99)) * 1000.0
+            summary[f"e2e {mode}"] = {'p50_ms': float(p50), 'p95_ms': float(p95), 'p99_ms': float(p99),
+                                      'count': count}
+        return summary
@@ -0,0 +1,109 @@
+import numpy as np
+
+
+class Monitor:
+    """One display as a rectangle of the virtual desktop, in desktop pixels.
+
+    scale is the display's DPI relative to 96; cursor motion is multiplied
+    by it so a hand movement covers the same physical distance on every
+    monitor.
+    """
+
+    def __init__(self, x, y, width, height, scale=1.0, name=None, primary=False):
+        self.x = x
+        self.y = y
+        self.width = width
+        self.height = height
+        self.scale = scale
+        self.name = name
+        self.primary = primary
+
+    def __repr__(self):
+        return f"{self.name or 'monitor'} {self.width}x{self.height}+{self.x}+{self.y} @ {self.scale:g}x"
+
+    def contains(self, x, y):
+        return self.x <= x < self.x + self.width and self.y <= y < self.y + self.height
+
+
+class MonitorLayout:
+    """The virtual desktop as a set of monitor rectangles.
+
+    Monitors may differ in size and sit at any offset, so parts of the
+    bounding box belong to no monitor; clamp() moves a point out of such
+    gaps onto the nearest monitor instead of clamping to the bounding box.
+    """
+
+    def __init__(self, monitors):
+        self.monitors = tuple(monitors)
+        if not self.monitors:
+            raise ValueError("MonitorLayout needs at least one monitor")
+        # Inclusive pixel rectangles (left, top, right, bottom)
+        self._rect_list = [(m.x, m.y, m.x + m.width - 1, m.y + m.height - 1) for m in self.monitors]
+        self._rects = np.array(self._rect_list, dtype=np.float64)
+        self.left, self.top = (int(v) for v in self._rects[:, :2].min(axis=0))
+        self.right, self.bottom = (int(v) for v in self._rects[:, 2:].max(axis=0))
+        self.width = self.right - self.left + 1
+        self.height = self.bottom - self.top + 1
+        primary = next((m for m in self.monitors if m.primary), self.monitors[0])
+        self.primary = primary
+        self._gains = [m.scale / primary.scale for m in self.monitors]
+
+    @classmethod
+    def single(cls, width, height):
+        return cls([Monitor(0, 0, width, height, primary=True)])
+
+    def __repr__(self):
+        return f"{len(self.monitors)} monitor(s), {self.width} x {self.height} desktop"
+
+    def monitor_index(self, x, y):
+        """Index of the monitor containing a point, else of the nearest one"""
+        best, best_distance = 0, None
+        for i, (left, top, right, bottom) in enumerate(self._rect_list):
+            dx = max(left - x, 0, x - right)
+            dy = max(top - y, 0, y - bottom)
+            distance = dx * dx + dy * dy
+            if distance == 0:
+                return i
+            if best_distance is None or distance < best_distance:
+                best, best_distance = i, distance
+        return best
+
+    def clamp(self, x, y):
+        """Nearest point to (x, y) that lies on a monitor"""
+        left, top, right, bottom = self._rect_list[self.monitor_index(x, y)]
+        return max(left, min(right, x)), max(top, min(bottom, y))
+
+    def clamp_points(self, points):
+        """clamp() for an (N, 2) array of points"""
+        points = np.asarray(points, dtype=np.float64)
+        rects = self._rects
+        clamped = np.stack((np.clip(points[:, None, 0], rects[:, 0], rects[:, 2]),
+                            np.clip(points[:, None, 1], rects[:, 1], rects[:, 3])), axis=-1)
+        distance = ((clamped - points[:, None, :]) ** 2).sum(axis=-1)
+        nearest = distance.argmin(axis=1)
+        return clamped[np.arange(len(points)), nearest]
+
+    def gain_at(self, x, y):
+        """Cursor gain on the monitor under (x, y), relative to the primary's DPI"""
+        return self._gains[self.monitor_index(x, y)]
+
+
+def detect_monitor_layout():
+    """Monitor layout from the optional screeninfo package, or None.
+
+    DPI comes from the reported physical size when there is one.
+    """
+    try:
+        from screeninfo import get_monitors
+        found = get_monitors()
+    except Exception as e:
+        if not isinstance(e, ImportError):
+            print(f"Could not query monitors: {e}")
+        return None
+    monitors = []
+    for m in found:
+        scale = 1.0
+        if getattr(m, 'width_mm', None):
+            scale = m.width / (m.width_mm / 25.4) / 96.0
+        monitors.append(Monitor(m.x, m.y, m.width, m.height, scale, m.name, bool(getattr(m, 'is_primary', False))))
+    return MonitorLayout(monitors) if monitors else None
@@ -0,0 +1,40 @@
+import cv2
+import numpy as np
+
+
+class MotionDetector:
+    """Cheap frame-difference motion detector on a downscaled gray frame.
+
+    Used to wake the full pipeline from idle: each check costs one small
+    resize, a colour conversion and an absdiff on a 64x48 image.
+    """
+
+    def __init__(self, size=(64, 48), pixel_threshold=12, min_changed_fraction=0.01):
+        self.size = size
+        self.pixel_threshold = pixel_threshold
+        self.min_changed_fraction = min_changed_fraction
+        self._small = np.empty((size[1], size[0], 3), dtype=np.uint8)
+        self._gray = np.empty((size[1], size[0]), dtype=np.uint8)
+        self._previous = np.empty_like(self._gray)
+        self._diff = np.empty_like(self._gray)
+        self._has_previous = False
+
+    def reset(self):
+        """Forget the reference frame"""
+        self._has_previous = False
+
+    def detect(self, frame):
+        """Return True if the frame differs enough from the previous one"""
+        cv2.resize(frame, self.size, dst=self._small, interpolation=cv2.INTER_AREA)
+        cv2.cvtColor(self._small, cv2.COLOR_BGR2GRAY, dst=self._gray)
+
+        if not self._has_previous:
+            self._previous[:] = self._gray
+            self._has_previous = True
+            return False
+
+        cv2.absdiff(self._gray, self._previous, dst=self._diff)
+        self._previous[:] = self._gray
+
+        changed = np.count_nonzero(self._diff > self.pixel_threshold)
+        return changed >= self.min_changed_fraction * self._diff.size
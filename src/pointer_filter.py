@@ -0,0 +1,206 @@
+import math
+import time
+
+
+class PointerFilter:
+    """Smooths the tracked fingertip position between detection and the controllers.
+
+    State is kept in float camera pixels so no sub-pixel motion is lost to
+    truncation; x and y are plain floats, which is cheaper than NumPy for a
+    two-element state. filter() takes the frame's capture timestamp; filters that
+    estimate velocity extrapolate the result from that timestamp to "now"
+    (capped at max_prediction seconds) to hide part of the pipeline latency.
+
+    smoothing uses the GUI slider's scale: 1.0 is the most responsive and
+    lower values smooth more. It can be changed while the filter runs.
+    """
+
+    name = "base"
+
+    def __init__(self, smoothing=0.7, max_prediction=0.05):
+        self.max_prediction = max_prediction
+        self._smoothing = smoothing
+        self._last_timestamp = None
+        self.configure()
+
+    @property
+    def smoothing(self):
+        return self._smoothing
+
+    @smoothing.setter
+    def smoothing(self, value):
+        self._smoothing = min(max(float(value), 0.01), 1.0)
+        self.configure()
+
+    def configure(self):
+        """Derive algorithm parameters from the smoothing setting"""
+
+    def reset(self):
+        """Forget the filter state, e.g. when the hand is lost"""
+        self._last_timestamp = None
+
+    def filter(self, position, timestamp=None, now=None):
+        """Filter a camera position and return the (x, y) estimate as floats"""
+        if timestamp is None:
+            timestamp = time.perf_counter()
+        measurement = (float(position[0]), float(position[1]))
+
+        if self._last_timestamp is None:
+            self._start(measurement)
+        else:
+            dt = timestamp - self._last_timestamp
+            # Duplicate or out-of-order timestamps fall back to a nominal rate
+            self._step(measurement, dt if dt > 0 else 1.0 / 30.0)
+        self._last_timestamp = timestamp
+
+        x, y = self._position()
+        velocity = self._velocity()
+        if velocity is not None and now is not None and self.max_prediction > 0:
+            horizon = min(max(now - timestamp, 0.0), self.max_prediction)
+            x += velocity[0] * horizon
+            y += velocity[1] * horizon
+        return x, y
+
+    def _start(self, measurement):
+        raise NotImplementedError
+
+    def _step(self, measurement, dt):
+        raise NotImplementedError
+
+    def _position(self):
+        raise NotImplementedError
+
+    def _velocity(self):
+        """Estimated velocity in pixels per second, or None if not tracked"""
+        return None
+
+
+class EmaFilter(PointerFilter):
+    """Fixed-weight exponential moving average, the original smoothing.
+
+    smoothing is the weight of the newest measurement. It has no velocity
+    estimate, so it never predicts.
+    """
+
+    name = "ema"
+
+    def _start(self, measurement):
+        self._state = measurement
+
+    def _step(self, measurement, dt):
+        a = self._smoothing
+        self._state = (a * measurement[0] + (1.0 - a) * self._state[0],
+                       a * measurement[1] + (1.0 - a) * self._state[1])
+
+    def _position(self):
+        return self._state
+
+
+class OneEuroFilter(PointerFilter):
+    """One Euro filter: a low-pass whose cutoff rises with speed.
+
+    Slow, precise movements get a low cutoff (little jitter), fast ones a
+    high cutoff (little lag). smoothing sets the minimum cutoff on a log
+    scale, from about 0.16 Hz at 0.1 to 10 Hz at 1.0. beta controls how
+    quickly the cutoff grows with speed in pixels per second.
+    """
+
+    name = "one_euro"
+
+    def __init__(self, smoothing=0.7, max_prediction=0.05, beta=0.01, derivative_cutoff=2.0):
+        self.beta = beta
+        self.derivative_cutoff = derivative_cutoff
+        super().__init__(smoothing, max_prediction)
+
+    def configure(self):
+        self.min_cutoff = 10.0 ** (2.0 * self._smoothing - 1.0)
+
+    @staticmethod
+    def _alpha(cutoff, dt):
+        tau = 1.0 / (2.0 * math.pi * cutoff)
+        return 1.0 / (1.0 + tau / dt)
+
+    def _start(self, measurement):
+        self._state = measurement
+        self._speed = (0.0, 0.0)
+
+    def _step(self, measurement, dt):
+        (x, y), (mx, my), (vx, vy) = self._state, measurement, self._speed
+        a = self._alpha(self.derivative_cutoff, dt)
+        vx = a * (mx - x) / dt + (1.0 - a) * vx
+        vy = a * (my - y) / dt + (1.0 - a) * vy
+        self._speed = (vx, vy)
+
+        cutoff = self.min_cutoff + self.beta * math.hypot(vx, vy)
+        a = self._alpha(cutoff, dt)
+        self._state = (a * mx + (1.0 - a) * x, a * my + (1.0 - a) * y)
+
+    def _position(self):
+        return self._state
+
+    def _velocity(self):
+        return self._speed
+
+
+class KalmanFilter(PointerFilter):
+    """Constant-velocity Kalman filter, run independently on x and y.
+
+    Both axes share the same time steps and noise model, so they share one
+    symmetric 2x2 covariance, kept as its three distinct entries. smoothing
+    scales the assumed measurement noise: lower values trust the detector
+    less and follow the motion model more.
+    """
+
+    name = "kalman"
+
+    def __init__(self, smoothing=0.7, max_prediction=0.05, acceleration_noise=500.0):
+        self.acceleration_noise = acceleration_noise
+        super().__init__(smoothing, max_prediction)
+
+    def configure(self):
+        # Measurement standard deviation in pixels: 1 px at 1.0, 10 px at 0.1
+        self.measurement_variance = (1.0 / self._smoothing) ** 2
+
+    def _start(self, measurement):
+        self._state = measurement
+        self._speed = (0.0, 0.0)
+        self._covariance = (self.measurement_variance, 0.0, 1e4)
+
+    def _step(self, measurement, dt):
+        # Predict
+        (x, y), (vx, vy) = self._state, self._speed
+        x += vx * dt
+        y += vy * dt
+        p00, p01, p11 = self._covariance
+        q = self.acceleration_noise ** 2
+        p00 += dt * 2 * p01 + dt * dt * p11 + q * dt ** 4 / 4
+        p01 += dt * p11 + q * dt ** 3 / 2
+        p11 += q * dt * dt
+
+        # Update with the position measurement
+        s = p00 + self.measurement_variance
+        k0, k1 = p00 / s, p01 / s
+        ix, iy = measurement[0] - x, measurement[1] - y
+        self._state = (x + k0 * ix, y + k0 * iy)
+        self._speed = (vx + k1 * ix, vy + k1 * iy)
+        self._covariance = ((1 - k0) * p00, (1 - k0) * p01, p11 - k1 * p01)
+
+    def _position(self):
+        return self._state
+
+    def _velocity(self):
+        return self._speed
+
+
+POINTER_FILTERS = {
+    "ema": EmaFilter,
+    "one_euro": OneEuroFilter,
+    "kalman": KalmanFilter,
+}
+
+
+def create_pointer_filter(name="one_euro", smoothing=0.7, **kwargs):
+    """Build a pointer filter by name"""
+    if name not in POINTER_FILTERS:
+        raise ValueError(f"Unknown pointer filter: {name}")
+    return POINTER_FILTERS[name](smoothing, **kwargs)
@@ -0,0 +1,67 @@
+import time
+
+import cv2
+
+
+def ppm_bytes(image):
+    """Binary PPM of an RGB uint8 image, the format Tk's PhotoImage loads natively"""
+    height, width = image.shape[:2]
+    return b"P6 %d %d 255\n" % (width, height) + image.tobytes()
+
+
+class PreviewFeed:
+    """Rate-limited, downscaled handoff of preview frames to a GUI.
+
+    The vision loop calls publish() with every frame it would show; at most
+    max_fps of them are shrunk to width pixels wide, converted to RGB and
+    stored as the latest (sequence, image) pair, a single reference the
+    GUI reads whenever it redraws. Nothing blocks and nothing queues up, a
+    frame the GUI has not picked up yet is simply replaced. due() lets the
+    caller skip preparing frames that would be dropped, and shrink() lets
+    it flip and draw on the small image instead of the camera frame.
+    """
+
+    def __init__(self, max_fps=15.0, width=320):
+        self.max_fps = max_fps
+        self.width = width
+        self.latest = (0, None)
+        self._next_time = 0.0
+
+    def due(self, now=None):
+        """Whether the next published frame would be kept"""
+        now = time.perf_counter() if now is None else now
+        return now >= self._next_time
+
+    def shrink(self, frame, mirror=False):
+        """BGR copy of a frame at preview size, optionally mirrored"""
+        height, width = frame.shape[:2]
+        if width > self.width:
+            size = (self.width, max(1, round(height * self.width / width)))
+            image = cv2.resize(frame, size, interpolation=cv2.INTER_AREA)
+        else:
+            image = frame.copy()
+        if mirror:
+            cv2.flip(image, 1, dst=image)
+        return image
+    
+    def publish(self, frame, now=None):
+        """Hand over a BGR frame; returns False when rate-limited away"""
+        now = time.perf_counter() if now is None else now
+        if now < self._next_time:
+            return False
+        # Fixed pacing, but never try to catch up on frames that were late
+        self._next_time = max(self._next_time + 1.0 / self.max_fps, now)
+
+        height, width = frame.shape[:2]
+        if width > self.width:
+            size = (self.width, max(1, round(height * self.width / width)))
+            image = cv2.resize(frame, size, interpolation=cv2.INTER_AREA)
+            cv2.cvtColor(image, cv2.COLOR_BGR2RGB, dst=image)
+        else:
+            image = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        self.latest = (self.latest[0] + 1, image)
+        return True
+
+    def clear(self):
+        """Drop the current image, e.g. when the preview is turned off"""
+        self.latest = (self.latest[0] + 1, None)
@@ -0,0 +1,101 @@
+import cv2
+import numpy as np
+
+
+class RoiTracker:
+    """Keeps a padded square region of interest around the last seen hand.
+
+    Inference runs on that crop resized to the landmark model's input size
+    instead of the full frame; landmarks found in the crop are mapped back
+    to full-frame normalized coordinates. The caller falls back to full
+    frame detection whenever the crop loses the hand or the landmarks found
+    in it are not consistent() with the hand the ROI was built from.
+    MediaPipe's per-hand score is the handedness confidence, not whether a
+    hand is there, so consistency is judged from the landmarks themselves.
+    Hits and misses are counted for monitoring.
+    """
+
+    def __init__(self, padding=0.5, input_size=224, max_jump=0.5, max_scale_change=1.5):
+        self.padding = padding
+        self.input_size = input_size
+        # Largest centroid move between frames, in hand sizes, and largest
+        # growth or shrink factor of the landmark bounding box
+        self.max_jump = max_jump
+        self.max_scale_change = max_scale_change
+        self.roi = None  # (x0, y0, side) in pixels
+        self._hand = None  # (center_x, center_y, size) in pixels
+        self._crop_buffer = None
+
+        self.hits = 0
+        self.misses = 0
+        self.full_frame = 0
+
+    def reset(self):
+        """Forget the current ROI so the next frame runs full-frame detection"""
+        self.roi = None
+        self._hand = None
+
+    def consistent(self, points, frame_shape):
+        """Whether full-frame normalized landmarks plausibly continue the tracked hand"""
+        if self._hand is None:
+            return True
+        center_x, center_y, size = self._extent(points, frame_shape)
+        last_x, last_y, last_size = self._hand
+        if not last_size / self.max_scale_change <= size <= last_size * self.max_scale_change:
+            return False
+        return np.hypot(center_x - last_x, center_y - last_y) <= self.max_jump * last_size
+
+    def update(self, points, frame_shape):
+        """Compute the next ROI from normalized landmarks, or drop it"""
+        if points is None:
+            self.reset()
+            return
+
+        frame_h, frame_w = frame_shape[:2]
+        center_x, center_y, size = self._extent(points, frame_shape)
+        self._hand = (center_x, center_y, size)
+
+        side = size * (1.0 + 2.0 * self.padding)
+        side = int(min(max(side, self.input_size / 2), frame_w, frame_h))
+
+        # Keep the square inside the frame instead of clipping it
+        x0 = int(min(max(center_x - side / 2, 0), frame_w - side))
+        y0 = int(min(max(center_y - side / 2, 0), frame_h - side))
+        self.roi = (x0, y0, side)
+
+    @staticmethod
+    def _extent(points, frame_shape):
+        """Bounding box centre and larger side of landmarks, in pixels"""
+        frame_h, frame_w = frame_shape[:2]
+        xy = points[:, :2] * (frame_w, frame_h)
+        (min_x, min_y), (max_x, max_y) = xy.min(axis=0), xy.max(axis=0)
+        return (min_x + max_x) / 2, (min_y + max_y) / 2, max(max_x - min_x, max_y - min_y)
+
+    def crop(self, frame):
+        """Return the ROI of an RGB frame resized to the model input size"""
+        x0, y0, side = self.roi
+        if self._crop_buffer is None:
+            self._crop_buffer = np.empty((self.input_size, self.input_size, 3), dtype=np.uint8)
+        cv2.resize(frame[y0:y0 + side, x0:x0 + side], (self.input_size, self.input_size),
+                   dst=self._crop_buffer, interpolation=cv2.INTER_AREA)
+        return self._crop_buffer
+
+    def to_frame(self, points, frame_shape):
+        """Map crop-normalized landmarks to full-frame normalized coordinates in place"""
+        frame_h, frame_w = frame_shape[:2]
+        x0, y0, side = self.roi
+        points[:, 0] = (points[:, 0] * side + x0) / frame_w
+        points[:, 1] = (points[:, 1] * side + y0) / frame_h
+        # z is relative to the crop width; rescale to the frame width
+        points[:, 2] *= side / frame_w
+        return points
+
+    def stats(self):
+        """Hit/miss counters and the current hit rate"""
+        attempts = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'full_frame': self.full_frame,
+            'hit_rate': self.hits / attempts if attempts else 0.0,
+        }
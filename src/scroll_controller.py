@@ -1,84 +1,97 @@
 # File: /hand-tracker-project/hand-tracker-project/src/scroll_controller.py
 
-import pyautogui
+import math
 import time
-import numpy as np
+from .actuator import PyAutoGUIActuator
+from .scroll_scheduler import ScrollScheduler
 
 class ScrollController:
-    def __init__(self):
+    def __init__(self, actuator=None, clock=time.time, scheduler=None):
+        self.actuator = actuator if actuator is not None else PyAutoGUIActuator()
+        self.clock = clock
+        # The finger only sets a scroll velocity; the scheduler emits the
+        # steps. Without a running scheduler thread (replays, tests) steps
+        # are emitted here, once per call
+        self.scheduler = scheduler if scheduler is not None else ScrollScheduler(self.actuator, clock=clock)
+        self.horizontal = True
+        # An axis only scrolls when its offset is at least this fraction of
+        # the other axis' offset, so a vertical scroll does not drift sideways
+        self.axis_lock = 0.5
+        # Speed curve in steps per scroll event at the former 20 Hz event rate
+        self.reference_rate = 20.0
         self.scroll_initial_pos = None
         self.scroll_speed_multiplier = 1.0
+        self.scroll_direction_x = 0
         self.scroll_direction_y = 0
-        self.last_scroll_time = time.time()
 
-    def handle_scroll_control(self, current_cam_pos, mode):
-        """Handle continuous exponential speed scroll control - Y direction (vertical)"""
-        
+    def release(self):
+        """End a scroll gesture; the scroll coasts to a stop with momentum"""
+        if self.scroll_initial_pos is not None:
+            self.scheduler.release()
+        self.scroll_initial_pos = None
+        self.scroll_speed_multiplier = 1.0
+        self.scroll_direction_x = 0
+        self.scroll_direction_y = 0
+        self._pump()
+
+    def handle_scroll_control(self, current_cam_pos, mode, captured_at=None):
+        """Continuous exponential speed scroll control, vertical and horizontal.
+
+        The finger's offset from where the gesture started sets the scroll
+        velocity; returns that offset as (delta_x, delta_y). captured_at is
+        the capture time of the frame, which tags the resulting steps.
+        """
         if mode != "MODE_2":
             # Reset scroll state when exiting mode
-            self.scroll_initial_pos = None
-            self.scroll_speed_multiplier = 1.0
-            self.scroll_direction_y = 0
+            self.release()
             return None, None
-            
-        current_time = time.time()
-        
-        # Define scroll cooldown in seconds (e.g., 0.05s for 20Hz scroll rate)
-        scroll_cooldown = 0.05
 
-        # Set initial scroll position and direction
+        # Set initial scroll position; touching down stops leftover momentum
         if self.scroll_initial_pos is None and current_cam_pos is not None:
             self.scroll_initial_pos = current_cam_pos
-            self.last_scroll_time = current_time
             self.scroll_speed_multiplier = 1.0
+            self.scheduler.stop()
+            self._pump()
             return 0, 0
-            
+
         if current_cam_pos is None or self.scroll_initial_pos is None:
             return 0, 0
-            
-        # Check if enough time has passed since last scroll
-        if current_time - self.last_scroll_time < scroll_cooldown:
-            return 0, self.scroll_direction_y
-            
-        # Calculate scroll deltas - only use Y direction for vertical scroll
+
+        delta_x = current_cam_pos[0] - self.scroll_initial_pos[0]
         delta_y = current_cam_pos[1] - self.scroll_initial_pos[1]
-        
+
+        # Moving the finger down scrolls down (negative steps), right scrolls right
+        speed_y, self.scroll_direction_y = self._axis_speed(-delta_y)
+        speed_x, self.scroll_direction_x = self._axis_speed(delta_x) if self.horizontal else (0.0, 0)
+        if abs(delta_x) < self.axis_lock * abs(delta_y):
+            speed_x, self.scroll_direction_x = 0.0, 0
+        elif abs(delta_y) < self.axis_lock * abs(delta_x):
+            speed_y, self.scroll_direction_y = 0.0, 0
+        # Shown in the overlay; 1x inside the dead zone
+        self.scroll_speed_multiplier = max(abs(speed_x), abs(speed_y)) or 1.0
+
+        origin = (captured_at, mode) if captured_at is not None else None
+        self.scheduler.set_velocity(speed_x * self.reference_rate, speed_y * self.reference_rate, origin)
+        self._pump()
+        return delta_x, delta_y
+
+    def _axis_speed(self, delta):
+        """Signed speed for one axis offset, and its direction"""
         # Minimum threshold for detecting scroll direction
         direction_threshold = 20
-        
-        # Determine scroll direction based on Y delta (inverted for natural scrolling)
-        if abs(delta_y) > direction_threshold:
-            # Update scroll direction based on current delta (inverted for natural scroll)
-            self.scroll_direction_y = -1 if delta_y > 0 else 1  # Invert for natural scroll
-        else:
-            self.scroll_direction_y = 0
-        
-        # Exponential speed increase based on delta magnitude - Y only
-        delta_magnitude = abs(delta_y)
-        if delta_magnitude > direction_threshold:
-            # Exponential growth: speed = base * (growth_rate ^ delta_magnitude)
-            base_speed = 2.5
-            growth_factor = 0.07
-            max_speed = 50.0
-            
-            # Exponential scaling
-            self.scroll_speed_multiplier = min(base_speed * np.exp(growth_factor * delta_magnitude), max_speed)
-        else:
-            # Reset to base speed if delta is too small
-            self.scroll_speed_multiplier = 5.0
-        
-        # Calculate actual scroll amounts with exponential scaling - Y only
-        scroll_y = int(self.scroll_direction_y * self.scroll_speed_multiplier)
-        
-        # Execute continuous scroll - vertical only
-        if self.scroll_direction_y != 0:
-            try:
-                if scroll_y != 0:
-                    pyautogui.scroll(scroll_y)  # Vertical scroll
-                    
-                self.last_scroll_time = current_time
-                print(f"Vertical Scroll: Y={scroll_y} (Delta: {abs(delta_y):.1f}, Speed: {self.scroll_speed_multiplier:.1f}x)")
-            except Exception as e:
-                print(f"Scroll error: {e}")
-                
-        return 0, delta_y
\ No newline at end of file
+
+        delta_magnitude = abs(delta)
+        if delta_magnitude <= direction_threshold:
+            return 0.0, 0
+
+        # Exponential growth: speed = base * e^(growth * distance), capped
+        base_speed = 2.5
+        growth_factor = 0.07
+        max_speed = 50.0
+        speed = min(base_speed * math.exp(growth_factor * delta_magnitude), max_speed)
+        direction = 1 if delta > 0 else -1
+        return direction * speed, direction
+
+    def _pump(self):
+        if not self.scheduler.running:
+            self.scheduler.tick(self.clock())
@@ -0,0 +1,170 @@
+import math
+import threading
+import time
+
+# Scheduler commands: follow the target velocity, coast with momentum, halt
+_TRACK = "track"
+_COAST = "coast"
+_STOP = "stop"
+
+
+class ScrollScheduler:
+    """Emits scroll steps at a fixed rate from a target velocity.
+
+    The vision loop only sets the velocity it wants (scroll units per
+    second on each axis) with set_velocity(), ends a gesture with
+    release() or halts everything with stop(); the latest command is one
+    tuple reference, so no lock is needed. On every tick the actual
+    velocity eases towards the target with time constant response, or,
+    after release(), decays exponentially with time constant momentum.
+    Fractions of a step carry over between ticks, so slow scrolls emit an
+    occasional single step instead of nothing, and the scroll speed no
+    longer depends on how many frames per second the vision loop manages.
+
+    start() runs ticks on a thread at rate Hz, sleeping while nothing
+    moves; without the thread, tick() can be called directly (e.g. once
+    per frame when replaying). On the thread, steps are tagged (through
+    the actuator's set_origin) with the frame origin passed to the latest
+    set_velocity(), so capture-to-injection latency is still measured.
+    """
+
+    def __init__(self, actuator, rate=120.0, response=0.08, momentum=0.35, min_velocity=10.0,
+                 clock=time.perf_counter):
+        self.actuator = actuator
+        self.rate = rate
+        self.response = response
+        self.momentum = momentum
+        self.min_velocity = min_velocity
+        self.clock = clock
+        self.running = False
+        self.steps = 0
+        self.errors = 0
+
+        self._command = (0.0, 0.0, _STOP, None)
+        self._velocity = [0.0, 0.0]
+        self._remainder = [0.0, 0.0]
+        self._last_tick = None
+        self._wake = threading.Event()
+        self._thread = None
+
+    def set_velocity(self, velocity_x, velocity_y, origin=None):
+        """Target scroll velocity in steps per second (positive: right, up).
+
+        origin is the (captured_at, mode) of the frame that set it.
+        """
+        self._command = (velocity_x, velocity_y, _TRACK, origin)
+        if velocity_x or velocity_y:
+            self._wake.set()
+
+    def release(self):
+        """Gesture ended: keep scrolling with decaying momentum"""
+        # Coasting answers no frame, so its steps are not tagged
+        self._command = (0.0, 0.0, _COAST, None)
+
+    def stop(self):
+        """Halt immediately, dropping any momentum"""
+        self._command = (0.0, 0.0, _STOP, None)
+
+    @property
+    def velocity(self):
+        return tuple(self._velocity)
+
+    def idle(self):
+        """Nothing is moving and nothing is asked to move"""
+        target_x, target_y, command, _ = self._command
+        if command == _TRACK and (target_x or target_y):
+            return False
+        return not (self._velocity[0] or self._velocity[1])
+
+    def tick(self, now=None):
+        """Advance to now and emit the whole steps that have accumulated"""
+        now = self.clock() if now is None else now
+        last, self._last_tick = self._last_tick, now
+        if last is None:
+            return
+        # A late tick (or the first after sleeping) catches up at most a little
+        dt = min(max(now - last, 0.0), 0.1)
+
+        target_x, target_y, command, origin = self._command
+        velocity, remainder = self._velocity, self._remainder
+        if command == _STOP:
+            velocity[:] = [0.0, 0.0]
+            remainder[:] = [0.0, 0.0]
+            return
+        if command == _COAST:
+            decay = math.exp(-dt / self.momentum)
+            velocity[0] *= decay
+            velocity[1] *= decay
+            if math.hypot(*velocity) < self.min_velocity:
+                velocity[:] = [0.0, 0.0]
+                remainder[:] = [0.0, 0.0]
+                return
+        else:
+            blend = 1.0 - math.exp(-dt / self.response)
+            velocity[0] += (target_x - velocity[0]) * blend
+            velocity[1] += (target_y - velocity[1]) * blend
+            if not (target_x or target_y) and math.hypot(*velocity) < self.min_velocity:
+                velocity[:] = [0.0, 0.0]
+                remainder[:] = [0.0, 0.0]
+                return
+
+        remainder[0] += velocity[0] * dt
+        remainder[1] += velocity[1] * dt
+        step_x, step_y = int(remainder[0]), int(remainder[1])
+        remainder[0] -= step_x
+        remainder[1] -= step_y
+        if not (step_x or step_y):
+            return
+        try:
+            if self.running and hasattr(self.actuator, 'set_origin'):
+                # Inline ticks run under the caller's origin already
+                if origin is not None:
+                    self.actuator.set_origin(*origin)
+                else:
+                    self.actuator.set_origin(None)
+            if step_y:
+                self.actuator.scroll(step_y)
+            if step_x:
+                self.actuator.hscroll(step_x)
+        except Exception as e:
+            # Reported once; errors keeps counting
+            if not self.errors:
+                print(f"Scroll error: {e}")
+            self.errors += 1
+        self.steps += abs(step_x) + abs(step_y)
+
+    def start(self):
+        """Run ticks on a scheduler thread"""
+        if self._thread is not None:
+            return
+        self.running = True
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def shutdown(self):
+        """Stop the scheduler thread"""
+        self.running = False
+        self._wake.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout=1.0)
+        self._thread = None
+
+    def _run(self):
+        interval = 1.0 / self.rate
+        next_tick = time.perf_counter()
+        while self.running:
+            if self.idle():
+                # Nothing to scroll: sleep until a velocity is set
+                self._last_tick = None
+                self._wake.wait()
+                self._wake.clear()
+                next_tick = time.perf_counter()
+                continue
+
+            self.tick(time.perf_counter())
+            next_tick += interval
+            delay = next_tick - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                next_tick = time.perf_counter()
@@ -0,0 +1,61 @@
+import numpy as np
+
+from .hand_landmarks import NUM_LANDMARKS
+
+
+class SkeletonFilter:
+    """Moving-average smoothing of all 21 landmarks of each tracked hand.
+
+    Every hand slot owns a ring buffer of the last `window` (21, 3) frames
+    and a running sum, so an update is one subtraction, one addition and one
+    division over 63 values regardless of window size. Sums are float64 and
+    are recomputed from the buffer every `resync_interval` updates so
+    rounding error cannot accumulate over long sessions.
+
+    update() returns a view into a preallocated per-slot output array that
+    is overwritten on the next update of the same slot; copy it to keep it.
+    """
+
+    def __init__(self, window=3, max_hands=2, resync_interval=1024):
+        self.window = window
+        self.max_hands = max_hands
+        self.resync_interval = resync_interval
+        self._buffer = np.zeros((max_hands, window, NUM_LANDMARKS, 3), dtype=np.float64)
+        self._sums = np.zeros((max_hands, NUM_LANDMARKS, 3), dtype=np.float64)
+        self._output = np.zeros((max_hands, NUM_LANDMARKS, 3), dtype=np.float32)
+        self._counts = [0] * max_hands
+        self._updates = [0] * max_hands
+
+    def reset(self, slot=None):
+        """Clear one hand slot, or all of them"""
+        if slot is None:
+            self._sums[:] = 0.0
+            self._counts = [0] * self.max_hands
+            self._updates = [0] * self.max_hands
+        else:
+            self._sums[slot] = 0.0
+            self._counts[slot] = 0
+            self._updates[slot] = 0
+
+    def update(self, slot, points):
+        """Add a (21, 3) landmark array to a slot and return its smoothed skeleton"""
+        count = self._counts[slot]
+        index = self._updates[slot] % self.window
+        entry = self._buffer[slot, index]
+        sums = self._sums[slot]
+
+        if count == self.window:
+            sums -= entry
+        else:
+            count += 1
+            self._counts[slot] = count
+        entry[:] = points
+        sums += entry
+
+        self._updates[slot] += 1
+        if self._updates[slot] % self.resync_interval == 0:
+            self._buffer[slot, :count].sum(axis=0, out=sums)
+
+        output = self._output[slot]
+        np.divide(sums, count, out=output, casting='unsafe')
+        return output
@@ -0,0 +1,101 @@
+import csv
+import json
+import time
+
+import numpy as np
+
+# Pipeline stages, in frame order. Indices are used on the hot path
+STAGES = ("capture", "convert", "inference", "gesture", "controllers",
+          "actuation", "overlay", "display")
+CAPTURE, CONVERT, INFERENCE, GESTURE, CONTROLLERS, ACTUATION, OVERLAY, DISPLAY = range(len(STAGES))
+
+
+class StageTimer:
+    """Per-stage frame timing with rolling percentiles.
+
+    begin() starts a frame and lap(stage) charges the time since the
+    previous lap to a stage, so a stage visited several times in one frame
+    (overlay drawing, per-hand work) is summed. end_frame() stores each
+    visited stage's total in a preallocated ring of the last `window`
+    frames. record() adds a sample measured elsewhere, such as the frame age
+    at capture or the injection latency on the actuator thread.
+
+    While disabled every call returns after one attribute check.
+    """
+
+    def __init__(self, window=1024, enabled=False):
+        self.enabled = enabled
+        self.window = window
+        self._samples = np.zeros((len(STAGES), window), dtype=np.float64)
+        self._counts = [0] * len(STAGES)
+        self._frame = [0.0] * len(STAGES)
+        self._visited = [False] * len(STAGES)
+        self._last = 0.0
+
+    def reset(self):
+        """Drop all collected samples"""
+        self._counts = [0] * len(STAGES)
+
+    def begin(self):
+        """Start timing a frame"""
+        if not self.enabled:
+            return
+        self._last = time.perf_counter()
+
+    def lap(self, stage):
+        """Charge the time since the previous lap to stage"""
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        self._frame[stage] += now - self._last
+        self._visited[stage] = True
+        self._last = now
+
+    def record(self, stage, seconds):
+        """Store a sample measured outside begin()/lap()"""
+        if not self.enabled:
+            return
+        count = self._counts[stage]
+        self._samples[stage, count % self.window] = seconds
+        self._counts[stage] = count + 1
+
+    def end_frame(self):
+        """Store this frame's per-stage totals"""
+        if not self.enabled:
+            return
+        for stage, visited in enumerate(self._visited):
+            if visited:
+                self.record(stage, self._frame[stage])
+                self._frame[stage] = 0.0
+                self._visited[stage] = False
+
+    def percentiles(self):
+        """p50/p95/p99 in milliseconds and sample count for each stage with data"""
+        summary = {}
+        for stage, name in enumerate(STAGES):
+            count = min(self._counts[stage], self.window)
+            if not count:
+                continue
+            p50, p95, p99 = np.percentile(self._samples[stage, :count], (50, 95, 99)) * 1000.0
+            summary[name] = {'p50_ms': float(p50), 'p95_ms': float(p95), 'p99_ms': float(p99),
+                             'count': count}
+        return summary
+
+    def dump(self, path):
+        """Write the current percentiles to a .csv file, or JSON for any other extension"""
+        dump_summary(self.percentiles(), path)
+
+
+def dump_summary(summary, path):
+    """Write a {name: {p50_ms, p95_ms, p99_ms, count}} summary as CSV or JSON"""
+    if str(path).lower().endswith(".csv"):
+        with open(path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(("stage", "p50_ms", "p95_ms", "p99_ms", "count"))
+            for name, values in summary.items():
+                writer.writerow((name, f"{values['p50_ms']:.3f}", f"{values['p95_ms']:.3f}",
+                                 f"{values['p99_ms']:.3f}", values['count']))
+    else:
+        with open(path, "w") as f:
+            json.dump(summary, f, indent=2)
+    print(f"Timings written to {path}")
@@ -0,0 +1,29 @@
+from collections import namedtuple
+
+GESTURE_MODES = ("MODE_1", "MODE_2", "MODE_3")
+
+_FIELDS = ("show_camera_feed", "show_overlay", "enabled_modes", "cursor_sensitivity", "smoothing",
+           "pointer_curve")
+
+
+class TrackerSettings(namedtuple("TrackerSettings", _FIELDS,
+                                 defaults=(True, True, frozenset(GESTURE_MODES), 1.0, 0.7, "exponential"))):
+    """User-adjustable pipeline settings as one immutable snapshot.
+
+    A snapshot is never modified: a change builds a new one with replace()
+    and publishes it by rebinding a single reference, which is atomic, so
+    the pipeline can pick up the current settings once per frame without
+    a lock and never sees a half-applied change. enabled_modes is a
+    frozenset of the gesture modes allowed to act; pointer_curve names the
+    POINTER_CURVES entry used by the accelerated pointer mode.
+    """
+    __slots__ = ()
+
+    def replace(self, **changes):
+        """New snapshot with some fields changed"""
+        if 'enabled_modes' in changes:
+            changes['enabled_modes'] = frozenset(changes['enabled_modes'])
+        return self._replace(**changes)
+
+    def mode_enabled(self, mode):
+        return mode in self.enabled_modes
@@ -0,0 +1,89 @@
+import numpy as np
+
+
+class TransferFunction:
+    """Pointer gain as a function of hand motion, tabulated once.
+
+    input 'speed' evaluates the curve on fingertip speed in camera pixels
+    per second, 'displacement' on the distance from where the gesture
+    started. kind picks the curve over that magnitude v:
+
+        linear       base_gain
+        exponential  base_gain + (max_gain - base_gain) * (1 - exp(-rate * v))
+        sigmoid      base_gain + (max_gain - base_gain) / (1 + exp(-rate * (v - midpoint)))
+        piecewise    straight lines through points, [(v, gain), ...]
+
+    The curve times scale is sampled into size entries over [0, max_input]
+    when the function is built; gain() interpolates between two entries, so
+    a lookup costs the same for every curve. Inputs past max_input get the
+    last entry. Functions are not modified after construction: scaled()
+    builds a new one, e.g. for a sensitivity change.
+    """
+
+    def __init__(self, kind="linear", base_gain=1.0, max_gain=1.0, rate=0.01, midpoint=0.0,
+                 points=(), input="speed", max_input=2000.0, size=256, scale=1.0):
+        if kind not in ("linear", "exponential", "sigmoid", "piecewise"):
+            raise ValueError(f"Unknown transfer function: {kind}")
+        if kind == "piecewise" and len(points) < 2:
+            raise ValueError("A piecewise transfer function needs at least two points")
+        self.kind = kind
+        self.base_gain = base_gain
+        self.max_gain = max_gain
+        self.rate = rate
+        self.midpoint = midpoint
+        self.points = tuple(sorted(points))
+        self.input = input
+        self.max_input = max_input
+        self.size = size
+        self.scale = scale
+
+        self._grid = np.linspace(0.0, max_input, size)
+        table = self.curve(self._grid) * scale
+        self._table = table.tolist()
+        self._slopes = np.diff(table).tolist() + [0.0]
+        self._inv_step = (size - 1) / max_input
+        self._last = size - 1
+
+    def __repr__(self):
+        return f"TransferFunction({self.kind}, input={self.input}, scale={self.scale:g})"
+
+    def curve(self, values):
+        """Exact (untabulated, unscaled) gain for an array of magnitudes"""
+        values = np.asarray(values, dtype=np.float64)
+        span = self.max_gain - self.base_gain
+        if self.kind == "exponential":
+            return self.base_gain + span * (1.0 - np.exp(-self.rate * values))
+        if self.kind == "sigmoid":
+            return self.base_gain + span / (1.0 + np.exp(-self.rate * (values - self.midpoint)))
+        if self.kind == "piecewise":
+            x, gain = zip(*self.points)
+            return np.interp(values, x, gain)
+        return np.full_like(values, self.base_gain)
+
+    def scaled(self, scale):
+        """The same curve with every gain multiplied by scale"""
+        return TransferFunction(self.kind, self.base_gain, self.max_gain, self.rate, self.midpoint,
+                                self.points, self.input, self.max_input, self.size, scale)
+
+    def gain(self, value):
+        """Tabulated gain for one magnitude"""
+        position = value * self._inv_step
+        if position >= self._last:
+            return self._table[-1]
+        if position <= 0.0:
+            return self._table[0]
+        i = int(position)
+        return self._table[i] + self._slopes[i] * (position - i)
+
+    def gains(self, values):
+        """gain() for an array of magnitudes"""
+        return np.interp(values, self._grid, self._table)
+
+
+# Named curves for the accelerated pointer mode (MODE_3), selectable from
+# the GUI; speeds are in camera pixels per second
+POINTER_CURVES = {
+    'linear': TransferFunction("linear", 2.0),
+    'exponential': TransferFunction("exponential", 1.0, 15.0, rate=0.005),
+    'sigmoid': TransferFunction("sigmoid", 1.0, 12.0, rate=0.02, midpoint=250.0),
+}
@@ -1,36 +1,200 @@
 # File: /hand-tracker-project/hand-tracker-project/src/ui_overlay.py
 
 import cv2
+import numpy as np
+from .hand_landmarks import HAND_CONNECTIONS
+
+_CONNECTION_STARTS = np.array([a for a, _ in HAND_CONNECTIONS])
+_CONNECTION_ENDS = np.array([b for _, b in HAND_CONNECTIONS])
+
+MODE_COLORS = {
+    "MODE_1": (0, 255, 0),
+    "MODE_2": (255, 0, 255),
+    "MODE_3": (255, 255, 0),
+    "NONE": (128, 128, 128)
+}
+
+MODE_TEXT = {
+    "MODE_1": "MODE 1: Precise Cursor Control (1:1)",
+    "MODE_2": "MODE 2: Scroll Control",
+    "MODE_3": "MODE 3: Exponential Cursor Control",
+    "NONE": "No Gesture Detected"
+}
+
+# Overlay positions and sizes are laid out for a frame this wide and scaled
+# to the preview they are drawn on; text never gets smaller than
+# MIN_FONT_SCALE, so it stays readable in a small preview
+LAYOUT_WIDTH = 640
+MIN_FONT_SCALE = 0.4
 
 class UIOverlay:
+    """Draws the camera preview overlay.
+
+    The overlay is drawn on the already downscaled preview, not on the
+    camera frame. begin() tells it how the two relate: point() maps camera
+    pixels onto the preview, at() maps positions of the LAYOUT_WIDTH wide
+    layout, and text() scales fonts to match.
+
+    Elements that only change with the tracking area, resolution or mode
+    (tracking area, instructions, mode banner) are rendered once into cached
+    masks and copied onto each frame, touching only the small boxes that
+    actually contain overlay pixels.
+    """
+    
+    def __init__(self):
+        self._static_key = None
+        self._static_layer = None
+        self._mode_layers = {}
+        self.point_scale = 1.0
+        self.size_scale = 1.0
+    
+    def begin(self, frame, camera_width):
+        """Prepare to draw on a preview made from a camera_width wide frame"""
+        width = frame.shape[1]
+        self.point_scale = width / camera_width
+        self.size_scale = width / LAYOUT_WIDTH
+    
+    def point(self, x, y):
+        """Camera pixel position on the preview"""
+        return round(x * self.point_scale), round(y * self.point_scale)
+    
+    def at(self, x, y):
+        """Layout position on the preview"""
+        return round(x * self.size_scale), round(y * self.size_scale)
+    
+    def length(self, value):
+        """Layout size (radius, thickness) on the preview, at least one pixel"""
+        return max(1, round(value * self.size_scale))
+    
+    def text(self, frame, text, origin, font_scale, color, thickness=1):
+        """putText with the font scaled to the preview; origin is in preview pixels"""
+        cv2.putText(frame, text, origin, cv2.FONT_HERSHEY_SIMPLEX,
+                    max(font_scale * self.size_scale, MIN_FONT_SCALE), color, self.length(thickness))
+    
+    def draw_static(self, frame, tracking_area):
+        """Composite the tracking area and instructions, re-rendering on change"""
+        key = (frame.shape, tuple(tracking_area.values()), self.point_scale)
+        if key != self._static_key:
+            self._static_key = key
+            self._static_layer = self._render_layer(frame.shape, lambda layer: (
+                self.draw_tracking_area(layer, tracking_area),
+                self.draw_instructions(layer)
+            ))
+        self._composite(frame, self._static_layer)
+    
+    def draw_mode_info(self, frame, current_mode):
+        """Composite the cached banner for the current mode"""
+        key = (current_mode, frame.shape)
+        layer = self._mode_layers.get(key)
+        if layer is None:
+            layer = self._render_layer(frame.shape, lambda layer: self.text(
+                layer, MODE_TEXT[current_mode], self.at(10, 30), 0.7, MODE_COLORS[current_mode], 2))
+            self._mode_layers[key] = layer
+        self._composite(frame, layer)
+    
+    def _render_layer(self, shape, draw):
+        """Render draw() into a list of (box, mask, colour) pieces.
+        
+        Drawing once on black and once on white recovers per-pixel coverage.
+        Pixels at least half covered go into the mask with their full colour,
+        which keeps compositing a plain masked copy.
+        """
+        black = np.zeros(shape, dtype=np.uint8)
+        white = np.full(shape, 255, dtype=np.uint8)
+        draw(black)
+        draw(white)
+        coverage = 255 - (white - black).max(axis=2)
+        mask = (coverage >= 128).astype(np.uint8)
+        color = np.minimum(black * (255.0 / np.maximum(coverage, 1))[..., None], 255).astype(np.uint8)
+        
+        return [((y0, y1, x0, x1), mask[y0:y1, x0:x1].copy(), color[y0:y1, x0:x1].copy())
+                for y0, y1, x0, x1 in self._boxes(mask)]
+    
+    def _boxes(self, mask, band_height=16, col_gap=32):
+        """Cover a mask with few tight boxes.
+        
+        The mask is cut into horizontal bands and each band into column runs;
+        adjacent bands whose runs overlap one to one are merged, so the sides
+        of the tracking rectangle become two thin boxes instead of one box
+        spanning the whole frame.
+        """
+        boxes = []
+        open_runs = []
+        for y0 in range(0, mask.shape[0], band_height):
+            y1 = min(y0 + band_height, mask.shape[0])
+            runs = self._runs(mask[y0:y1].any(axis=0), col_gap)
+            if open_runs and len(runs) == len(open_runs) and all(
+                    x0 < ox1 and ox0 < x1 for (x0, x1), (_, _, ox0, ox1) in zip(runs, open_runs)):
+                open_runs = [(oy0, y1, min(x0, ox0), max(x1, ox1))
+                             for (x0, x1), (oy0, _, ox0, ox1) in zip(runs, open_runs)]
+                continue
+            boxes.extend(open_runs)
+            open_runs = [(y0, y1, x0, x1) for x0, x1 in runs]
+        boxes.extend(open_runs)
+        
+        # Trim each box to the rows that are actually covered
+        tight = []
+        for y0, y1, x0, x1 in boxes:
+            rows = np.flatnonzero(mask[y0:y1, x0:x1].any(axis=1))
+            tight.append((y0 + rows[0], y0 + rows[-1] + 1, x0, x1))
+        return tight
+    
+    def _runs(self, flags, gap):
+        """(start, end) of True runs, merging runs separated by fewer than gap"""
+        indices = np.flatnonzero(flags)
+        if len(indices) == 0:
+            return []
+        breaks = np.flatnonzero(np.diff(indices) > gap)
+        starts = np.concatenate(([indices[0]], indices[breaks + 1]))
+        ends = np.concatenate((indices[breaks], [indices[-1]])) + 1
+        return list(zip(starts.tolist(), ends.tolist()))
+    
+    def _composite(self, frame, layer):
+        for (y0, y1, x0, x1), mask, color in layer:
+            cv2.copyTo(color, mask, frame[y0:y1, x0:x1])
+    
+    def draw_instructions(self, frame):
+        """Draw instruction text"""
+        height = frame.shape[0]
+        line = self.length(25)
+        self.text(frame, "M1 index: 1:1 cursor | M2 index+middle: scroll",
+                  (self.length(10), height - 3 * line), 0.5, (255, 255, 255), 2)
+        self.text(frame, "M3 pinky: fast cursor | Touch: click, hold, drag",
+                  (self.length(10), height - 2 * line), 0.5, (255, 255, 255), 2)
+        self.text(frame, "FAILSAFE: Move mouse to top-left",
+                  (self.length(10), height - line), 0.5, (255, 255, 255), 2)
+    
+    def draw_landmarks(self, frame, points):
+        """Draw a hand skeleton from a (21, 3) normalized landmark array"""
+        h, w = frame.shape[:2]
+        pixels = (points[:, :2] * (w, h)).astype(np.int32)
+        
+        segments = np.stack((pixels[_CONNECTION_STARTS], pixels[_CONNECTION_ENDS]), axis=1)
+        cv2.polylines(frame, list(segments), False, (255, 255, 255), self.length(2))
+        radius = self.length(4)
+        for x, y in pixels.tolist():
+            cv2.circle(frame, (x, y), radius, (0, 0, 255), -1)
+    
     def draw_tracking_area(self, frame, tracking_area):
         """Draw the tracking area boundaries on the frame"""
-        cv2.rectangle(frame, 
-                     (tracking_area['left'], tracking_area['top']),
-                     (tracking_area['right'], tracking_area['bottom']),
-                     (255, 255, 0), 2)  # Yellow border
-        
-        corner_size = 20
-        cv2.line(frame, (tracking_area['left'], tracking_area['top']),
-                (tracking_area['left'] + corner_size, tracking_area['top']), (0, 255, 255), 3)
-        cv2.line(frame, (tracking_area['left'], tracking_area['top']),
-                (tracking_area['left'], tracking_area['top'] + corner_size), (0, 255, 255), 3)
-        
-        cv2.line(frame, (tracking_area['right'], tracking_area['top']),
-                (tracking_area['right'] - corner_size, tracking_area['top']), (0, 255, 255), 3)
-        cv2.line(frame, (tracking_area['right'], tracking_area['top']),
-                (tracking_area['right'], tracking_area['top'] + corner_size), (0, 255, 255), 3)
-        
-        cv2.line(frame, (tracking_area['left'], tracking_area['bottom']),
-                (tracking_area['left'] + corner_size, tracking_area['bottom']), (0, 255, 255), 3)
-        cv2.line(frame, (tracking_area['left'], tracking_area['bottom']),
-                (tracking_area['left'], tracking_area['bottom'] - corner_size), (0, 255, 255), 3)
-        
-        cv2.line(frame, (tracking_area['right'], tracking_area['bottom']),
-                (tracking_area['right'] - corner_size, tracking_area['bottom']), (0, 255, 255), 3)
-        cv2.line(frame, (tracking_area['right'], tracking_area['bottom']),
-                (tracking_area['right'], tracking_area['bottom'] - corner_size), (0, 255, 255), 3)
-        
-        cv2.putText(frame, "TRACKING AREA", 
-                   (tracking_area['left'] + 10, tracking_area['top'] - 10),
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 0), 2)
\ No newline at end of file
+        left, top = self.point(tracking_area['left'], tracking_area['top'])
+        right, bottom = self.point(tracking_area['right'], tracking_area['bottom'])
+        cv2.rectangle(frame, (left, top), (right, bottom),
+                     (255, 255, 0), self.length(2))  # Yellow border
+        
+        corner_size = self.length(20)
+        corner_width = self.length(3)
+        cv2.line(frame, (left, top), (left + corner_size, top), (0, 255, 255), corner_width)
+        cv2.line(frame, (left, top), (left, top + corner_size), (0, 255, 255), corner_width)
+        
+        cv2.line(frame, (right, top), (right - corner_size, top), (0, 255, 255), corner_width)
+        cv2.line(frame, (right, top), (right, top + corner_size), (0, 255, 255), corner_width)
+        
+        cv2.line(frame, (left, bottom), (left + corner_size, bottom), (0, 255, 255), corner_width)
+        cv2.line(frame, (left, bottom), (left, bottom - corner_size), (0, 255, 255), corner_width)
+        
+        cv2.line(frame, (right, bottom), (right - corner_size, bottom), (0, 255, 255), corner_width)
+        cv2.line(frame, (right, bottom), (right, bottom - corner_size), (0, 255, 255), corner_width)
+        
+        self.text(frame, "TRACKING AREA", (left + self.length(10), top - self.length(10)),
+                  0.6, (255, 255, 0), 2)
\ No newline at end of file